@@ -1,23 +1,93 @@
 """
 Initialization of the package.
+
+The package import is kept light, so it doesn't slow down the application startup. The submodules (`extension`,
+`distribution`, ...) are imported on the first attribute access, see `__getattr__`. The distributions are registered
+into Replicator as stubs which import `distribution` on their first call.
 """
 import importlib as _importlib
+import typing as _typing
 import omni.replicator.core as _rep
-from .extension import ArDaGenExt  # noqa: F401 (Needed for the package import)
-from .ogn import *  # noqa: F401, F403 (Needed for the package import)
-from .distribution import __all__ as _distribution_all
 
+# Names of `distribution.__all__`. They are listed here, so the stubs are registered without importing the module.
+_DISTRIBUTION_NAMES = ("shuffle", "shuffle_many", "shuffle_aligned", "shuffle_from_file")
+# Lazily imported members of the package by the name of the module which defines them.
+_LAZY_MEMBERS = {"ArDaGenExt": "extension", **{name: "distribution" for name in _DISTRIBUTION_NAMES}}
 
-def _register_replicator_distributions() -> None:
+
+def __getattr__(name: str) -> _typing.Any:
     """
-    Registers all ArDaGen Extension custom distribution functions into Replicator.
+    Imports the submodules and the lazy members on the first access.
+
+    Args:
+        name (str): Attribute name.
+
+    Raises:
+        AttributeError: Raised if the package has no such submodule or member.
+
+    Returns:
+        Any: Submodule or member of the package.
     """
+    module_name = _LAZY_MEMBERS.get(name)
+    if module_name is not None:
+        return getattr(_import_submodule(module_name), name)
+    try:
+        return _import_submodule(name)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-    ext_dist_module = _importlib.import_module(".distribution", package=__name__)
 
-    for dist_func_name in _distribution_all:
-        dist_func = getattr(ext_dist_module, dist_func_name)
-        _rep.distribution.register(dist_func)
+def __dir__() -> _typing.List[str]:
+    """
+    Lists also `ArDaGenExt`, so Kit finds it when it looks up the `omni.ext.IExt` classes. The distributions are left
+    out, so the scans getting every listed attribute don't import `distribution` and install its dependencies.
+
+    Returns:
+        List[str]: Attribute names of the package.
+    """
+    return sorted(set(globals()) | {"ArDaGenExt"})
+
+
+def _import_submodule(name: str) -> _typing.Any:
+    """
+    Args:
+        name (str): Submodule name.
+
+    Returns:
+        Any (ModuleType): Imported submodule.
+    """
+    return _importlib.import_module(f".{name}", package=__name__)
+
+
+def _distribution_stub(name: str) -> _typing.Callable[..., _typing.Any]:
+    """
+    Creates a stub of a distribution function which imports `distribution` on the first call and forwards to the
+    implementation.
+
+    Args:
+        name (str): Name of the distribution function.
+
+    Returns:
+        Callable[..., Any]: Distribution stub.
+    """
+
+    def stub(*args: _typing.Any, **kwargs: _typing.Any) -> _typing.Any:
+        return getattr(_import_submodule("distribution"), name)(*args, **kwargs)
+
+    stub.__name__ = stub.__qualname__ = name
+    stub.__module__ = f"{__name__}.distribution"
+    stub.__doc__ = f"Stub of `{__name__}.distribution.{name}`, see its documentation."
+    return stub
+
+
+def _register_replicator_distributions() -> None:
+    """
+    Registers all ArDaGen Extension custom distribution functions into Replicator.
+    """
+    for dist_func_name in _DISTRIBUTION_NAMES:
+        _rep.distribution.register(_distribution_stub(dist_func_name))
 
 
 _register_replicator_distributions()
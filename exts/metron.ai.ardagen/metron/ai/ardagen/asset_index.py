@@ -0,0 +1,346 @@
+"""
+Implements the cached asset directory index feeding the file-backed shuffle distribution.
+
+The index of a directory tree is stored in an index directory:
+    `index.json`: Manifest with the indexed root and the asset suffixes.
+    `directories.npz`: Indexed directories with their (mtime, size) signatures, parents and asset ranges.
+    `assets.<generation>.txt`: Token file of the asset paths (see `choices_file`), it is passed to
+        `distribution.shuffle_from_file`. Every store writes a new generation, so the files mapped by the running nodes
+        are never replaced, which would fail on Windows. The previous generations are removed once they are unmapped.
+
+Adding, removing or renaming an entry changes the mtime and size of its directory, so a refresh stats only the
+directories and lists only the changed ones. An up-to-date index is not rewritten at all. In-place modifications of the
+asset files don't change the asset list, so they are not tracked.
+"""
+import json
+import os
+import typing
+import numpy as np
+from .choices_file import ChoicesFile, write_token_file
+
+MANIFEST_FILE_NAME = "index.json"
+DIRECTORIES_FILE_NAME = "directories.npz"
+ASSETS_FILE_PREFIX = "assets."
+ASSETS_FILE_SUFFIX = ".txt"
+INDEX_VERSION = 2
+
+
+class _Directory(typing.NamedTuple):
+    """
+    Listing of an indexed directory.
+    """
+
+    path: str
+    parent: int
+    signature: typing.Tuple[int, int]
+    # Asset paths of a listed directory, None if the directory is unchanged and its assets are kept from the index.
+    assets: typing.Optional[typing.List[str]]
+    stored_range: typing.Tuple[int, int]
+
+
+class AssetIndex:  # pylint: disable=too-many-instance-attributes
+    """
+    Incrementally refreshed index of the asset files of a directory tree.
+    """
+
+    def __init__(self, root: str, index_dir: str, suffixes: typing.Optional[typing.Sequence[str]] = None) -> None:
+        """
+        Loads the stored index, the directory tree is not touched until `refresh`.
+
+        Args:
+            root (str): Root directory of the assets.
+            index_dir (str): Directory the index is stored in.
+            suffixes (Optional[Sequence[str]]): Case-insensitive suffixes of the indexed files, e.g.
+                `(".usd", ".usda")`. All files are indexed if None.
+        """
+        self.root = os.path.abspath(root)
+        self.index_dir = index_dir
+        self.suffixes = tuple(sorted(suffix.lower() for suffix in suffixes)) if suffixes is not None else None
+        self.generation = 0
+        self._directories: typing.Dict[str, typing.Tuple[int, typing.Tuple[int, int], int, int]] = {}
+        self._children: typing.Dict[int, typing.List[int]] = {}
+        self._paths: typing.List[str] = []
+        self._num_assets = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return self._num_assets
+
+    @property
+    def assets_path(self) -> str:
+        """
+        Returns:
+            str: Path of the asset token file of the current generation.
+        """
+        return _assets_path(self.index_dir, self.generation)
+
+    def refresh(self) -> bool:
+        """
+        Brings the index up to date with the directory tree. Only the directories with a changed signature are listed.
+
+        Raises:
+            FileNotFoundError: Raised if the root directory doesn't exist.
+
+        Returns:
+            bool: True if the index was changed and stored again.
+        """
+        if not os.path.isdir(self.root):
+            raise FileNotFoundError(f"Asset root {self.root} is not a directory.")
+
+        listing: typing.List[_Directory] = []
+        is_changed = False
+        pending = [(self.root, -1)]
+        while pending:
+            path, parent = pending.pop()
+            signature = _signature(path)
+            if signature is None:
+                # The directory was removed during the walk.
+                is_changed = True
+                continue
+            stored = self._directories.get(path)
+            if stored is not None and stored[1] == signature:
+                stored_idx, _, start, stop = stored
+                subdirs = [self._paths[child_idx] for child_idx in self._children.get(stored_idx, [])]
+                listing.append(_Directory(path, parent, signature, None, (start, stop)))
+            else:
+                is_changed = True
+                subdirs, assets = self._list_directory(path)
+                listing.append(_Directory(path, parent, signature, assets, (0, 0)))
+            pending.extend((subdir, len(listing) - 1) for subdir in reversed(subdirs))
+
+        if is_changed or len(listing) != len(self._directories):
+            self._store(listing)
+            return True
+        return False
+
+    def _list_directory(self, path: str) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Lists a changed directory.
+
+        Args:
+            path (str): Path of the directory.
+
+        Returns:
+            Tuple[List[str], List[str]]: Sorted subdirectory paths and sorted asset paths.
+        """
+        subdirs: typing.List[str] = []
+        assets: typing.List[str] = []
+        try:
+            entries = list(os.scandir(path))
+        except FileNotFoundError:
+            return subdirs, assets
+        for entry in sorted(entries, key=lambda entry: entry.name):
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif self.suffixes is None or entry.name.lower().endswith(self.suffixes):
+                assets.append(entry.path)
+        return subdirs, assets
+
+    def _load(self) -> None:
+        """
+        Loads the stored index. Missing, outdated or differently configured indexes are treated as empty.
+        """
+        manifest_path = os.path.join(self.index_dir, MANIFEST_FILE_NAME)
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (FileNotFoundError, ValueError):
+            return
+        suffixes = tuple(manifest["suffixes"]) if manifest.get("suffixes") is not None else None
+        if manifest.get("version") != INDEX_VERSION or manifest.get("root") != self.root or suffixes != self.suffixes:
+            return
+
+        with np.load(os.path.join(self.index_dir, DIRECTORIES_FILE_NAME)) as directories:
+            self._paths = directories["paths"].tolist()
+            parents = directories["parents"].tolist()
+            signatures = directories["signatures"].tolist()
+            offsets = directories["offsets"].tolist()
+        for dir_idx, (path, parent, signature) in enumerate(zip(self._paths, parents, signatures)):
+            self._directories[path] = (dir_idx, tuple(signature), offsets[dir_idx], offsets[dir_idx + 1])
+            self._children.setdefault(parent, []).append(dir_idx)
+        self._num_assets = manifest["num_assets"]
+        self.generation = manifest["generation"]
+
+    def _store(self, listing: typing.List[_Directory]) -> None:
+        """
+        Writes the index. The assets are written into the file of the next generation and the other files are replaced
+        atomically, so the asset files mapped by the running nodes stay valid.
+
+        Args:
+            listing (List[_Directory]): Directories in the walk order. The assets of the unchanged directories are read
+                from the stored asset file.
+        """
+        os.makedirs(self.index_dir, exist_ok=True)
+        stored_assets = ChoicesFile(self.assets_path).data if self._num_assets > 0 else None
+        # The kept assets are copied as the encoded records of the stored file, only the listed ones are encoded.
+        chunks: typing.List[np.ndarray] = []
+        for directory in listing:
+            if directory.assets is not None:
+                chunks.append(np.array([asset.encode("utf-8") for asset in directory.assets], dtype=np.bytes_))
+            elif stored_assets is not None:
+                chunks.append(np.asarray(stored_assets[slice(*directory.stored_range)]))
+            else:
+                chunks.append(np.empty(0, dtype=np.bytes_))
+        offsets = np.cumsum([0] + [len(chunk) for chunk in chunks], dtype=np.int64)
+        assets = np.concatenate(chunks)
+        # The chunks of the kept assets are views of the stored file, it is unmapped before it is removed.
+        del chunks, stored_assets
+
+        # An index which was not loaded doesn't know the generations of the stored files, so they are listed.
+        generation = max([self.generation] + list(_stored_generations(self.index_dir))) + 1
+        _replace(_assets_path(self.index_dir, generation), lambda path: _write_assets(path, assets))
+        _replace(
+            os.path.join(self.index_dir, DIRECTORIES_FILE_NAME),
+            lambda path: _write_directories(path, listing, offsets),
+        )
+        manifest = {
+            "version": INDEX_VERSION,
+            "root": self.root,
+            "suffixes": list(self.suffixes) if self.suffixes is not None else None,
+            "num_assets": len(assets),
+            "generation": generation,
+        }
+        _replace(os.path.join(self.index_dir, MANIFEST_FILE_NAME), lambda path: _write_manifest(path, manifest))
+        self.generation = generation
+        _remove_stale_assets(self.index_dir, generation)
+
+        self._directories.clear()
+        self._children.clear()
+        self._paths = [directory.path for directory in listing]
+        for dir_idx, directory in enumerate(listing):
+            self._directories[directory.path] = (
+                dir_idx,
+                directory.signature,
+                int(offsets[dir_idx]),
+                int(offsets[dir_idx + 1]),
+            )
+            self._children.setdefault(directory.parent, []).append(dir_idx)
+        self._num_assets = len(assets)
+
+
+def index_assets(root: str, index_dir: str, suffixes: typing.Optional[typing.Sequence[str]] = None) -> str:
+    """
+    Refreshes the asset index of the directory tree, see `AssetIndex`.
+
+    Args:
+        root (str): Root directory of the assets.
+        index_dir (str): Directory the index is stored in.
+        suffixes (Optional[Sequence[str]]): Suffixes of the indexed files. All files are indexed if None.
+
+    Returns:
+        str: Path of the asset token file, which can be passed to `distribution.shuffle_from_file`.
+    """
+    asset_index = AssetIndex(root, index_dir, suffixes)
+    asset_index.refresh()
+    return asset_index.assets_path
+
+
+def _signature(path: str) -> typing.Optional[typing.Tuple[int, int]]:
+    """
+    Args:
+        path (str): Path of a directory.
+
+    Returns:
+        Optional[Tuple[int, int]]: Modification time in nanoseconds and size of the directory, None if it doesn't exist.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _assets_path(index_dir: str, generation: int) -> str:
+    """
+    Args:
+        index_dir (str): Directory the index is stored in.
+        generation (int): Generation of the index.
+
+    Returns:
+        str: Path of the asset token file of the generation.
+    """
+    return os.path.join(index_dir, f"{ASSETS_FILE_PREFIX}{generation}{ASSETS_FILE_SUFFIX}")
+
+
+def _stored_generations(index_dir: str) -> typing.Iterator[int]:
+    """
+    Args:
+        index_dir (str): Directory the index is stored in.
+
+    Yields:
+        int: Generation of every asset file in the index directory.
+    """
+    for name in os.listdir(index_dir):
+        generation = name[len(ASSETS_FILE_PREFIX) : -len(ASSETS_FILE_SUFFIX)]
+        if name.startswith(ASSETS_FILE_PREFIX) and name.endswith(ASSETS_FILE_SUFFIX) and generation.isdigit():
+            yield int(generation)
+
+
+def _remove_stale_assets(index_dir: str, generation: int) -> None:
+    """
+    Removes the asset files of the other generations. The files which can't be removed, e.g. because they are still
+    mapped on Windows, are left for the next store.
+
+    Args:
+        index_dir (str): Directory the index is stored in.
+        generation (int): Current generation of the index.
+    """
+    for stale_generation in list(_stored_generations(index_dir)):
+        if stale_generation != generation:
+            try:
+                os.remove(_assets_path(index_dir, stale_generation))
+            except OSError:
+                pass
+
+
+def _replace(path: str, write: typing.Callable[[str], None]) -> None:
+    """
+    Writes a file into a temporary file which then replaces the file.
+
+    Args:
+        path (str): Path of the file.
+        write (Callable[[str], None]): Function writing the file of the given path.
+    """
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _write_assets(path: str, assets: np.ndarray) -> None:
+    """
+    Args:
+        path (str): Path of the token file.
+        assets (np.ndarray): UTF-8 encoded asset paths.
+    """
+    if len(assets) > 0:
+        write_token_file(path, assets)
+    else:
+        open(path, "wb").close()  # pylint: disable=consider-using-with
+
+
+def _write_manifest(path: str, manifest: typing.Dict[str, typing.Any]) -> None:
+    """
+    Args:
+        path (str): Path of the manifest.
+        manifest (Dict[str, Any]): Manifest of the index.
+    """
+    with open(path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+
+
+def _write_directories(path: str, listing: typing.List[_Directory], offsets: np.ndarray) -> None:
+    """
+    Args:
+        path (str): Path of the `.npz` file.
+        listing (List[_Directory]): Directories in the walk order.
+        offsets (np.ndarray): Start of the assets of every directory in the asset file, followed by the number of
+            assets.
+    """
+    with open(path, "wb") as directories_file:
+        np.savez(
+            directories_file,
+            paths=np.array([directory.path for directory in listing], dtype=np.str_),
+            parents=np.array([directory.parent for directory in listing], dtype=np.int64),
+            signatures=np.array([directory.signature for directory in listing], dtype=np.int64).reshape(-1, 2),
+            offsets=offsets,
+        )
@@ -0,0 +1,113 @@
+"""
+Implements the graph-wide batched evaluation of the SampleShuffle nodes in the random keys mode.
+
+The nodes with `inputs:randomKeys` register their database on compute. Before a frame is evaluated, the batch evaluator
+collects the registered nodes, groups them by the number of the choices and draws the permutations of every group by a
+single `random_key_permutations` sort. The samples of a group are gathered by one indexing of the stacked choices and
+scattered to the node outputs, the following compute of a batched node only acknowledges them. Every node draws the
+same keys from its own substream as its compute would, so the outputs don't depend on whether the batch evaluator ran.
+
+The batch runs before the frame's graph evaluation and it reuses the simple inputs prefetched by the previous compute
+of every node. Each node records the inputs its batch was drawn for and the generator state before the draw. If the
+inputs differ when the node computes, the node restores the generator state and computes its outputs as usual, so the
+changes of the inputs apply in the same frame.
+"""
+import typing
+import numpy as np
+from metron.ai.ardagen.permutation import random_key_permutations
+
+
+class ShuffleBatchEvaluator:
+    """
+    Batched SampleShuffle nodes keyed by the node path.
+    """
+
+    def __init__(self) -> None:
+        self._databases: typing.Dict[str, typing.Any] = {}
+
+    def add(self, database: typing.Any) -> None:
+        """
+        Registers a node for the batched evaluation.
+
+        Args:
+            database (Any): Database of the node.
+        """
+        self._databases[database.node.get_prim_path()] = database
+
+    def remove(self, node_path: str) -> None:
+        """
+        Unregisters a released node.
+
+        Args:
+            node_path (str): Path of the node.
+        """
+        self._databases.pop(node_path, None)
+
+    def evaluate(self) -> int:
+        """
+        Evaluates the registered nodes due in the frame. Nodes whose previous batched outputs were not consumed by a
+        compute yet are not due, so every node advances its substream once per its own evaluation.
+
+        Returns:
+            int: Number of the evaluated nodes.
+        """
+        groups: typing.Dict[int, typing.List[typing.Tuple[typing.Any, typing.Any, np.ndarray]]] = {}
+        for node_path, database in list(self._databases.items()):
+            if not database.node.is_valid():
+                del self._databases[node_path]
+                continue
+            state = database.internal_state
+            if state.batched:
+                continue
+            choices = type(database).NODE_TYPE_CLASS.batch_choices(database, state)
+            if choices is not None:
+                groups.setdefault(len(choices), []).append((database, state, choices))
+
+        for length, members in groups.items():
+            _evaluate_group(length, members)
+        return sum(len(members) for members in groups.values())
+
+    def clear(self) -> None:
+        """
+        Unregisters all nodes.
+        """
+        self._databases.clear()
+
+    def __len__(self) -> int:
+        return len(self._databases)
+
+
+def _evaluate_group(length: int, members: typing.List[typing.Tuple[typing.Any, typing.Any, np.ndarray]]) -> None:
+    """
+    Evaluates the nodes with the same number of the choices.
+
+    Args:
+        length (int): Number of the choices.
+        members (List[Tuple[Any, Any, np.ndarray]]): Database, internal state and choices of every node.
+    """
+    states = [state for _, state, _ in members]
+    for state in states:
+        # The draws must not run ahead of buffered permutations.
+        state.permutations.rewind(state.rng.generator)
+        state.batch_generator_state = state.rng.generator.bit_generator.state
+    permutations = random_key_permutations([state.rng.generator for state in states], length)
+
+    choices = [node_choices for _, _, node_choices in members]
+    first = choices[0]
+    samples: typing.Sequence[np.ndarray]
+    if all(node_choices.dtype == first.dtype and node_choices.shape == first.shape for node_choices in choices):
+        # The rows index the concatenated choices, so the whole group is gathered by a single take.
+        offsets = np.arange(0, len(choices) * length, length, dtype=np.intp)
+        samples = np.take(np.concatenate(choices), permutations + offsets[:, np.newaxis], axis=0)
+    else:
+        samples = [
+            np.take(node_choices, permutation, axis=0) for node_choices, permutation in zip(choices, permutations)
+        ]
+
+    for (database, state, _), node_samples in zip(members, samples):
+        type(database).NODE_TYPE_CLASS.batch_samples(database, node_samples)
+        state.batched = True
+
+
+# Batch evaluator shared by the nodes of the extension.
+BATCH_EVALUATOR = ShuffleBatchEvaluator()
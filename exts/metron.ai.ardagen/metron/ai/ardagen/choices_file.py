@@ -0,0 +1,131 @@
+"""
+Implements memory-mapped file-backed choices of the shuffling node.
+
+Supported files:
+    `.npy`: NumPy array of numbers, bools or fixed-width strings. Tuple valued elements are stored along the second
+        axis.
+    Token file (any other suffix): UTF-8 tokens, one per line, right-padded with spaces so that every line has the same
+        length. It is written by `write_token_file`.
+
+The files are memory-mapped, so only the pages of the sampled elements are read and strings are created only for the
+elements which are output.
+"""
+import os
+import typing
+import numpy as np
+from .permutation import OutputBuffers
+from .utils import get_data_type
+
+NPY_SUFFIX = ".npy"
+_TOKEN_PADDING = b" "
+
+
+def write_token_file(path: str, tokens: typing.Union[typing.Iterable[str], np.ndarray]) -> None:
+    """
+    Writes tokens into a fixed-width token file.
+
+    Args:
+        path (str): Path of the token file.
+        tokens (Union[Iterable[str], np.ndarray]): Tokens, they must not contain new lines or end with spaces. Bytes
+            arrays, e.g. the `data` of another token file, are written without decoding.
+
+    Raises:
+        ValueError: Raised if there are no tokens.
+    """
+    if isinstance(tokens, np.ndarray) and tokens.dtype.kind == "S":
+        encoded = tokens
+    else:
+        encoded = np.array([token.encode("utf-8") for token in tokens], dtype=np.bytes_)
+    if len(encoded) == 0:
+        raise ValueError("At least one token has to be provided.")
+    width = encoded.dtype.itemsize
+    records = np.empty(len(encoded), dtype=_record_dtype(width + 1))
+    records["token"] = np.char.ljust(encoded, width, fillchar=_TOKEN_PADDING)
+    records["newline"] = b"\n"
+    records.tofile(path)
+
+
+def _record_dtype(record_width: int) -> np.dtype:
+    """
+    Args:
+        record_width (int): Length of a line of the token file including the new line.
+
+    Returns:
+        np.dtype: Structured dtype of a line of the token file.
+    """
+    return np.dtype([("token", f"S{record_width - 1}"), ("newline", "S1")])
+
+
+class ChoicesFile:
+    """
+    Memory-mapped choices file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Maps the file.
+
+        Args:
+            path (str): Path of the `.npy` or token file.
+
+        Raises:
+            ValueError: Raised if the file is empty or it is not a valid token file.
+        """
+        self.path = path
+        if path.endswith(NPY_SUFFIX):
+            self.data: np.ndarray = np.load(path, mmap_mode="r")
+        else:
+            with open(path, "rb") as token_file:
+                first_line = token_file.readline()
+            record_width = len(first_line)
+            if record_width < 2 or not first_line.endswith(b"\n") or os.path.getsize(path) % record_width != 0:
+                raise ValueError(f"{path} is not a token file with lines of the same length.")
+            self.data = np.memmap(path, dtype=_record_dtype(record_width), mode="r")["token"]
+        if len(self.data) == 0:
+            raise ValueError(f"Choices file {path} is empty.")
+        self.is_token = self.data.dtype.kind in ("S", "U")
+        self.data_type = get_data_type(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def element(self, index: int) -> typing.Any:
+        """
+        Materializes a single element.
+
+        Args:
+            index (int): Index of the element.
+
+        Returns:
+            Any: String of a token file or a string array, otherwise the array element.
+        """
+        value = self.data[index]
+        return _decode(value) if self.is_token else np.asarray(value)
+
+    def gather(self, permutation: np.ndarray, buffers: OutputBuffers) -> np.ndarray:
+        """
+        Materializes the elements in the order given by the permutation.
+
+        Args:
+            permutation (np.ndarray): Indices of the elements.
+            buffers (OutputBuffers): Reused output arrays of the node, used for the non-string data.
+
+        Returns:
+            np.ndarray: Gathered elements, strings are returned as an object array.
+        """
+        if not self.is_token:
+            return buffers.gather(self.data, permutation)
+        return np.array([_decode(value) for value in self.data[permutation]], dtype=object)
+
+
+def _decode(value: typing.Any) -> str:
+    """
+    Args:
+        value (Any): Padded bytes of a token file or a NumPy string.
+
+    Returns:
+        str: Token.
+    """
+    if isinstance(value, bytes):
+        return value.rstrip(_TOKEN_PADDING).decode("utf-8")
+    return str(value)
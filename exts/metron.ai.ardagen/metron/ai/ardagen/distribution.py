@@ -2,48 +2,580 @@
 Provides an extension of the OV Replicator distribution functions.
 """
 
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pxr import Sdf
-from .metron_shared import param_validators as param_val
-from .utils import get_data_type
+from .validation import ensure_typeguard
 
+# The `metron_shared` parameter validators need typeguard, so it is checked before they are imported. The check runs
+# for the direct imports of the module too, not only for the package's lazy access.
+ensure_typeguard()
 
-def shuffle(  # pylint: disable=unused-argument
+# pylint: disable=wrong-import-position
+from .choices_file import ChoicesFile  # noqa: E402
+from .metron_shared import param_validators as param_val  # noqa: E402
+from .node_cache import ARRAY_NODE_CACHE, content_key, resolve_dedup  # noqa: E402
+from .path_table import PATH_TABLE  # noqa: E402
+from .permutation import check_weights  # noqa: E402
+from .validation import infer_choices_data_type, resolve_validation_level  # noqa: E402
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+SHUFFLE_ALIGNED_NODE_TYPE = "metron.ai.ardagen.SampleShuffleAligned"
+ARRAY_NODE_TYPE = "omni.replicator.core.OgnArray"
+
+
+def shuffle(  # pylint: disable=unused-argument, too-many-arguments, too-many-locals
     choices: List[str],
     seed: Optional[int] = -1,
     name: Optional[str] = None,
+    index_mode: bool = False,
+    batch_size: int = 1,
+    num_samples: Optional[int] = None,
+    random_access: bool = False,
+    schedule_file: Optional[str] = None,
+    epoch_mode: bool = False,
+    validation: Optional[str] = None,
+    dedup: Optional[bool] = None,
+    path_handles: bool = False,
+    token_ids: bool = False,
+    group_size: int = 0,
+    group_keys: Optional[List[int]] = None,
+    weights: Optional[List[float]] = None,
+    prefetch_frames: int = 0,
 ) -> Any:
     """
-    Reshufles the list of items into a new permutation.
+    Reshufles the list of items into a new permutation. If `num_samples` is set, only the first `num_samples` elements
+    of the permutation are drawn and output.
 
     Args:
         choices (List[Any]): Values in the distribution to choose from.
         seed (Optional[int]): A seed to use for the sampling.
+        index_mode (bool): If True, the node shuffles indices into `outputs:permutation` and gathers the choices into
+            `outputs:samples` only when the samples are consumed by a connected node.
+        batch_size (int): Number of the permutations the node precomputes at once. It doesn't change the output
+            sequence.
+        num_samples (Optional[int]): Number of the elements sampled without replacement. All elements are permuted if
+            None.
+        random_access (bool): If True, every frame's permutation is derived from the seed, the node id and the frame
+            index (`inputs:frame`, or the node evaluation counter), so any frame can be regenerated directly.
+        schedule_file (Optional[str]): Path of a schedule manifest planned by `metron.ai.ardagen.schedule`. If set, the
+            frame permutations are read from the schedule instead of being generated.
+        epoch_mode (bool): If True, the node outputs one element per evaluation into `outputs:element` (with
+            `outputs:elementIndex` and `outputs:epoch`), visiting every choice once in random order before the choices
+            are shuffled again. The other sampling parameters are ignored.
+        validation (Optional[str]): Validation level of the parameters (`full`, `sampled`, `first_element` or
+            `off`), see `metron.ai.ardagen.validation`. The extension-wide level is used if None.
+        dedup (Optional[bool]): If True, an existing array node of the graph with the same data type and content is
+            reused instead of creating a new one. The extension-wide default is used if None.
+        path_handles (bool): If True, the choices (`Sdf.Path` objects or path strings) are interned into
+            `path_table.PATH_TABLE` and the node shuffles their `uint64` handles. The samples are resolved back by
+            `PATH_TABLE.resolve`.
+        token_ids (bool): If True, token choices are interned into `PATH_TABLE` and the array node holds their `uint64`
+            ids, so the node reads, shuffles and gathers integers and resolves only the samples it outputs into the
+            interned strings. The samples are tokens as without it. The ids are valid only in the running process, so
+            they are written into Fabric only and the array node is empty in the saved stage.
+        group_size (int): If at least 2, the node shuffles the order of the contiguous groups of `group_size` choices
+            and the order within every group, so consecutive samples reuse the loaded assets. Larger groups trade
+            randomness for the reuse, see `metron.ai.ardagen.locality` for the working set report.
+        group_keys (Optional[List[int]]): Group key of every choice (e.g. an asset id) for the block shuffle. The
+            choices with the same key stay adjacent. It takes precedence over `group_size`.
+        weights (Optional[List[float]]): Non-negative weight of every choice. The node outputs the choices in a weighted
+            random order (Efraimidis-Spirakis key sort), so with `num_samples` it draws a weighted sample without
+            replacement. It replaces repeating the choices and takes precedence over the block shuffle.
+        prefetch_frames (int): Number of the upcoming evaluations whose samples (asset file paths) are read ahead by
+            `metron.ai.ardagen.prefetch.ASSET_PREFETCHER`. For full permutations it is the number of the upcoming
+            samples. The node knows them from the seed, so the output sequence doesn't change. Values less than 1
+            disable the prefetch.
+
+    Raises:
+        ValueError: Raised if `path_handles` is set and the choices are not paths, if the number of the group keys
+            doesn't match the number of the choices, or if the weights are not valid, see `permutation.check_weights`.
 
     Returns:
         Any (og.Node): Created OmniGraph Node. Datatype can't be put in explicitly, because of the OV limitations.
     """
-    param_val.check_type(choices, List[Any])
-    param_val.check_type(seed, Optional[int])
+    param_val.check_type(validation, Optional[str])
+    validation_level = resolve_validation_level(validation)
+    if validation_level != "off":
+        # Elements are checked by the data type inference, so only the container type is checked here.
+        param_val.check_type(choices, list)
+        param_val.check_type(seed, Optional[int])
+        param_val.check_type(index_mode, bool)
+        param_val.check_type(batch_size, int)
+        param_val.check_type(num_samples, Optional[int])
+        param_val.check_type(random_access, bool)
+        param_val.check_type(schedule_file, Optional[str])
+        param_val.check_type(epoch_mode, bool)
+        param_val.check_type(dedup, Optional[bool])
+        param_val.check_type(path_handles, bool)
+        param_val.check_type(token_ids, bool)
+        param_val.check_type(group_size, int)
+        param_val.check_type(group_keys, Optional[List[int]])
+        param_val.check_type(weights, Optional[List[float]])
+        param_val.check_type(prefetch_frames, int)
+    if group_keys and len(group_keys) != len(choices):
+        raise ValueError("Number of the group keys has to match the number of the choices.")
+    if weights is not None:
+        check_weights(weights, len(choices))
+
+    import omni.replicator.core as rep  # pylint: disable=import-outside-toplevel
+
+    choices, data_type = _prepare_choices(choices, validation_level, path_handles)
+    choices, data_type, use_token_ids = _intern_tokens(choices, data_type, token_ids)
+    node_inputs = _shuffle_node_inputs(
+        index_mode,
+        batch_size,
+        num_samples,
+        random_access,
+        schedule_file,
+        epoch_mode,
+        group_size,
+        group_keys,
+        weights,
+        prefetch_frames,
+    )
+    reshufle_node = rep.utils.create_node(SHUFFLE_NODE_TYPE, seed=seed, tokenIds=use_token_ids, **node_inputs)
+
+    array_node = _array_node(reshufle_node.get_graph(), choices, data_type, resolve_dedup(dedup), use_token_ids)
+    array_node.get_attribute("inputs:array").connect(reshufle_node.get_attribute("inputs:choices"), True)
+
+    return reshufle_node
+
+
+def shuffle_from_file(  # pylint: disable=unused-argument, too-many-arguments, too-many-locals
+    path: str,
+    seed: Optional[int] = -1,
+    name: Optional[str] = None,
+    index_mode: bool = False,
+    batch_size: int = 1,
+    num_samples: Optional[int] = None,
+    random_access: bool = False,
+    epoch_mode: bool = False,
+    validation: Optional[str] = None,
+    group_size: int = 0,
+    group_keys: Optional[List[int]] = None,
+    weights: Optional[List[float]] = None,
+    prefetch_frames: int = 0,
+) -> Any:
+    """
+    Reshuffles the items of a `.npy` or fixed-width token file, see `metron.ai.ardagen.choices_file`. Unlike `shuffle`,
+    the items are not put into the stage. The node memory-maps the file, permutes the indices and materializes only the
+    output elements.
+
+    Args:
+        path (str): Path of the choices file.
+        seed (Optional[int]): A seed to use for the sampling.
+        index_mode (bool): See `shuffle`.
+        batch_size (int): See `shuffle`.
+        num_samples (Optional[int]): See `shuffle`.
+        random_access (bool): See `shuffle`.
+        epoch_mode (bool): See `shuffle`.
+        validation (Optional[str]): See `shuffle`.
+        group_size (int): See `shuffle`.
+        group_keys (Optional[List[int]]): See `shuffle`.
+        weights (Optional[List[float]]): See `shuffle`.
+        prefetch_frames (int): See `shuffle`.
+
+    Raises:
+        ValueError: Raised if the weights are not valid for the items of the file, see `permutation.check_weights`.
+
+    Returns:
+        Any (og.Node): Created OmniGraph Node.
+    """
+    param_val.check_type(validation, Optional[str])
+    if resolve_validation_level(validation) != "off":
+        param_val.check_type(path, str)
+        param_val.check_type(seed, Optional[int])
+        param_val.check_type(index_mode, bool)
+        param_val.check_type(batch_size, int)
+        param_val.check_type(num_samples, Optional[int])
+        param_val.check_type(random_access, bool)
+        param_val.check_type(epoch_mode, bool)
+        param_val.check_type(group_size, int)
+        param_val.check_type(group_keys, Optional[List[int]])
+        param_val.check_type(weights, Optional[List[float]])
+        param_val.check_type(prefetch_frames, int)
+
+    import omni.graph.core as og  # pylint: disable=import-outside-toplevel
+    import omni.replicator.core as rep  # pylint: disable=import-outside-toplevel
+
+    # Maps the file once to fail early on invalid files and to get the data type the node attributes are resolved to
+    # and the number of the items the weights are checked against.
+    choices_file = ChoicesFile(path)
+    data_type = choices_file.data_type
+    if weights is not None:
+        check_weights(weights, len(choices_file))
+    node_inputs = _shuffle_node_inputs(
+        index_mode,
+        batch_size,
+        num_samples,
+        random_access,
+        None,
+        epoch_mode,
+        group_size,
+        group_keys,
+        weights,
+        prefetch_frames,
+    )
+    reshufle_node = rep.utils.create_node(SHUFFLE_NODE_TYPE, seed=seed, choicesFile=path, **node_inputs)
+
+    # There is no upstream array node, so the extended attributes are resolved here instead of the connected callback.
+    array_type = og.AttributeType.type_from_ogn_type_name(f"{data_type}[]")
+    reshufle_node.get_attribute("inputs:choices").set_resolved_type(array_type)
+    og.AttributeValueHelper(reshufle_node.get_attribute("outputs:samples")).resolve_type(array_type)
+    element_type = og.AttributeType.type_from_ogn_type_name(data_type)
+    og.AttributeValueHelper(reshufle_node.get_attribute("outputs:element")).resolve_type(element_type)
+
+    return reshufle_node
+
+
+def shuffle_aligned(  # pylint: disable=unused-argument, too-many-locals
+    choices_arrays: List[List[Any]],
+    seed: Optional[int] = -1,
+    name: Optional[str] = None,
+    validation: Optional[str] = None,
+    dedup: Optional[bool] = None,
+) -> Any:
+    """
+    Reshuffles several parallel lists of items with one permutation, so the elements with the same index stay
+    together (e.g. an asset path with its scale and label). The lists can be of different data types. The samples of
+    the first list are output in `outputs:samples`, the samples of the list `k` in `outputs:samples_<k>`. The first list
+    is sampled like by `shuffle` with the same seed.
+
+    Args:
+        choices_arrays (List[List[Any]]): Aligned lists of the values to choose from.
+        seed (Optional[int]): A seed to use for the sampling.
+        validation (Optional[str]): See `shuffle`.
+        dedup (Optional[bool]): See `shuffle`.
+
+    Raises:
+        ValueError: Raised if there are no lists or the lists are not of the same length.
+
+    Returns:
+        Any (og.Node): Created OmniGraph Node.
+    """
+    param_val.check_type(validation, Optional[str])
+    validation_level = resolve_validation_level(validation)
+    if validation_level != "off":
+        param_val.check_type(choices_arrays, list)
+        param_val.check_type(seed, Optional[int])
+        param_val.check_type(dedup, Optional[bool])
+    if len(choices_arrays) == 0:
+        raise ValueError("At least one list of choices has to be provided.")
+    if len({len(choices) for choices in choices_arrays}) != 1:
+        raise ValueError("Aligned lists of choices have to be of the same length.")
+
+    import omni.graph.core as og  # pylint: disable=import-outside-toplevel
+    import omni.replicator.core as rep  # pylint: disable=import-outside-toplevel
+
+    prepared = [_prepare_choices(choices, validation_level) for choices in choices_arrays]
+    aligned_node = rep.utils.create_node(SHUFFLE_ALIGNED_NODE_TYPE, seed=seed)
+    graph = aligned_node.get_graph()
+    for array_idx, (choices, data_type) in enumerate(prepared):
+        choices_attr_name = "inputs:choices"
+        if array_idx > 0:
+            # The extra arrays are dynamic attributes created directly with the inferred types.
+            choices_attr_name = f"inputs:choices_{array_idx}"
+            input_port = og.AttributePortType.ATTRIBUTE_PORT_TYPE_INPUT
+            output_port = og.AttributePortType.ATTRIBUTE_PORT_TYPE_OUTPUT
+            og.Controller.create_attribute(aligned_node, choices_attr_name, f"{data_type}[]", input_port)
+            og.Controller.create_attribute(aligned_node, f"outputs:samples_{array_idx}", f"{data_type}[]", output_port)
+        array_node = _array_node(graph, choices, data_type, resolve_dedup(dedup))
+        array_node.get_attribute("inputs:array").connect(aligned_node.get_attribute(choices_attr_name), True)
+
+    return aligned_node
+
+
+def shuffle_many(  # pylint: disable=unused-argument, too-many-arguments, too-many-locals, too-many-statements
+    list_of_choices: List[List[Any]],
+    seeds: Optional[List[int]] = None,
+    name: Optional[str] = None,
+    index_mode: bool = False,
+    batch_size: int = 1,
+    num_samples: Optional[int] = None,
+    random_access: bool = False,
+    epoch_mode: bool = False,
+    validation: Optional[str] = None,
+    dedup: Optional[bool] = None,
+    token_ids: bool = False,
+    group_size: int = 0,
+) -> List[Any]:
+    """
+    Creates shuffle distributions of several choice lists at once, see `shuffle`. The shuffle nodes are created by
+    Replicator, which sets up the node id of every node, so the nodes with the same seed draw different streams. The
+    array nodes are created, set up and wired in two batched graph edits instead of node by node.
+
+    Args:
+        list_of_choices (List[List[Any]]): Choices of every distribution.
+        seeds (Optional[List[int]]): Seed of every distribution. The global seed is used for all if None.
+        index_mode (bool): See `shuffle`.
+        batch_size (int): See `shuffle`.
+        num_samples (Optional[int]): See `shuffle`.
+        random_access (bool): See `shuffle`.
+        epoch_mode (bool): See `shuffle`.
+        validation (Optional[str]): See `shuffle`.
+        dedup (Optional[bool]): See `shuffle`. Choices with the same content share one array node also within the batch.
+        token_ids (bool): See `shuffle`.
+        group_size (int): See `shuffle`.
 
+    Raises:
+        ValueError: Raised if the number of the seeds doesn't match the number of the choice lists.
+
+    Returns:
+        List[Any] (List[og.Node]): Created shuffle nodes in the order of the choice lists.
+    """
+    param_val.check_type(validation, Optional[str])
+    validation_level = resolve_validation_level(validation)
+    if validation_level != "off":
+        param_val.check_type(list_of_choices, list)
+        param_val.check_type(seeds, Optional[List[int]])
+        param_val.check_type(index_mode, bool)
+        param_val.check_type(batch_size, int)
+        param_val.check_type(num_samples, Optional[int])
+        param_val.check_type(random_access, bool)
+        param_val.check_type(epoch_mode, bool)
+        param_val.check_type(dedup, Optional[bool])
+        param_val.check_type(token_ids, bool)
+        param_val.check_type(group_size, int)
+    if len(list_of_choices) == 0:
+        return []
+    seeds = [-1] * len(list_of_choices) if seeds is None else seeds
+    if len(seeds) != len(list_of_choices):
+        raise ValueError("Number of the seeds has to match the number of the choice lists.")
+
+    import omni.graph.core as og  # pylint: disable=import-outside-toplevel
     import omni.replicator.core as rep  # pylint: disable=import-outside-toplevel
 
-    if isinstance(choices[0], Sdf.Path):
+    prepared = [_intern_tokens(*_prepare_choices(choices, validation_level), token_ids) for choices in list_of_choices]
+    node_inputs = _shuffle_node_inputs(index_mode, batch_size, num_samples, random_access, None, epoch_mode, group_size)
+    use_dedup = resolve_dedup(dedup)
+
+    shuffle_nodes = [
+        rep.utils.create_node(SHUFFLE_NODE_TYPE, seed=seed, tokenIds=use_token_ids, **node_inputs)
+        for seed, (_, _, use_token_ids) in zip(seeds, prepared)
+    ]
+    graph = shuffle_nodes[0].get_graph()
+    graph_path = graph.get_path_to_graph()
+    shuffle_paths = [node.get_prim_path() for node in shuffle_nodes]
+
+    # Array node path per choice list. New array nodes are collected as (path, data type, choices, content key, whether
+    # the choices are token ids).
+    array_paths: List[str] = []
+    new_arrays: List[Tuple[str, str, Any, str, bool]] = []
+    paths_by_key: Dict[str, str] = {}
+    free_array_paths = iter(_free_node_paths(graph, "OgnArray", len(prepared)))
+    for choices, data_type, use_token_ids in prepared:
+        array_key = content_key(_array_key_type(data_type, use_token_ids), choices) if use_dedup else ""
+        array_path = paths_by_key.get(array_key) if use_dedup else None
+        if array_path is None and use_dedup:
+            cached_node = ARRAY_NODE_CACHE.get(graph_path, array_key)
+            array_path = cached_node.get_prim_path() if cached_node is not None else None
+        if array_path is None:
+            array_path = next(free_array_paths)
+            new_arrays.append((array_path, data_type, choices, array_key, use_token_ids))
+        paths_by_key[array_key] = array_path
+        array_paths.append(array_path)
+
+    keys = og.Controller.Keys
+    if new_arrays:
+        og.Controller.edit(
+            graph,
+            {
+                keys.CREATE_NODES: [(path.rsplit("/", 1)[-1], ARRAY_NODE_TYPE) for path, _, _, _, _ in new_arrays],
+                keys.SET_VALUES: [(f"{path}.inputs:arrayType", data_type) for path, data_type, _, _, _ in new_arrays],
+            },
+        )
+
+    # Array values are set once the array types are resolved and before the connection, like in `shuffle`.
+    for path, _, choices, array_key, use_token_ids in new_arrays:
+        array_node = graph.get_node(path)
+        _set_array_value(array_node, choices, use_token_ids)
+        if use_dedup:
+            ARRAY_NODE_CACHE.put(graph_path, array_key, array_node)
+    og.Controller.edit(
+        graph,
+        {
+            keys.CONNECT: [
+                (f"{array_path}.inputs:array", f"{shuffle_path}.inputs:choices")
+                for array_path, shuffle_path in zip(array_paths, shuffle_paths)
+            ]
+        },
+    )
+
+    return shuffle_nodes
+
+
+def _array_node(graph: Any, choices: Any, data_type: str, use_dedup: bool, is_token_ids: bool = False) -> Any:
+    """
+    Creates the array source node of the choices, or reuses a cached one with the same content.
+
+    Args:
+        graph (og.Graph): Graph the node has to be in.
+        choices (Any): Values of the array, a list or a NumPy array.
+        data_type (str): Base data type of the choices.
+        use_dedup (bool): If True, the node is looked up in and put into `ARRAY_NODE_CACHE`.
+        is_token_ids (bool): If True, the choices are token ids of `PATH_TABLE`, see `_set_array_value`.
+
+    Returns:
+        Any (og.Node): Array node.
+    """
+    import omni.replicator.core as rep  # pylint: disable=import-outside-toplevel
+
+    graph_path = graph.get_path_to_graph()
+    array_key = content_key(_array_key_type(data_type, is_token_ids), choices) if use_dedup else ""
+    array_node = ARRAY_NODE_CACHE.get(graph_path, array_key) if use_dedup else None
+    if array_node is None:
+        array_node = rep.utils.create_node(ARRAY_NODE_TYPE, arrayType=data_type)
+        _set_array_value(array_node, choices, is_token_ids)
+        if use_dedup:
+            ARRAY_NODE_CACHE.put(graph_path, array_key, array_node)
+    return array_node
+
+
+def _set_array_value(array_node: Any, choices: Any, is_token_ids: bool) -> None:
+    """
+    Sets the choices of an array node. Token ids are valid only in the running process, so they are written into
+    Fabric without authoring them into USD, where they would be saved with the stage.
+
+    Args:
+        array_node (og.Node): Array node.
+        choices (Any): Values of the array, a list or a NumPy array.
+        is_token_ids (bool): If True, the choices are token ids of `PATH_TABLE`.
+    """
+    import omni.graph.core as og  # pylint: disable=import-outside-toplevel
+
+    attribute = array_node.get_attribute("inputs:array")
+    if is_token_ids:
+        og.AttributeValueHelper(attribute).set(choices, update_usd=False)
+    else:
+        attribute.set(choices)
+
+
+def _array_key_type(data_type: str, is_token_ids: bool) -> str:
+    """
+    Args:
+        data_type (str): Base data type of the choices.
+        is_token_ids (bool): If True, the choices are token ids of `PATH_TABLE`.
+
+    Returns:
+        str: Data type of the array node cache key. The token ids are not authored into USD, so their array nodes are
+            not shared with the `uint64` choices of the same content.
+    """
+    return "tokenIds" if is_token_ids else data_type
+
+
+def _prepare_choices(choices: List[Any], validation_level: str, path_handles: bool = False) -> Tuple[Any, str]:
+    """
+    Converts the choices into OmniGraph compatible values and infers their data type.
+
+    Args:
+        choices (List[Any]): Values in the distribution to choose from.
+        validation_level (str): Validation level, see `metron.ai.ardagen.validation`.
+        path_handles (bool): If True, the paths are converted into their handles of `PATH_TABLE`.
+
+    Raises:
+        ValueError: Raised if `path_handles` is set and the choices are not paths.
+
+    Returns:
+        Tuple[Any, str]: Converted choices and their base data type.
+    """
+    path_choices = choices
+    if len(choices) > 0 and isinstance(choices[0], Sdf.Path):
         # There is no corresponding og.BaseDataType for Sdf.Path so converted to string.
         # TODO: Refine the construct later, to avoid mypy ex: "str" has no attribute "pathString". pylint: disable=fixme
         choices = [i.pathString for i in choices]  # type: ignore
 
-    data_type = get_data_type(choices)
-    array_node = rep.utils.create_node("omni.replicator.core.OgnArray", arrayType=data_type)
-    array_node.get_attribute("inputs:array").set(choices)
-    # num_samples = len(choices)
+    data_type = infer_choices_data_type(choices, validation_level)
+    if not path_handles:
+        return choices, data_type
+    if data_type != "token":
+        raise ValueError("Only Sdf.Path objects or path strings can be shuffled as path handles.")
+    # The original Sdf.Path objects are interned, so the table resolves the handles to them without parsing.
+    return PATH_TABLE.intern(path_choices), "uint64"
 
-    reshufle_node = rep.utils.create_node("metron.ai.ardagen.SampleShuffle", seed=seed)
 
-    array_node.get_attribute("inputs:array").connect(reshufle_node.get_attribute("inputs:choices"), True)
+def _intern_tokens(choices: Any, data_type: str, token_ids: bool) -> Tuple[Any, str, bool]:
+    """
+    Replaces token choices by their ids in `PATH_TABLE`.
 
-    return reshufle_node
+    Args:
+        choices (Any): Prepared choices, see `_prepare_choices`.
+        data_type (str): Base data type of the choices.
+        token_ids (bool): If True, the token choices are interned.
+
+    Returns:
+        Tuple[Any, str, bool]: Choices, their base data type and whether they are token ids.
+    """
+    if not token_ids or data_type != "token":
+        return choices, data_type, False
+    return PATH_TABLE.intern(choices), "uint64", True
+
+
+def _shuffle_node_inputs(  # pylint: disable=too-many-arguments
+    index_mode: bool,
+    batch_size: int,
+    num_samples: Optional[int],
+    random_access: bool,
+    schedule_file: Optional[str],
+    epoch_mode: bool,
+    group_size: int = 0,
+    group_keys: Optional[List[int]] = None,
+    weights: Optional[List[float]] = None,
+    prefetch_frames: int = 0,
+) -> Dict[str, Any]:
+    """
+    Maps the distribution parameters onto the shuffle node inputs, except of the seed.
+
+    Args:
+        index_mode (bool): See `shuffle`.
+        batch_size (int): See `shuffle`.
+        num_samples (Optional[int]): See `shuffle`.
+        random_access (bool): See `shuffle`.
+        schedule_file (Optional[str]): See `shuffle`.
+        epoch_mode (bool): See `shuffle`.
+        group_size (int): See `shuffle`.
+        group_keys (Optional[List[int]]): See `shuffle`.
+        weights (Optional[List[float]]): See `shuffle`.
+        prefetch_frames (int): See `shuffle`.
+
+    Returns:
+        Dict[str, Any]: Input values by the input names.
+    """
+    return {
+        "indexMode": index_mode,
+        "batchSize": batch_size,
+        "numSamples": -1 if num_samples is None else num_samples,
+        "randomAccess": random_access,
+        "scheduleFile": schedule_file or "",
+        "epochMode": epoch_mode,
+        "groupSize": group_size,
+        "groupKeys": list(group_keys or []),
+        "weights": [float(weight) for weight in weights or []],
+        "prefetchFrames": prefetch_frames,
+    }
+
+
+def _free_node_paths(graph: Any, base_name: str, count: int) -> List[str]:
+    """
+    Finds paths of nodes which don't exist in the graph yet.
+
+    Args:
+        graph (og.Graph): Graph of the nodes.
+        base_name (str): Base of the node names.
+        count (int): Number of the paths.
+
+    Returns:
+        List[str]: Free node paths.
+    """
+    graph_path = graph.get_path_to_graph()
+    paths: List[str] = []
+    index = 0
+    while len(paths) < count:
+        path = f"{graph_path}/{base_name}_batch_{index}"
+        if not graph.get_node(path).is_valid():
+            paths.append(path)
+        index += 1
+    return paths
 
 
 # Defines what is imported when `from distribution import *` is called.
-__all__ = ["shuffle"]
+__all__ = ["shuffle", "shuffle_many", "shuffle_aligned", "shuffle_from_file"]
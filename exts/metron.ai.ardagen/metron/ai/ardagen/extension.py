@@ -1,12 +1,29 @@
 """
 Metron AI ArDaGen extension.
 """
+import importlib
 import typing
+import carb.settings
 import omni.ext
-from omni import ui
-import omni.kit.pipapi
+import omni.kit.app
+import omni.usd
+from .batch_evaluator import BATCH_EVALUATOR
+from .node_cache import ARRAY_NODE_CACHE, set_dedup_enabled
+from .path_table import PATH_TABLE
+from .prefetch import ASSET_PREFETCHER
+from .profiling import set_profiling_enabled
+from .profiling_window import ProfilingWindow
+from .rng_pool import RNG_POOL
+from .validation import set_validation_level
 
-omni.kit.pipapi.install("typeguard", module="typeguard")
+VALIDATION_LEVEL_SETTING = "/exts/metron.ai.ardagen/validationLevel"
+DEDUP_ARRAY_NODES_SETTING = "/exts/metron.ai.ardagen/dedupArrayNodes"
+PROFILING_SETTING = "/exts/metron.ai.ardagen/profiling"
+BATCH_EVALUATION_SETTING = "/exts/metron.ai.ardagen/batchEvaluation"
+PREFETCH_WORKERS_SETTING = "/exts/metron.ai.ardagen/prefetchWorkers"
+PREFETCH_MEMORY_BUDGET_SETTING = "/exts/metron.ai.ardagen/prefetchMemoryBudgetMB"
+# Setting written by `rep.set_global_seed`, the seed of the nodes with a negative seed.
+REPLICATOR_GLOBAL_SEED_SETTING = "/omni/replicator/RNGSeed"
 
 # Any class derived from `omni.ext.IExt` in top level module (defined in `python.modules` of `extension.toml`) will be
 # instantiated when extension gets enabled and `on_startup(ext_id)` will be called. Later when extension gets disabled
@@ -28,21 +45,95 @@ class ArDaGenExt(omni.ext.IExt):
             ext_id (Any): Extension id.
         """
         print("[metron.ai.ardagen] Metron AI ArDaGen Ext startup")
+        # The node types are registered here rather than on the package import, see the package `__init__`.
+        importlib.import_module(".ogn", package=__package__)
 
-        self._window = ui.Window(  # pylint: disable=attribute-defined-outside-init
-            "Metron AI ArDaGen Ext", width=300, height=300
+        settings = carb.settings.get_settings()
+        validation_level = settings.get(VALIDATION_LEVEL_SETTING)
+        if validation_level:
+            set_validation_level(validation_level)
+        set_dedup_enabled(bool(settings.get(DEDUP_ARRAY_NODES_SETTING)))
+
+        # The nodes with a negative seed follow Replicator's global seed, it is read again whenever it is set.
+        _refresh_global_seed()
+        self._global_seed_sub = (  # pylint: disable=attribute-defined-outside-init
+            omni.kit.app.SettingChangeSubscription(REPLICATOR_GLOBAL_SEED_SETTING, lambda *_: _refresh_global_seed())
+        )
+
+        # Cached array nodes are bound to the stage, so the cache is dropped whenever the stage is replaced. The global
+        # seed is read again for the new stage.
+        self._stage_event_sub = (  # pylint: disable=attribute-defined-outside-init
+            omni.usd.get_context()
+            .get_stage_event_stream()
+            .create_subscription_to_pop(self._on_stage_event, name="metron.ai.ardagen array node cache")
         )
-        with self._window.frame:
-            with ui.VStack():
-                ui.Label("Some Labels")
 
-                def on_click() -> None:
-                    print("clicked!")
+        # Random keys shuffle nodes are evaluated together before the graph evaluation of every frame.
+        self._pre_update_sub = None  # pylint: disable=attribute-defined-outside-init
+        if settings.get(BATCH_EVALUATION_SETTING):
+            self._pre_update_sub = (  # pylint: disable=attribute-defined-outside-init
+                omni.kit.app.get_app()
+                .get_pre_update_event_stream()
+                .create_subscription_to_pop(self._on_pre_update, name="metron.ai.ardagen batch evaluator")
+            )
+
+        ASSET_PREFETCHER.configure(
+            max_workers=settings.get(PREFETCH_WORKERS_SETTING) or 1,
+            memory_budget=(settings.get(PREFETCH_MEMORY_BUDGET_SETTING) or 0) * 1024 * 1024,
+        )
 
-                ui.Button("Me", clicked_fn=lambda: on_click())  # pylint: disable=unnecessary-lambda
+        set_profiling_enabled(bool(settings.get(PROFILING_SETTING)))
+        # pylint: disable-next=attribute-defined-outside-init
+        self._window: typing.Optional[ProfilingWindow] = ProfilingWindow("Metron AI ArDaGen Ext")
 
-    def on_shutdown(self) -> None:  # pylint: disable=no-self-use
+    def on_shutdown(self) -> None:
         """
         On shutdown routine.
         """
         print("[metron.ai.ardagen] Metron AI ArDaGen Ext shutdown")
+        self._stage_event_sub = None  # pylint: disable=attribute-defined-outside-init
+        self._global_seed_sub = None  # pylint: disable=attribute-defined-outside-init
+        self._pre_update_sub = None  # pylint: disable=attribute-defined-outside-init
+        BATCH_EVALUATOR.clear()
+        if ASSET_PREFETCHER.hits + ASSET_PREFETCHER.misses > 0:
+            print(f"[metron.ai.ardagen] Asset prefetch hit rate {ASSET_PREFETCHER.hit_rate:.1%}")
+        ASSET_PREFETCHER.shutdown()
+        ASSET_PREFETCHER.reset_stats()
+        ARRAY_NODE_CACHE.clear()
+        PATH_TABLE.clear()
+        RNG_POOL.clear()
+        if self._window is not None:
+            self._window.destroy()
+        self._window = None  # pylint: disable=attribute-defined-outside-init
+        set_profiling_enabled(False)
+
+    def _on_stage_event(self, event: typing.Any) -> None:  # pylint: disable=no-self-use
+        """
+        Stage event callback which clears the array node cache when the stage is torn down and reads the global seed of
+        the opened stage.
+
+        Args:
+            event (Any): Stage event.
+        """
+        if event.type in (int(omni.usd.StageEventType.CLOSING), int(omni.usd.StageEventType.OPENED)):
+            ARRAY_NODE_CACHE.clear()
+        if event.type == int(omni.usd.StageEventType.OPENED):
+            _refresh_global_seed()
+
+    def _on_pre_update(self, event: typing.Any) -> None:  # pylint: disable=no-self-use,unused-argument
+        """
+        Pre-update callback which evaluates the batched shuffle nodes of the frame.
+
+        Args:
+            event (Any): Update event.
+        """
+        BATCH_EVALUATOR.evaluate()
+
+
+def _refresh_global_seed() -> None:
+    """
+    Passes Replicator's global seed to `RNG_POOL`, the seed stays unchanged if Replicator has none set.
+    """
+    global_seed = carb.settings.get_settings().get(REPLICATOR_GLOBAL_SEED_SETTING)
+    if global_seed is not None:
+        RNG_POOL.set_global_seed(int(global_seed))
@@ -0,0 +1,117 @@
+"""
+Implements the asset working set report of the shuffling modes.
+
+The working set of a window is the number of distinct assets among the consecutive samples of the window, e.g. of the
+elements output in the epoch mode over a window of frames. The report compares the uniform permutation with the block
+shuffle (see `permutation.block_permutation`), so the group size can be tuned to the asset cache of the renderer.
+"""
+import argparse
+import typing
+import numpy as np
+from .permutation import block_permutation, group_ids, index_permutation
+
+
+def window_working_sets(sequence_keys: typing.Any, window: int) -> np.ndarray:
+    """
+    Counts the distinct keys in the consecutive non-overlapping windows of the sequence.
+
+    Args:
+        sequence_keys (Any): Array-like asset key of every sample in the sampling order.
+        window (int): Number of the samples in a window.
+
+    Raises:
+        ValueError: Raised if the window is not positive.
+
+    Returns:
+        np.ndarray: Number of the distinct keys of every window, the last window can be shorter.
+    """
+    if window < 1:
+        raise ValueError("Window has to be positive.")
+    keys = np.unique(np.asarray(sequence_keys), return_inverse=True)[1].reshape(-1)
+    positions = np.arange(len(keys))
+    # A sample is new in its window if the previous sample of the same key is before the window start.
+    order = np.argsort(keys, kind="stable")
+    previous = np.full(len(keys), -1)
+    is_same_key = keys[order[1:]] == keys[order[:-1]]
+    previous[order[1:][is_same_key]] = order[:-1][is_same_key]
+    window_idx = positions // window
+    is_new = previous < window_idx * window
+    return np.bincount(window_idx, weights=is_new).astype(np.int64)
+
+
+def expected_working_set(  # pylint: disable=too-many-arguments
+    asset_keys: typing.Any,
+    window: int,
+    group_size: int = 0,
+    group_keys: typing.Any = None,
+    seed: int = 0,
+    trials: int = 8,
+) -> typing.Dict[str, float]:
+    """
+    Estimates the mean working set per window of the uniform and the block shuffle by sampling permutations.
+
+    Args:
+        asset_keys (Any): Array-like asset key of every choice, e.g. the asset path of every variant.
+        window (int): Number of the consecutive samples in a window.
+        group_size (int): Group size of the block shuffle, see `permutation.group_ids`.
+        group_keys (Any): Group keys of the block shuffle, see `permutation.group_ids`. Usually the asset keys.
+        seed (int): Seed of the sampled permutations.
+        trials (int): Number of the sampled permutations per mode.
+
+    Raises:
+        ValueError: Raised if the block shuffle is not configured.
+
+    Returns:
+        Dict[str, float]: Mean working set of the `uniform` and the `block` shuffle, the `window` and the number of the
+            distinct assets `num_assets`.
+    """
+    asset_keys = np.asarray(asset_keys)
+    groups = group_ids(len(asset_keys), group_size, group_keys)
+    if groups is None:
+        raise ValueError("Group size of at least 2 or group keys have to be provided.")
+
+    generator = np.random.default_rng(seed)
+    uniform = [
+        window_working_sets(asset_keys[index_permutation(generator, len(asset_keys))], window).mean()
+        for _ in range(trials)
+    ]
+    block = [
+        window_working_sets(asset_keys[block_permutation(generator, groups)], window).mean() for _ in range(trials)
+    ]
+    return {
+        "window": window,
+        "num_assets": len(np.unique(asset_keys)),
+        "uniform": float(np.mean(uniform)),
+        "block": float(np.mean(block)),
+    }
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Command line entry point of the report.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments. `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Report the asset working set per window of the shuffle modes.")
+    parser.add_argument("--keys", required=True, help="Path of a .npy file with the asset key of every choice.")
+    parser.add_argument("--window", type=int, required=True, help="Number of the consecutive samples in a window.")
+    parser.add_argument("--group-size", type=int, default=0, help="Group size of the block shuffle.")
+    parser.add_argument("--group-by-keys", action="store_true", help="Group the block shuffle by the asset keys.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the sampled permutations.")
+    parser.add_argument("--trials", type=int, default=8, help="Number of the sampled permutations per mode.")
+    args = parser.parse_args(argv)
+
+    asset_keys = np.load(args.keys)
+    report = expected_working_set(
+        asset_keys,
+        args.window,
+        group_size=args.group_size,
+        group_keys=asset_keys if args.group_by_keys else None,
+        seed=args.seed,
+        trials=args.trials,
+    )
+    print(
+        f"Distinct assets per window of {report['window']} samples ({report['num_assets']} assets): "
+        f"uniform {report['uniform']:.2f}, block {report['block']:.2f}"
+    )
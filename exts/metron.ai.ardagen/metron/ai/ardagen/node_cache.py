@@ -0,0 +1,114 @@
+"""
+Implements content-addressed cache of the array source nodes created by the distributions.
+"""
+import hashlib
+import typing
+import numpy as np
+
+_DEDUP_ENABLED = False
+
+
+def set_dedup_enabled(enabled: bool) -> None:
+    """
+    Sets the extension-wide default of the array node deduplication used by the distributions without explicit `dedup`
+    argument.
+
+    Args:
+        enabled (bool): If True, array nodes with the same content are reused.
+    """
+    global _DEDUP_ENABLED  # pylint: disable=global-statement
+    _DEDUP_ENABLED = enabled
+
+
+def resolve_dedup(dedup: typing.Optional[bool]) -> bool:
+    """
+    Resolves whether a distribution call deduplicates its array node.
+
+    Args:
+        dedup (Optional[bool]): Value requested by the call. The extension-wide default is used if None.
+
+    Returns:
+        bool: True if the array node is deduplicated.
+    """
+    return _DEDUP_ENABLED if dedup is None else dedup
+
+
+def content_key(data_type: str, choices: typing.Any) -> str:
+    """
+    Computes content hash of the array node data.
+
+    Args:
+        data_type (str): Base data type of the choices.
+        choices (Any): List of choices or NumPy array.
+
+    Returns:
+        str: Hex digest of the data type and the choices.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(data_type.encode())
+    if isinstance(choices, np.ndarray):
+        digest.update(f"{choices.dtype.str}{choices.shape}".encode())
+        digest.update(np.ascontiguousarray(choices).tobytes())
+    else:
+        # `repr` of str, bool, int and float and their tuples is deterministic and round-trips the values.
+        digest.update(repr(choices).encode())
+    return digest.hexdigest()
+
+
+class ArrayNodeCache:
+    """
+    Cache of the array source nodes keyed by the graph and the content hash.
+
+    Nodes which were removed together with their graph are evicted lazily on lookup, the whole cache is cleared by the
+    extension when the stage is closed or opened.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: typing.Dict[typing.Tuple[str, str], typing.Any] = {}
+
+    def get(self, graph_path: str, key: str) -> typing.Any:
+        """
+        Returns a cached node.
+
+        Args:
+            graph_path (str): Path of the graph the node has to be in.
+            key (str): Content key, see `content_key`.
+
+        Returns:
+            Any (Optional[og.Node]): Cached valid node or None.
+        """
+        node = self._nodes.get((graph_path, key))
+        if node is not None and not node.is_valid():
+            del self._nodes[(graph_path, key)]
+            node = None
+        return node
+
+    def put(self, graph_path: str, key: str, node: typing.Any) -> None:
+        """
+        Caches a node.
+
+        Args:
+            graph_path (str): Path of the graph of the node.
+            key (str): Content key, see `content_key`.
+            node (og.Node): Cached node.
+        """
+        self._nodes[(graph_path, key)] = node
+
+    def evict_invalid(self) -> None:
+        """
+        Evicts nodes which are not valid anymore.
+        """
+        self._nodes = {cache_key: node for cache_key, node in self._nodes.items() if node.is_valid()}
+
+    def clear(self) -> None:
+        """
+        Drops all cached nodes.
+        """
+        self._nodes.clear()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+# Cache shared by the distributions of the extension.
+ARRAY_NODE_CACHE = ArrayNodeCache()
@@ -19,9 +19,27 @@ class OgnSampleShuffleDatabase(og.Database):
 
     Attribute Value Properties:
         Inputs:
+            inputs.batchSize
             inputs.choices
+            inputs.choicesFile
+            inputs.epochMode
+            inputs.frame
+            inputs.groupKeys
+            inputs.groupSize
+            inputs.indexMode
+            inputs.numSamples
+            inputs.prefetchFrames
+            inputs.randomAccess
+            inputs.randomKeys
+            inputs.scheduleFile
             inputs.seed
+            inputs.tokenIds
+            inputs.weights
         Outputs:
+            outputs.element
+            outputs.elementIndex
+            outputs.epoch
+            outputs.permutation
             outputs.samples
     """
 
@@ -34,7 +52,162 @@ class OgnSampleShuffleDatabase(og.Database):
     # You should not need to access any of this data directly, use the defined database interfaces
     INTERFACE = og.Database._get_interface(
         [
-            ("inputs:choices", "any", 2, None, "The choices to be sampled", {}, True, None, False, ""),
+            (
+                "inputs:batchSize",
+                "int",
+                0,
+                None,
+                "Number of the permutations precomputed at once into the node's ring buffer. The output sequence for a given seed doesn't depend on the value. Values less than 2 disable the buffer.",
+                {ogn.MetadataKeys.DEFAULT: "1"},
+                True,
+                1,
+                False,
+                "",
+            ),
+            (
+                "inputs:choices",
+                "any",
+                2,
+                None,
+                "The choices to be sampled. The node skips the compute while the type is not resolved.",
+                {},
+                False,
+                None,
+                False,
+                "",
+            ),
+            (
+                "inputs:choicesFile",
+                "string",
+                0,
+                None,
+                "Path of a .npy or fixed-width token file (see metron.ai.ardagen.choices_file) used instead of inputs:choices. The file is memory-mapped and only the emitted elements are read.",
+                {ogn.MetadataKeys.DEFAULT: '""'},
+                True,
+                "",
+                False,
+                "",
+            ),
+            (
+                "inputs:epochMode",
+                "bool",
+                0,
+                None,
+                "Outputs one element per evaluation into outputs:element, visiting every choice once in random order. The choices are shuffled again only when the epoch is used up.",
+                {ogn.MetadataKeys.DEFAULT: "false"},
+                True,
+                False,
+                False,
+                "",
+            ),
+            (
+                "inputs:frame",
+                "int64",
+                0,
+                None,
+                "Index of the frame used in the random access mode. A value of less than 0 will indicate using the number of the node evaluations since the seed was set.",
+                {ogn.MetadataKeys.DEFAULT: "-1"},
+                True,
+                -1,
+                False,
+                "",
+            ),
+            (
+                "inputs:groupKeys",
+                "int[]",
+                0,
+                None,
+                "Group key of every choice, e.g. an asset id, for the block shuffle. The choices with the same key stay adjacent, the order of the groups and within the groups is shuffled. It takes precedence over inputs:groupSize if not empty.",
+                {ogn.MetadataKeys.DEFAULT: "[]"},
+                True,
+                [],
+                False,
+                "",
+            ),
+            (
+                "inputs:groupSize",
+                "int",
+                0,
+                None,
+                "Size of the contiguous groups of the choices for the block shuffle. Larger groups trade randomness for the reuse of the loaded assets. Values less than 2 disable the grouping.",
+                {ogn.MetadataKeys.DEFAULT: "0"},
+                True,
+                0,
+                False,
+                "",
+            ),
+            (
+                "inputs:indexMode",
+                "bool",
+                0,
+                None,
+                "Shuffles an index array and writes it to outputs:permutation. The choices are gathered into outputs:samples only when outputs:samples has a downstream connection.",
+                {ogn.MetadataKeys.DEFAULT: "false"},
+                True,
+                False,
+                False,
+                "",
+            ),
+            (
+                "inputs:numSamples",
+                "int",
+                0,
+                None,
+                "Number of the sampled elements without replacement. A value of less than 0 or not less than the number of the choices will indicate shuffling all choices.",
+                {ogn.MetadataKeys.DEFAULT: "-1"},
+                True,
+                -1,
+                False,
+                "",
+            ),
+            (
+                "inputs:prefetchFrames",
+                "int",
+                0,
+                None,
+                "Number of the upcoming evaluations whose string/token samples are read ahead as asset files by metron.ai.ardagen.prefetch.ASSET_PREFETCHER. For full permutations, which use every choice in every evaluation, it is the number of the upcoming samples instead. The outputs don't depend on the value. Values less than 1 disable the prefetch.",
+                {ogn.MetadataKeys.DEFAULT: "0"},
+                True,
+                0,
+                False,
+                "",
+            ),
+            (
+                "inputs:randomAccess",
+                "bool",
+                0,
+                None,
+                "Derives every frame's permutation from a counter-based generator keyed by the seed, the node id and the frame index, so any frame can be regenerated directly.",
+                {ogn.MetadataKeys.DEFAULT: "false"},
+                True,
+                False,
+                False,
+                "",
+            ),
+            (
+                "inputs:randomKeys",
+                "bool",
+                0,
+                None,
+                "Draws every permutation as the argsort of uniform random keys from the node's substream. Such nodes are evaluated together by metron.ai.ardagen.batch_evaluator if it is enabled, with the same outputs. Ignored in the epoch, random access, schedule, block and weighted shuffle modes.",
+                {ogn.MetadataKeys.DEFAULT: "false"},
+                True,
+                False,
+                False,
+                "",
+            ),
+            (
+                "inputs:scheduleFile",
+                "string",
+                0,
+                None,
+                "Path of a permutation schedule manifest planned by metron.ai.ardagen.schedule. If set, the permutation of the frame (see inputs:frame) is read from the memory-mapped schedule.",
+                {ogn.MetadataKeys.DEFAULT: '""'},
+                True,
+                "",
+                False,
+                "",
+            ),
             (
                 "inputs:seed",
                 "int",
@@ -47,20 +220,138 @@ class OgnSampleShuffleDatabase(og.Database):
                 False,
                 "",
             ),
-            ("outputs:samples", "any", 2, None, "Shuffled results", {}, True, None, False, ""),
+            (
+                "inputs:tokenIds",
+                "bool",
+                0,
+                None,
+                "The choices are uint64 ids of tokens interned in metron.ai.ardagen.path_table.PATH_TABLE. They are shuffled as integers and outputs:samples and outputs:element are tokens.",
+                {ogn.MetadataKeys.DEFAULT: "false"},
+                True,
+                False,
+                False,
+                "",
+            ),
+            (
+                "inputs:weights",
+                "double[]",
+                0,
+                None,
+                "Weight of every choice for the weighted shuffle by the Efraimidis-Spirakis key sort. The choices are output in a weighted random order, so the first inputs:numSamples elements are a weighted sample without replacement. It takes precedence over the block shuffle and the random keys mode. Empty weights disable the weighting.",
+                {ogn.MetadataKeys.DEFAULT: "[]"},
+                True,
+                [],
+                False,
+                "",
+            ),
+            (
+                "outputs:element",
+                "any",
+                2,
+                None,
+                "Current element of the epoch. Written only in the epoch mode.",
+                {},
+                False,
+                None,
+                False,
+                "",
+            ),
+            (
+                "outputs:elementIndex",
+                "int",
+                0,
+                None,
+                "Index of outputs:element in the choices. Written only in the epoch mode.",
+                {},
+                True,
+                None,
+                False,
+                "",
+            ),
+            (
+                "outputs:epoch",
+                "int64",
+                0,
+                None,
+                "Index of the current epoch since the seed was set. Written only in the epoch mode.",
+                {},
+                True,
+                None,
+                False,
+                "",
+            ),
+            (
+                "outputs:permutation",
+                "int[]",
+                0,
+                None,
+                "Indices of the choices in the shuffled order. Written only in the index mode.",
+                {},
+                True,
+                None,
+                False,
+                "",
+            ),
+            (
+                "outputs:samples",
+                "any",
+                2,
+                None,
+                "Shuffled results. The node skips the compute while the type is not resolved.",
+                {},
+                False,
+                None,
+                False,
+                "",
+            ),
         ]
     )
 
     class ValuesForInputs(og.DynamicAttributeAccess):
-        LOCAL_PROPERTY_NAMES = {"seed", "_setting_locked", "_batchedReadAttributes", "_batchedReadValues"}
+        LOCAL_PROPERTY_NAMES = {
+            "batchSize",
+            "epochMode",
+            "frame",
+            "groupSize",
+            "indexMode",
+            "numSamples",
+            "prefetchFrames",
+            "randomAccess",
+            "randomKeys",
+            "seed",
+            "tokenIds",
+            "_setting_locked",
+            "_batchedReadAttributes",
+            "_batchedReadValues",
+        }
         """Helper class that creates natural hierarchical access to input attributes"""
 
         def __init__(self, node: og.Node, attributes, dynamic_attributes: og.DynamicAttributeInterface):
             """Initialize simplified access for the attribute data"""
             context = node.get_graph().get_default_graph_context()
             super().__init__(context, node, attributes, dynamic_attributes)
-            self._batchedReadAttributes = [self._attributes.seed]
-            self._batchedReadValues = [-1]
+            self._batchedReadAttributes = [
+                self._attributes.batchSize,
+                self._attributes.epochMode,
+                self._attributes.frame,
+                self._attributes.groupSize,
+                self._attributes.indexMode,
+                self._attributes.numSamples,
+                self._attributes.prefetchFrames,
+                self._attributes.randomAccess,
+                self._attributes.randomKeys,
+                self._attributes.seed,
+                self._attributes.tokenIds,
+            ]
+            self._batchedReadValues = [1, False, -1, 0, False, -1, 0, False, False, -1, False]
+
+        @property
+        def batchSize(self):
+            return self._batchedReadValues[0]
+
+        @batchSize.setter
+        def batchSize(self, value):
+            self._batchedReadValues[0] = value
 
         @property
         def choices(self) -> og.RuntimeAttribute:
@@ -75,13 +366,133 @@ class OgnSampleShuffleDatabase(og.Database):
             else:
                 self.choices.value = value_to_set
 
+        @property
+        def choicesFile(self):
+            data_view = og.AttributeValueHelper(self._attributes.choicesFile)
+            return data_view.get()
+
+        @choicesFile.setter
+        def choicesFile(self, value):
+            if self._setting_locked:
+                raise og.ReadOnlyError(self._attributes.choicesFile)
+            data_view = og.AttributeValueHelper(self._attributes.choicesFile)
+            data_view.set(value)
+
+        @property
+        def epochMode(self):
+            return self._batchedReadValues[1]
+
+        @epochMode.setter
+        def epochMode(self, value):
+            self._batchedReadValues[1] = value
+
+        @property
+        def frame(self):
+            return self._batchedReadValues[2]
+
+        @frame.setter
+        def frame(self, value):
+            self._batchedReadValues[2] = value
+
+        @property
+        def groupKeys(self):
+            data_view = og.AttributeValueHelper(self._attributes.groupKeys)
+            return data_view.get()
+
+        @groupKeys.setter
+        def groupKeys(self, value):
+            if self._setting_locked:
+                raise og.ReadOnlyError(self._attributes.groupKeys)
+            data_view = og.AttributeValueHelper(self._attributes.groupKeys)
+            data_view.set(value)
+
+        @property
+        def groupSize(self):
+            return self._batchedReadValues[3]
+
+        @groupSize.setter
+        def groupSize(self, value):
+            self._batchedReadValues[3] = value
+
+        @property
+        def indexMode(self):
+            return self._batchedReadValues[4]
+
+        @indexMode.setter
+        def indexMode(self, value):
+            self._batchedReadValues[4] = value
+
+        @property
+        def numSamples(self):
+            return self._batchedReadValues[5]
+
+        @numSamples.setter
+        def numSamples(self, value):
+            self._batchedReadValues[5] = value
+
+        @property
+        def prefetchFrames(self):
+            return self._batchedReadValues[6]
+
+        @prefetchFrames.setter
+        def prefetchFrames(self, value):
+            self._batchedReadValues[6] = value
+
+        @property
+        def randomAccess(self):
+            return self._batchedReadValues[7]
+
+        @randomAccess.setter
+        def randomAccess(self, value):
+            self._batchedReadValues[7] = value
+
+        @property
+        def randomKeys(self):
+            return self._batchedReadValues[8]
+
+        @randomKeys.setter
+        def randomKeys(self, value):
+            self._batchedReadValues[8] = value
+
+        @property
+        def scheduleFile(self):
+            data_view = og.AttributeValueHelper(self._attributes.scheduleFile)
+            return data_view.get()
+
+        @scheduleFile.setter
+        def scheduleFile(self, value):
+            if self._setting_locked:
+                raise og.ReadOnlyError(self._attributes.scheduleFile)
+            data_view = og.AttributeValueHelper(self._attributes.scheduleFile)
+            data_view.set(value)
+
         @property
         def seed(self):
-            return self._batchedReadValues[0]
+            return self._batchedReadValues[9]
 
         @seed.setter
         def seed(self, value):
-            self._batchedReadValues[0] = value
+            self._batchedReadValues[9] = value
+
+        @property
+        def tokenIds(self):
+            return self._batchedReadValues[10]
+
+        @tokenIds.setter
+        def tokenIds(self, value):
+            self._batchedReadValues[10] = value
+
+        @property
+        def weights(self):
+            data_view = og.AttributeValueHelper(self._attributes.weights)
+            return data_view.get()
+
+        @weights.setter
+        def weights(self, value):
+            if self._setting_locked:
+                raise og.ReadOnlyError(self._attributes.weights)
+            data_view = og.AttributeValueHelper(self._attributes.weights)
+            data_view.set(value)
 
         def __getattr__(self, item: str):
             if item in self.LOCAL_PROPERTY_NAMES:
@@ -102,15 +513,66 @@ class OgnSampleShuffleDatabase(og.Database):
                 self._batchedReadValues = newValues
 
     class ValuesForOutputs(og.DynamicAttributeAccess):
-        LOCAL_PROPERTY_NAMES = {}
+        LOCAL_PROPERTY_NAMES = {"elementIndex", "epoch", "_batchedWriteValues"}
         """Helper class that creates natural hierarchical access to output attributes"""
 
         def __init__(self, node: og.Node, attributes, dynamic_attributes: og.DynamicAttributeInterface):
             """Initialize simplified access for the attribute data"""
             context = node.get_graph().get_default_graph_context()
             super().__init__(context, node, attributes, dynamic_attributes)
+            self.permutation_size = None
             self._batchedWriteValues = {}
 
+        @property
+        def element(self) -> og.RuntimeAttribute:
+            """Get the runtime wrapper class for the attribute outputs.element"""
+            return og.RuntimeAttribute(self._attributes.element.get_attribute_data(), self._context, False)
+
+        @element.setter
+        def element(self, value_to_set: Any):
+            """Assign another attribute's value to outputs.element"""
+            if isinstance(value_to_set, og.RuntimeAttribute):
+                self.element.value = value_to_set.value
+            else:
+                self.element.value = value_to_set
+
+        @property
+        def elementIndex(self):
+            value = self._batchedWriteValues.get(self._attributes.elementIndex)
+            if value:
+                return value
+            else:
+                data_view = og.AttributeValueHelper(self._attributes.elementIndex)
+                return data_view.get()
+
+        @elementIndex.setter
+        def elementIndex(self, value):
+            self._batchedWriteValues[self._attributes.elementIndex] = value
+
+        @property
+        def epoch(self):
+            value = self._batchedWriteValues.get(self._attributes.epoch)
+            if value:
+                return value
+            else:
+                data_view = og.AttributeValueHelper(self._attributes.epoch)
+                return data_view.get()
+
+        @epoch.setter
+        def epoch(self, value):
+            self._batchedWriteValues[self._attributes.epoch] = value
+
+        @property
+        def permutation(self):
+            data_view = og.AttributeValueHelper(self._attributes.permutation)
+            return data_view.get(reserved_element_count=self.permutation_size)
+
+        @permutation.setter
+        def permutation(self, value):
+            data_view = og.AttributeValueHelper(self._attributes.permutation)
+            data_view.set(value)
+            self.permutation_size = data_view.get_array_size()
+
         @property
         def samples(self) -> og.RuntimeAttribute:
             """Get the runtime wrapper class for the attribute outputs.samples"""
@@ -124,6 +586,18 @@ class OgnSampleShuffleDatabase(og.Database):
             else:
                 self.samples.value = value_to_set
 
+        def __getattr__(self, item: str):
+            if item in self.LOCAL_PROPERTY_NAMES:
+                return object.__getattribute__(self, item)
+            else:
+                return super().__getattr__(item)
+
+        def __setattr__(self, item: str, new_value):
+            if item in self.LOCAL_PROPERTY_NAMES:
+                object.__setattr__(self, item, new_value)
+            else:
+                super().__setattr__(item, new_value)
+
         def _commit(self):
             _og._commit_output_attributes_data(self._batchedWriteValues)
             self._batchedWriteValues = {}
@@ -167,12 +641,6 @@ class OgnSampleShuffleDatabase(og.Database):
                 db = OgnSampleShuffleDatabase(node)
 
             try:
-                if db.inputs.choices.type.base_type == og.BaseDataType.UNKNOWN:
-                    db.log_warning("Required extended attribute inputs:choices is not resolved, compute skipped")
-                    return False
-                if db.outputs.samples.type.base_type == og.BaseDataType.UNKNOWN:
-                    db.log_warning("Required extended attribute outputs:samples is not resolved, compute skipped")
-                    return False
                 compute_function = getattr(OgnSampleShuffleDatabase.NODE_TYPE_CLASS, "compute", None)
                 if callable(compute_function) and compute_function.__code__.co_argcount > 1:
                     return compute_function(context, node)
@@ -2,19 +2,77 @@
 """
 Implements shuffling node.
 """
+import collections
+import time
 import typing
 import numpy as np
 import omni.graph.core as og
-import omni.replicator.core as rep
+from metron.ai.ardagen.batch_evaluator import BATCH_EVALUATOR
+from metron.ai.ardagen.choices_file import ChoicesFile
+from metron.ai.ardagen.path_table import PATH_TABLE
+from metron.ai.ardagen.permutation import (
+    OutputBuffers,
+    PermutationBuffer,
+    block_permutation,
+    check_weights,
+    frame_generator,
+    frame_permutation,
+    group_ids,
+    index_permutation,
+    random_key_permutation,
+    sample_indices,
+    weighted_permutation,
+)
+from metron.ai.ardagen.prefetch import ASSET_PREFETCHER
+from metron.ai.ardagen.profiling import (
+    FAILURE_EMPTY_CHOICES,
+    FAILURE_EXCEPTION,
+    FAILURE_UNRESOLVED_PREFIX,
+    ComputeProfiler,
+    get_profiler,
+)
+from metron.ai.ardagen.rng_pool import RNG_POOL, PooledRNG
+from metron.ai.ardagen.schedule import Schedule
 
 
-class OgnSampleShuffleInternalState:  # pylint: disable=too-few-public-methods
+class OgnSampleShuffleInternalState:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
     """
     Node's internal state representation.
     """
 
     def __init__(self) -> None:
-        self.rng = rep.rng.ReplicatorRNG()
+        # Substream of the node in `RNG_POOL`, acquired on the first compute.
+        self.rng: typing.Optional[PooledRNG] = None
+        # Value of `inputs:nodeId`, read on the first use.
+        self.node_id: typing.Optional[int] = None
+        # Unresolved extended attribute found by the last resolution check and the value of
+        # `OgnSampleShuffle.connection_changes` it was checked at.
+        self.unresolved_attribute: typing.Optional[str] = None
+        self.resolution_checked_at = -1
+        self.permutations = PermutationBuffer()
+        self.buffers = OutputBuffers()
+        self.frame = 0
+        self.schedule: typing.Optional[Schedule] = None
+        self.epoch_order: typing.Optional[np.ndarray] = None
+        self.epoch_cursor = 0
+        self.epoch = -1
+        self.choices_file: typing.Optional[ChoicesFile] = None
+        # Group index of every choice in the block shuffle and the inputs it was computed from.
+        self.groups: typing.Optional[np.ndarray] = None
+        self.group_inputs: typing.Optional[typing.Tuple[int, int, np.ndarray]] = None
+        # Validated weights of the weighted shuffle.
+        self.weights: typing.Optional[np.ndarray] = None
+        # Outputs of the next evaluation were written by `BATCH_EVALUATOR`, the inputs they were drawn for and the
+        # generator state before the draw, which is restored if the inputs changed before the compute.
+        self.batched = False
+        self.batch_inputs: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+        self.batch_choices: typing.Optional[np.ndarray] = None
+        self.batch_generator_state: typing.Optional[typing.Dict[str, typing.Any]] = None
+        # Permutations of the upcoming evaluations, the inputs they were drawn for and the paths scheduled into
+        # `ASSET_PREFETCHER` for every upcoming evaluation.
+        self.lookahead: typing.Optional[typing.Iterator[np.ndarray]] = None
+        self.lookahead_key: typing.Optional[typing.Tuple[typing.Any, ...]] = None
+        self.lookahead_paths: typing.Deque[typing.List[str]] = collections.deque()
 
 
 class OgnSampleShuffle:
@@ -22,6 +80,10 @@ class OgnSampleShuffle:
     OGN Shuffling node.
     """
 
+    # Number of the connection changes of the nodes. The resolved types change only with the connections, so the nodes
+    # check them again only after a change.
+    connection_changes = 0
+
     @staticmethod
     def internal_state() -> OgnSampleShuffleInternalState:
         """
@@ -39,7 +101,9 @@ class OgnSampleShuffle:
         Args:
             node (og.Node): Node to be released.
         """
-        rep.rng.release(node.get_prim_path())
+        RNG_POOL.release(node.get_prim_path())
+        BATCH_EVALUATOR.remove(node.get_prim_path())
+        ASSET_PREFETCHER.cancel(node.get_prim_path())
 
     @staticmethod
     def compute(db: typing.Any) -> bool:
@@ -53,23 +117,753 @@ class OgnSampleShuffle:
             bool: Success state of the operation.
         """
         state = db.internal_state
-        choices = db.inputs.choices.array_value()
+        if state.resolution_checked_at != OgnSampleShuffle.connection_changes:
+            state.unresolved_attribute = OgnSampleShuffle._unresolved_attribute(db)
+            state.resolution_checked_at = OgnSampleShuffle.connection_changes
+        if state.unresolved_attribute is not None:
+            OgnSampleShuffle._compute_skipped(db, state.unresolved_attribute)
+            return False
+
+        if state.batched:
+            state.batched = False
+            if OgnSampleShuffle._is_batch_current(db, state):
+                # The outputs of this evaluation were already written by the batch evaluator.
+                return True
+            # The inputs changed after the batch evaluator ran, so its draw is undone and the node computes as usual.
+            state.rng.generator.bit_generator.state = state.batch_generator_state
+
+        profiler = get_profiler()
+        if profiler is None:
+            return OgnSampleShuffle._compute(db, None)
+
+        node_path = db.node.get_prim_path()
+        start = time.perf_counter()
+        try:
+            return OgnSampleShuffle._compute(db, profiler)
+        except Exception:
+            profiler.record_failure(node_path, FAILURE_EXCEPTION)
+            raise
+        finally:
+            profiler.record_compute(node_path, time.perf_counter() - start)
+
+    @staticmethod
+    def _compute(db: typing.Any, profiler: typing.Optional[ComputeProfiler]) -> bool:
+        """
+        Computes the node outputs.
+
+        Args:
+            db (Any): Database structure.
+            profiler (Optional[ComputeProfiler]): Profiler the compute is recorded into, None if the profiling is
+                disabled.
+
+        Returns:
+            bool: Success state of the operation.
+        """
+        state = db.internal_state
+        choices_file = OgnSampleShuffle._choices_file(db, state)
+        choices = choices_file.data if choices_file is not None else db.inputs.choices.array_value()
 
         if len(choices) == 0:
+            if profiler is not None:
+                profiler.record_failure(db.node.get_prim_path(), FAILURE_EMPTY_CHOICES)
             return False
 
+        OgnSampleShuffle._update_rng(db, state, profiler)
+        length = len(choices)
+        groups = OgnSampleShuffle._groups(db, state, length)
+        weights = OgnSampleShuffle._weights(db, state, length)
+        if db.inputs.epochMode:
+            return OgnSampleShuffle._next_epoch_element(db, state, choices, choices_file, groups, weights, profiler)
+
+        # The schedule takes precedence over the random access, which takes precedence over the sequential modes.
+        if db.inputs.scheduleFile:
+            permutation = OgnSampleShuffle._schedule_permutation(db, state, length)
+        elif db.inputs.randomAccess:
+            permutation = OgnSampleShuffle._random_access_permutation(db, state, length, groups, weights)
+        else:
+            permutation = OgnSampleShuffle._sequential_permutation(db, state, length, groups, weights)
+
+        if db.inputs.prefetchFrames > 0 and OgnSampleShuffle._has_paths(db, choices, choices_file):
+            OgnSampleShuffle._prefetch_ahead(db, state, choices, choices_file, permutation, groups, weights)
+        OgnSampleShuffle._write_outputs(db, state, choices, choices_file, permutation, profiler)
+        return True
+
+    @staticmethod
+    def _write_outputs(  # pylint: disable=too-many-arguments
+        db: typing.Any,
+        state: OgnSampleShuffleInternalState,
+        choices: np.ndarray,
+        choices_file: typing.Optional[ChoicesFile],
+        permutation: np.ndarray,
+        profiler: typing.Optional[ComputeProfiler],
+    ) -> None:
+        """
+        Writes the permutation in the index mode and the samples gathered by the permutation.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            choices (np.ndarray): Choices of the node.
+            choices_file (Optional[ChoicesFile]): Mapped choices file the choices come from, None if they come from
+                `inputs:choices`.
+            permutation (np.ndarray): Indices of the choices used by the evaluation.
+            profiler (Optional[ComputeProfiler]): Profiler the compute is recorded into, None if the profiling is
+                disabled.
+        """
+        if db.inputs.indexMode:
+            db.outputs.permutation = permutation
+            if profiler is not None:
+                profiler.record_bytes_copied(db.node.get_prim_path(), permutation.nbytes)
+            # The payload gather is the expensive part, so it is done only if somebody consumes the samples.
+            if db.node.get_attribute("outputs:samples").get_downstream_connection_count() == 0:
+                return
+        if choices_file is not None:
+            samples = choices_file.gather(permutation, state.buffers)
+        else:
+            samples = state.buffers.gather(choices, permutation)
+        if profiler is not None:
+            profiler.record_bytes_copied(db.node.get_prim_path(), samples.nbytes)
+        db.outputs.samples = OgnSampleShuffle._token_strings(db, choices_file, samples)
+
+    @staticmethod
+    def _schedule_permutation(db: typing.Any, state: OgnSampleShuffleInternalState, length: int) -> np.ndarray:
+        """
+        Returns the schedule row of the next frame. The schedule is loaded again when `inputs:scheduleFile` changes.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            length (int): Number of the choices.
+
+        Returns:
+            np.ndarray: Indices of the choices used by the evaluation.
+
+        Raises:
+            ValueError: If the schedule was planned for another node.
+        """
+        schedule_file = db.inputs.scheduleFile
+        if state.schedule is None or state.schedule.path != schedule_file:
+            state.schedule = Schedule(schedule_file)
+        node_id = OgnSampleShuffle._node_id(db, state)
+        state.schedule.check(length, RNG_POOL.effective_seed(db.inputs.seed), node_id, db.inputs.numSamples)
+        return state.schedule.row(OgnSampleShuffle._next_frame(db, state))
+
+    @staticmethod
+    def _random_access_permutation(
+        db: typing.Any,
+        state: OgnSampleShuffleInternalState,
+        length: int,
+        groups: typing.Optional[np.ndarray],
+        weights: typing.Optional[np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns the permutation of the next frame in the random access mode. It depends only on (seed, node id,
+        frame), so the sequential generator is left untouched.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            length (int): Number of the choices.
+            groups (Optional[np.ndarray]): Group index of every choice in the block shuffle, None if it is disabled.
+            weights (Optional[np.ndarray]): Weight of every choice in the weighted shuffle, None if it is disabled.
+
+        Returns:
+            np.ndarray: Indices of the choices used by the evaluation.
+        """
+        frame = OgnSampleShuffle._next_frame(db, state)
+        seed = RNG_POOL.effective_seed(db.inputs.seed)
+        node_id = OgnSampleShuffle._node_id(db, state)
+        if weights is not None:
+            return weighted_permutation(frame_generator(seed, node_id, frame), weights, db.inputs.numSamples)
+        if groups is not None:
+            permutation = block_permutation(frame_generator(seed, node_id, frame), groups)
+            return OgnSampleShuffle._truncate(permutation, db.inputs.numSamples)
+        return frame_permutation(seed, node_id, frame, length, db.inputs.numSamples)
+
+    @staticmethod
+    def _sequential_permutation(
+        db: typing.Any,
+        state: OgnSampleShuffleInternalState,
+        length: int,
+        groups: typing.Optional[np.ndarray],
+        weights: typing.Optional[np.ndarray],
+    ) -> np.ndarray:
+        """
+        Returns the next permutation drawn from the node's substream. The weighted shuffle takes precedence over the
+        block shuffle, the random keys, `inputs:numSamples` and `inputs:batchSize` in this order.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            length (int): Number of the choices.
+            groups (Optional[np.ndarray]): Group index of every choice in the block shuffle, None if it is disabled.
+            weights (Optional[np.ndarray]): Weight of every choice in the weighted shuffle, None if it is disabled.
+
+        Returns:
+            np.ndarray: Indices of the choices used by the evaluation.
+        """
+        # The generator is created by the first access, so the modes not drawing from it don't build it.
+        rng = OgnSampleShuffle._rng(state)
+        num_samples = db.inputs.numSamples
+        if weights is not None:
+            state.permutations.rewind(rng.generator)
+            return weighted_permutation(rng.generator, weights, num_samples)
+        if groups is not None:
+            state.permutations.rewind(rng.generator)
+            return OgnSampleShuffle._truncate(block_permutation(rng.generator, groups), num_samples)
+        if db.inputs.randomKeys:
+            BATCH_EVALUATOR.add(db)
+            state.permutations.rewind(rng.generator)
+            return OgnSampleShuffle._truncate(random_key_permutation(rng.generator, length), num_samples)
+        if 0 <= num_samples < length:
+            state.permutations.rewind(rng.generator)
+            return sample_indices(rng.generator, length, num_samples)
+        if db.inputs.batchSize > 1:
+            return state.permutations.next(rng.generator, length, db.inputs.batchSize)
+        # Shuffling the indices draws the same numbers as shuffling a copy of the payload, so the samples are the same,
+        # but they are gathered into the reused output buffer. The draws must not run ahead of buffered permutations.
+        state.permutations.rewind(rng.generator)
+        return state.buffers.index_permutation(rng.generator, length)
+
+    @staticmethod
+    def batch_choices(db: typing.Any, state: OgnSampleShuffleInternalState) -> typing.Optional[np.ndarray]:
+        """
+        Prepares the next evaluation of the node for `BATCH_EVALUATOR`. The substream is updated as in the compute, so
+        the batch evaluator draws the keys the compute would draw.
+
+        Args:
+            db (Any): Database structure with the inputs prefetched by the previous compute.
+            state (OgnSampleShuffleInternalState): Internal state.
+
+        Returns:
+            Optional[np.ndarray]: Choices of the node, None if the evaluation can't be batched, i.e. the random keys
+                mode is off or another mode takes precedence, the choices come from a file or are empty, or the node
+                prefetches its assets.
+        """
+        if not OgnSampleShuffle._is_batchable(db):
+            return None
+        choices = db.inputs.choices.array_value()
+        if len(choices) == 0:
+            return None
+        state.batch_inputs = OgnSampleShuffle._batch_inputs(db)
+        state.batch_choices = np.copy(choices)
+        OgnSampleShuffle._update_rng(db, state, get_profiler())
+        return choices
+
+    @staticmethod
+    def _is_batchable(db: typing.Any) -> bool:
+        """
+        Args:
+            db (Any): Database structure.
+
+        Returns:
+            bool: True if the random keys mode is on and no other mode takes precedence, the choices don't come from a
+                file and the node doesn't prefetch its assets.
+        """
+        inputs = db.inputs
+        if not inputs.randomKeys or inputs.epochMode or inputs.randomAccess or inputs.indexMode or inputs.seed is None:
+            return False
+        if inputs.groupSize > 1 or inputs.prefetchFrames > 0 or inputs.scheduleFile or inputs.choicesFile:
+            return False
+        return len(inputs.groupKeys) == 0 and len(inputs.weights) == 0
+
+    @staticmethod
+    def _batch_inputs(db: typing.Any) -> typing.Tuple[typing.Any, ...]:
+        """
+        Args:
+            db (Any): Database structure.
+
+        Returns:
+            Tuple[Any, ...]: Inputs the random keys and the samples depend on, except the choices.
+        """
+        inputs = db.inputs
+        return (inputs.seed, RNG_POOL.effective_seed(inputs.seed), inputs.numSamples, inputs.tokenIds)
+
+    @staticmethod
+    def _is_batch_current(db: typing.Any, state: OgnSampleShuffleInternalState) -> bool:
+        """
+        The batch evaluator runs before the frame's graph evaluation on the inputs read by the previous compute, so the
+        inputs are compared again when the node computes.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+
+        Returns:
+            bool: True if the batched outputs were drawn for the current inputs.
+        """
+        if not OgnSampleShuffle._is_batchable(db) or state.batch_inputs != OgnSampleShuffle._batch_inputs(db):
+            return False
+        choices = db.inputs.choices.array_value()
+        batch_choices = state.batch_choices
+        return (
+            batch_choices is not None
+            and choices.dtype == batch_choices.dtype
+            and np.array_equal(choices, batch_choices)
+        )
+
+    @staticmethod
+    def _update_rng(
+        db: typing.Any, state: OgnSampleShuffleInternalState, profiler: typing.Optional[ComputeProfiler]
+    ) -> None:
+        """
+        Starts a new substream of the node and resets the sequential state when the seed changes, or when the global
+        seed changes for a negative seed.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            profiler (Optional[ComputeProfiler]): Profiler the reinitialization is recorded into, None if the profiling
+                is disabled.
+        """
         is_seed_valid = db.inputs.seed is not None
-        is_seed_changed = state.rng is None or db.inputs.seed != state.rng.seed
+        is_seed_changed = (
+            state.rng is None
+            or db.inputs.seed != state.rng.seed
+            or (is_seed_valid and RNG_POOL.effective_seed(db.inputs.seed) != state.rng.effective_seed)
+        )
         if is_seed_valid and is_seed_changed:
-            node_id = db.inputs.nodeId if db.node.get_attribute_exists("inputs:nodeId") else 0
-            state.rng.initialize(db.inputs.seed, db.node, node_id)
+            state.rng = RNG_POOL.acquire(db.node.get_prim_path(), db.inputs.seed, OgnSampleShuffle._node_id(db, state))
+            state.permutations.clear()
+            state.frame = 0
+            state.epoch_order = None
+            state.epoch = -1
+            if profiler is not None:
+                profiler.record_rng_reinit(db.node.get_prim_path())
 
-        shuffled = np.copy(choices)
-        state.rng.generator.shuffle(shuffled, axis=0)
+    @staticmethod
+    def _next_epoch_element(  # pylint: disable=too-many-arguments
+        db: typing.Any,
+        state: OgnSampleShuffleInternalState,
+        choices: np.ndarray,
+        choices_file: typing.Optional[ChoicesFile],
+        groups: typing.Optional[np.ndarray],
+        weights: typing.Optional[np.ndarray],
+        profiler: typing.Optional[ComputeProfiler],
+    ) -> bool:
+        """
+        Outputs the next element of the epoch. A new epoch permutation is drawn when the current one is used up or the
+        number of the choices changes, so the per-evaluation cost is O(1) amortized. The epoch permutations are the same
+        as the permutations of the consecutive evaluations in the default mode.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            choices (np.ndarray): Choices of the node.
+            choices_file (Optional[ChoicesFile]): Mapped choices file the choices come from, None if they come from
+                `inputs:choices`.
+            groups (Optional[np.ndarray]): Group index of every choice in the block shuffle, None if it is disabled.
+            weights (Optional[np.ndarray]): Weight of every choice in the weighted shuffle, None if it is disabled.
+            profiler (Optional[ComputeProfiler]): Profiler the compute is recorded into, None if the profiling is
+                disabled.
+
+        Returns:
+            bool: Success state of the operation.
+        """
+        length = len(choices)
+        order = state.epoch_order
+        if order is None or state.epoch_cursor == len(order) or len(order) != length:
+            generator = OgnSampleShuffle._rng(state).generator
+            state.permutations.rewind(generator)
+            if weights is not None:
+                order = state.epoch_order = weighted_permutation(generator, weights)
+            elif groups is not None:
+                order = state.epoch_order = block_permutation(generator, groups)
+            else:
+                order = state.epoch_order = index_permutation(generator, length)
+            state.epoch_cursor = 0
+            state.epoch += 1
 
-        db.outputs.samples = shuffled
+        index = int(order[state.epoch_cursor])
+        state.epoch_cursor += 1
+        if db.inputs.prefetchFrames > 0 and OgnSampleShuffle._has_paths(db, choices, choices_file):
+            used = order[state.epoch_cursor - 1 : state.epoch_cursor]
+            OgnSampleShuffle._prefetch_ahead(db, state, choices, choices_file, used, groups, weights)
+        db.outputs.elementIndex = index
+        db.outputs.epoch = state.epoch
+        # The element output is optional, it can't be written until its type is resolved from the choices.
+        if db.node.get_attribute("outputs:element").get_resolved_type().base_type != og.BaseDataType.UNKNOWN:
+            if choices_file is not None:
+                db.outputs.element = choices_file.element(index)
+            else:
+                db.outputs.element = OgnSampleShuffle._token_strings(db, choices_file, choices[index : index + 1])[0]
+            if profiler is not None:
+                profiler.record_bytes_copied(db.node.get_prim_path(), choices.itemsize * (choices.size // length))
         return True
 
+    @staticmethod
+    def _prefetch_ahead(  # pylint: disable=too-many-arguments
+        db: typing.Any,
+        state: OgnSampleShuffleInternalState,
+        choices: np.ndarray,
+        choices_file: typing.Optional[ChoicesFile],
+        permutation: np.ndarray,
+        groups: typing.Optional[np.ndarray],
+        weights: typing.Optional[np.ndarray],
+    ) -> None:
+        """
+        Records the paths used by the evaluation into `ASSET_PREFETCHER` and schedules the paths of the upcoming
+        evaluations, so `inputs:prefetchFrames` evaluations are scheduled ahead. A full permutation uses every choice in
+        every evaluation, so its window is counted in paths instead: the leading `inputs:prefetchFrames` samples of the
+        upcoming evaluations are scheduled, not the whole catalogue, and only the uses of the leading samples are
+        recorded, so the hit rate covers the prefetched window and the compute doesn't convert all the choices. The
+        upcoming permutations are drawn again when the seed or an input selecting the mode changes, the paths scheduled
+        before are cancelled then.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            choices (np.ndarray): Choices of the node.
+            choices_file (Optional[ChoicesFile]): Mapped choices file the choices come from, None if they come from
+                `inputs:choices`.
+            permutation (np.ndarray): Indices of the choices used by the evaluation.
+            groups (Optional[np.ndarray]): Group index of every choice in the block shuffle, None if it is disabled.
+            weights (Optional[np.ndarray]): Weight of every choice in the weighted shuffle, None if it is disabled.
+        """
+        inputs = db.inputs
+        node_path = db.node.get_prim_path()
+        # The lookahead holds the groups and the weights, so their ids can't be reused while it is alive.
+        key = (
+            state.rng,
+            len(choices),
+            inputs.prefetchFrames,
+            inputs.epochMode,
+            inputs.randomAccess,
+            inputs.scheduleFile,
+            inputs.numSamples,
+            inputs.randomKeys,
+            id(groups),
+            id(weights),
+        )
+        scheduled: typing.List[str] = []
+        if key != state.lookahead_key:
+            ASSET_PREFETCHER.cancel(node_path)
+            state.lookahead_paths.clear()
+            state.lookahead = OgnSampleShuffle._lookahead(db, state, len(choices), groups, weights)
+            state.lookahead_key = key
+        elif state.lookahead_paths:
+            scheduled = state.lookahead_paths.popleft()
+
+        # The scheduled paths are released after the use is recorded, otherwise their hits would be lost.
+        is_full = len(permutation) == len(choices)
+        if is_full:
+            permutation = permutation[: inputs.prefetchFrames]
+        ASSET_PREFETCHER.use(node_path, OgnSampleShuffle._paths(db, choices, choices_file, permutation))
+        ASSET_PREFETCHER.release(node_path, scheduled)
+        while len(state.lookahead_paths) < inputs.prefetchFrames:
+            window = inputs.prefetchFrames - sum(len(paths) for paths in state.lookahead_paths)
+            if is_full and window <= 0:
+                break
+            upcoming = next(state.lookahead, None)  # type: ignore
+            if upcoming is None:
+                break
+            if is_full:
+                upcoming = upcoming[:window]
+            paths = OgnSampleShuffle._paths(db, choices, choices_file, upcoming)
+            state.lookahead_paths.append(ASSET_PREFETCHER.prefetch(node_path, paths))
+
+    @staticmethod
+    def _lookahead(  # pylint: disable=too-many-locals,too-many-branches
+        db: typing.Any,
+        state: OgnSampleShuffleInternalState,
+        length: int,
+        groups: typing.Optional[np.ndarray],
+        weights: typing.Optional[np.ndarray],
+    ) -> typing.Iterator[np.ndarray]:
+        """
+        Draws the permutations of the upcoming evaluations as the compute will draw them. The sequential modes draw from
+        a copy of the node's generator, so the outputs don't depend on the lookahead.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state after the current evaluation.
+            length (int): Number of the choices.
+            groups (Optional[np.ndarray]): Group index of every choice in the block shuffle, None if it is disabled.
+            weights (Optional[np.ndarray]): Weight of every choice in the weighted shuffle, None if it is disabled.
+
+        Yields:
+            np.ndarray: Indices of the choices used by the next evaluation, the one after it and so on. The iteration
+                stops at the end of the schedule.
+        """
+        inputs = db.inputs
+        num_samples = inputs.numSamples
+        frame = state.frame
+        if inputs.epochMode:
+            generator = state.permutations.lookahead_generator(OgnSampleShuffle._rng(state).generator)
+            order, cursor = state.epoch_order, state.epoch_cursor
+            while True:
+                if cursor == len(order):  # type: ignore
+                    if weights is not None:
+                        order = weighted_permutation(generator, weights)
+                    elif groups is not None:
+                        order = block_permutation(generator, groups)
+                    else:
+                        order = index_permutation(generator, length)
+                    cursor = 0
+                yield order[cursor : cursor + 1]  # type: ignore
+                cursor += 1
+        elif inputs.scheduleFile:
+            schedule: Schedule = state.schedule  # type: ignore
+            while True:
+                try:
+                    permutation = schedule.row(frame)
+                except IndexError:
+                    return
+                yield permutation
+                frame += 1
+        elif inputs.randomAccess:
+            seed = RNG_POOL.effective_seed(inputs.seed)
+            node_id = OgnSampleShuffle._node_id(db, state)
+            while True:
+                if weights is not None:
+                    yield weighted_permutation(frame_generator(seed, node_id, frame), weights, num_samples)
+                elif groups is not None:
+                    permutation = block_permutation(frame_generator(seed, node_id, frame), groups)
+                    yield OgnSampleShuffle._truncate(permutation, num_samples)
+                else:
+                    yield frame_permutation(seed, node_id, frame, length, num_samples)
+                frame += 1
+        else:
+            generator = state.permutations.lookahead_generator(OgnSampleShuffle._rng(state).generator)
+            random_keys = inputs.randomKeys
+            while True:
+                if weights is not None:
+                    yield weighted_permutation(generator, weights, num_samples)
+                elif groups is not None:
+                    yield OgnSampleShuffle._truncate(block_permutation(generator, groups), num_samples)
+                elif random_keys:
+                    yield OgnSampleShuffle._truncate(random_key_permutation(generator, length), num_samples)
+                elif 0 <= num_samples < length:
+                    yield sample_indices(generator, length, num_samples)
+                else:
+                    yield index_permutation(generator, length)
+
+    @staticmethod
+    def batch_samples(db: typing.Any, samples: np.ndarray) -> None:
+        """
+        Writes the samples drawn for the node by `BATCH_EVALUATOR`.
+
+        Args:
+            db (Any): Database structure.
+            samples (np.ndarray): Samples of the full permutation of the choices returned by `batch_choices`.
+        """
+        num_samples = db.inputs.numSamples
+        samples = samples[:num_samples] if num_samples >= 0 else samples
+        db.outputs.samples = OgnSampleShuffle._token_strings(db, None, samples)
+
+    @staticmethod
+    def _has_paths(db: typing.Any, choices: np.ndarray, choices_file: typing.Optional[ChoicesFile]) -> bool:
+        """
+        Args:
+            db (Any): Database structure.
+            choices (np.ndarray): Choices of the node.
+            choices_file (Optional[ChoicesFile]): Mapped choices file the choices come from, None if they come from
+                `inputs:choices`.
+
+        Returns:
+            bool: True if the choices are asset paths, i.e. strings, tokens or token ids.
+        """
+        return choices.dtype.kind in ("O", "U", "S") or (db.inputs.tokenIds and choices_file is None)
+
+    @staticmethod
+    def _paths(
+        db: typing.Any, choices: np.ndarray, choices_file: typing.Optional[ChoicesFile], permutation: np.ndarray
+    ) -> typing.List[str]:
+        """
+        Args:
+            db (Any): Database structure.
+            choices (np.ndarray): String, token or token id choices of the node.
+            choices_file (Optional[ChoicesFile]): Mapped choices file the choices come from, None if they come from
+                `inputs:choices`.
+            permutation (np.ndarray): Indices of the choices.
+
+        Returns:
+            List[str]: Choices of the indices, i.e. the asset paths.
+        """
+        if choices_file is not None:
+            return [choices_file.element(int(index)) for index in permutation]
+        return [str(path) for path in OgnSampleShuffle._token_strings(db, choices_file, choices[permutation])]
+
+    @staticmethod
+    def _token_strings(db: typing.Any, choices_file: typing.Optional[ChoicesFile], samples: np.ndarray) -> np.ndarray:
+        """
+        Resolves the samples of the token ids mode into their tokens. The choices are read, shuffled and gathered as
+        ids, only the samples are resolved when they are written, and the resolved tokens are the strings held by
+        `PATH_TABLE`, so no string is decoded.
+
+        Args:
+            db (Any): Database structure.
+            choices_file (Optional[ChoicesFile]): Mapped choices file the samples come from, None if they come from
+                `inputs:choices`.
+            samples (np.ndarray): Samples of the node.
+
+        Returns:
+            np.ndarray: Object array of the tokens of the samples in the token ids mode, the samples otherwise.
+        """
+        if not db.inputs.tokenIds or choices_file is not None:
+            return samples
+        return PATH_TABLE.resolve_strings(samples)
+
+    @staticmethod
+    def _groups(db: typing.Any, state: OgnSampleShuffleInternalState, length: int) -> typing.Optional[np.ndarray]:
+        """
+        Returns the groups of the block shuffle. They are computed again only when the grouping inputs or the number of
+        the choices change.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            length (int): Number of the choices.
+
+        Returns:
+            Optional[np.ndarray]: Group index of every choice, None if the block shuffle is disabled.
+        """
+        group_keys = db.inputs.groupKeys
+        group_size = db.inputs.groupSize
+        if len(group_keys) == 0 and group_size < 2:
+            return None
+        cached = state.group_inputs
+        if cached is None or cached[:2] != (length, group_size) or not np.array_equal(cached[2], group_keys):
+            state.groups = group_ids(length, group_size, group_keys)
+            state.group_inputs = (length, group_size, np.array(group_keys, copy=True))
+        return state.groups
+
+    @staticmethod
+    def _weights(db: typing.Any, state: OgnSampleShuffleInternalState, length: int) -> typing.Optional[np.ndarray]:
+        """
+        Returns the weights of the weighted shuffle. They are validated again only when they or the number of the
+        choices change.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+            length (int): Number of the choices.
+
+        Raises:
+            ValueError: Raised if the weights are not valid for the choices, see `check_weights`.
+
+        Returns:
+            Optional[np.ndarray]: Weight of every choice, None if the weighted shuffle is disabled.
+        """
+        weights = db.inputs.weights
+        if len(weights) == 0:
+            return None
+        if state.weights is None or len(state.weights) != length or not np.array_equal(state.weights, weights):
+            state.weights = check_weights(weights, length)
+        return state.weights
+
+    @staticmethod
+    def _truncate(permutation: np.ndarray, num_samples: int) -> np.ndarray:
+        """
+        Args:
+            permutation (np.ndarray): Permutation of the choices.
+            num_samples (int): Number of the sampled elements, see `inputs:numSamples`.
+
+        Returns:
+            np.ndarray: First `num_samples` elements of the permutation, the whole permutation for negative values.
+        """
+        return permutation[:num_samples] if num_samples >= 0 else permutation
+
+    @staticmethod
+    def _choices_file(db: typing.Any, state: OgnSampleShuffleInternalState) -> typing.Optional[ChoicesFile]:
+        """
+        Returns the mapped choices file. The file is mapped again only when the path changes.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+
+        Returns:
+            Optional[ChoicesFile]: Choices file of `inputs:choicesFile`, None if the input is empty.
+        """
+        path = db.inputs.choicesFile
+        if not path:
+            state.choices_file = None
+        elif state.choices_file is None or state.choices_file.path != path:
+            state.choices_file = ChoicesFile(path)
+        return state.choices_file
+
+    @staticmethod
+    def _unresolved_attribute(db: typing.Any) -> typing.Optional[str]:
+        """
+        The extended attributes are optional in the node description, so the database doesn't check them and the node
+        skips the compute itself.
+
+        Args:
+            db (Any): Database structure.
+
+        Returns:
+            Optional[str]: Name of the first extended attribute whose type is not resolved, None if both are resolved.
+        """
+        if db.inputs.choices.type.base_type == og.BaseDataType.UNKNOWN:
+            return "inputs:choices"
+        if db.outputs.samples.type.base_type == og.BaseDataType.UNKNOWN:
+            return "outputs:samples"
+        return None
+
+    @staticmethod
+    def _compute_skipped(db: typing.Any, attribute_name: str) -> None:
+        """
+        Reports a compute skipped because of an unresolved extended attribute.
+
+        Args:
+            db (Any): Database structure.
+            attribute_name (str): Name of the unresolved attribute.
+        """
+        db.log_warning(f"Required extended attribute {attribute_name} is not resolved, compute skipped")
+        profiler = get_profiler()
+        if profiler is not None:
+            profiler.record_failure(db.node.get_prim_path(), f"{FAILURE_UNRESOLVED_PREFIX}{attribute_name}")
+
+    @staticmethod
+    def _node_id(db: typing.Any, state: OgnSampleShuffleInternalState) -> int:
+        """
+        Returns node id used for the RNG initialization. Replicator creates and sets the attribute together with the
+        node, so it is read once per node.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+
+        Returns:
+            int: Value of the `inputs:nodeId` attribute if the node has one, otherwise 0.
+        """
+        if state.node_id is None:
+            state.node_id = db.inputs.nodeId if db.node.get_attribute_exists("inputs:nodeId") else 0
+        return state.node_id
+
+    @staticmethod
+    def _rng(state: OgnSampleShuffleInternalState) -> PooledRNG:
+        """
+        Args:
+            state (OgnSampleShuffleInternalState): Internal state.
+
+        Raises:
+            ValueError: Raised if the substream was not acquired, i.e. the node has no valid seed.
+
+        Returns:
+            PooledRNG: Substream of the node.
+        """
+        if state.rng is None:
+            raise ValueError("Seed of the node is not set.")
+        return state.rng
+
+    @staticmethod
+    def _next_frame(db: typing.Any, state: OgnSampleShuffleInternalState) -> int:
+        """
+        Returns index of the evaluated frame and advances the node's evaluation counter.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleInternalState): Internal state.
+
+        Returns:
+            int: Value of `inputs:frame`, or the evaluation counter if the input is negative.
+        """
+        frame = db.inputs.frame if db.inputs.frame >= 0 else state.frame
+        state.frame = frame + 1
+        return frame
+
     @staticmethod
     def initialize(graph_context: typing.Any, node: typing.Any) -> None:  # pylint: disable=unused-argument
         """
@@ -81,21 +875,36 @@ class OgnSampleShuffle:
         """
         connected_function_callback = OgnSampleShuffle.on_connected_callback
         node.register_on_connected_callback(connected_function_callback)
+        node.register_on_disconnected_callback(OgnSampleShuffle.on_disconnected_callback)
 
     @staticmethod
     def on_connected_callback(upstream_attr: typing.Any, downstream_attr: typing.Any) -> None:
         """
-        Connected callback.
+        Connected callback. It resolves the extended attributes, so the nodes check the resolved types again.
 
         Args:
             upstream_attr (Any): N/A.
             downstream_attr (Any): N/A.
         """
+        OgnSampleShuffle.connection_changes += 1
         if downstream_attr.get_name() == "inputs:choices":
             if downstream_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
                 upstream_resolved_type = upstream_attr.get_resolved_type()
                 if upstream_resolved_type.base_type != og.BaseDataType.UNKNOWN:
                     downstream_attr.set_resolved_type(upstream_resolved_type)
+                    node = downstream_attr.get_node()
+                    # Samples mirror the choices, so the node can be evaluated in the index mode without a samples
+                    # consumer. Token ids are output as tokens.
+                    samples_type = upstream_resolved_type
+                    if node.get_attribute("inputs:tokenIds").get():
+                        samples_type = og.Type(og.BaseDataType.TOKEN, 1, 1)
+                    samples_attr = node.get_attribute("outputs:samples")
+                    if samples_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
+                        og.AttributeValueHelper(samples_attr).resolve_type(samples_type)
+                    element_attr = node.get_attribute("outputs:element")
+                    if element_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
+                        element_type = og.Type(samples_type.base_type, samples_type.tuple_count, 0, samples_type.role)
+                        og.AttributeValueHelper(element_attr).resolve_type(element_type)
 
         # Resolve output attr based on the downstream attr
         if upstream_attr.get_name() == "outputs:samples":
@@ -106,3 +915,16 @@ class OgnSampleShuffle:
                     node = upstream_attr.get_node()
                     choices_attr = node.get_attribute("inputs:choices")
                     og.AttributeValueHelper(upstream_attr).resolve_type(choices_attr.get_resolved_type())
+
+    @staticmethod
+    def on_disconnected_callback(  # pylint: disable=unused-argument
+        upstream_attr: typing.Any, downstream_attr: typing.Any
+    ) -> None:
+        """
+        Disconnected callback. The extended attributes may lose their resolved types, so the nodes check them again.
+
+        Args:
+            upstream_attr (Any): N/A.
+            downstream_attr (Any): N/A.
+        """
+        OgnSampleShuffle.connection_changes += 1
@@ -0,0 +1,159 @@
+# pylint: disable=invalid-name
+"""
+Implements aligned shuffling node.
+"""
+import typing
+import omni.graph.core as og
+from metron.ai.ardagen.permutation import OutputBuffers
+from metron.ai.ardagen.rng_pool import RNG_POOL, PooledRNG
+
+# Prefix of the dynamic attributes holding the aligned arrays following the first one.
+ALIGNED_CHOICES_PREFIX = "inputs:choices_"
+
+
+class OgnSampleShuffleAlignedInternalState:  # pylint: disable=too-few-public-methods
+    """
+    Node's internal state representation.
+    """
+
+    def __init__(self) -> None:
+        self.rng: typing.Optional[PooledRNG] = None
+        # Value of `inputs:nodeId`, read on the first use.
+        self.node_id: typing.Optional[int] = None
+        self.buffers = OutputBuffers()
+        # Output buffers of the dynamic arrays by the array index.
+        self.aligned_buffers: typing.Dict[int, OutputBuffers] = {}
+
+
+class OgnSampleShuffleAligned:
+    """
+    OGN Aligned Shuffling node.
+    """
+
+    @staticmethod
+    def internal_state() -> OgnSampleShuffleAlignedInternalState:
+        """
+        Returns internal state.
+
+        Returns:
+            OgnSampleShuffleAlignedInternalState: Internal state class instance.
+        """
+        return OgnSampleShuffleAlignedInternalState()
+
+    @staticmethod
+    def release(node: typing.Any) -> None:
+        """
+
+        Args:
+            node (og.Node): Node to be released.
+        """
+        RNG_POOL.release(node.get_prim_path())
+
+    @staticmethod
+    def compute(db: typing.Any) -> bool:
+        """
+        Compute method. One permutation is drawn like in the default mode of the SampleShuffle node and every aligned
+        array is gathered with it.
+
+        Args:
+            db (Any): Database structure.
+
+        Raises:
+            ValueError: Raised if the aligned arrays are not of the same length.
+
+        Returns:
+            bool: Success state of the operation.
+        """
+        state = db.internal_state
+        choices = db.inputs.choices.array_value()
+        length = len(choices)
+
+        if length == 0:
+            return False
+
+        aligned_indices = OgnSampleShuffleAligned._aligned_indices(db.node)
+        aligned_choices = [getattr(db.inputs, f"choices_{array_idx}") for array_idx in aligned_indices]
+        for array_idx, values in zip(aligned_indices, aligned_choices):
+            if len(values) != length:
+                raise ValueError(f"Array inputs:choices_{array_idx} has {len(values)} elements instead of {length}.")
+
+        is_seed_valid = db.inputs.seed is not None
+        is_seed_changed = (
+            state.rng is None
+            or db.inputs.seed != state.rng.seed
+            or (is_seed_valid and RNG_POOL.effective_seed(db.inputs.seed) != state.rng.effective_seed)
+        )
+        if is_seed_valid and is_seed_changed:
+            node_id = OgnSampleShuffleAligned._node_id(db, state)
+            state.rng = RNG_POOL.acquire(db.node.get_prim_path(), db.inputs.seed, node_id)
+
+        permutation = state.buffers.index_permutation(state.rng.generator, length)
+        db.outputs.permutation = permutation
+        db.outputs.samples = state.buffers.gather(choices, permutation)
+        for array_idx, values in zip(aligned_indices, aligned_choices):
+            buffers = state.aligned_buffers.setdefault(array_idx, OutputBuffers())
+            setattr(db.outputs, f"samples_{array_idx}", buffers.gather(values, permutation))
+        return True
+
+    @staticmethod
+    def _node_id(db: typing.Any, state: OgnSampleShuffleAlignedInternalState) -> int:
+        """
+        Returns node id used for the RNG initialization, as in the SampleShuffle node.
+
+        Args:
+            db (Any): Database structure.
+            state (OgnSampleShuffleAlignedInternalState): Internal state.
+
+        Returns:
+            int: Value of the `inputs:nodeId` attribute if the node has one, otherwise 0.
+        """
+        if state.node_id is None:
+            state.node_id = db.inputs.nodeId if db.node.get_attribute_exists("inputs:nodeId") else 0
+        return state.node_id
+
+    @staticmethod
+    def _aligned_indices(node: typing.Any) -> typing.List[int]:
+        """
+        Finds the dynamic aligned arrays of the node.
+
+        Args:
+            node (og.Node): Node.
+
+        Returns:
+            List[int]: Sorted indices `k` of the `inputs:choices_<k>` attributes.
+        """
+        names = [attribute.get_name() for attribute in node.get_attributes()]
+        return sorted(
+            int(name[len(ALIGNED_CHOICES_PREFIX) :]) for name in names if name.startswith(ALIGNED_CHOICES_PREFIX)
+        )
+
+    @staticmethod
+    def initialize(graph_context: typing.Any, node: typing.Any) -> None:  # pylint: disable=unused-argument
+        """
+        Init method.
+
+        Args:
+            graph_context (Any): Graph context.
+            node (Any): Node.
+        """
+        connected_function_callback = OgnSampleShuffleAligned.on_connected_callback
+        node.register_on_connected_callback(connected_function_callback)
+
+    @staticmethod
+    def on_connected_callback(upstream_attr: typing.Any, downstream_attr: typing.Any) -> None:
+        """
+        Connected callback. The samples of the first array are resolved to the type of its choices. The dynamic
+        attributes are typed already when they are created.
+
+        Args:
+            upstream_attr (Any): N/A.
+            downstream_attr (Any): N/A.
+        """
+        if downstream_attr.get_name() == "inputs:choices":
+            if downstream_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
+                upstream_resolved_type = upstream_attr.get_resolved_type()
+                if upstream_resolved_type.base_type != og.BaseDataType.UNKNOWN:
+                    downstream_attr.set_resolved_type(upstream_resolved_type)
+                    samples_attr = downstream_attr.get_node().get_attribute("outputs:samples")
+                    if samples_attr.get_resolved_type().base_type == og.BaseDataType.UNKNOWN:
+                        og.AttributeValueHelper(samples_attr).resolve_type(upstream_resolved_type)
@@ -24,6 +24,102 @@ class TestOgn(ogts.OmniGraphTestCase):
             test_type = "USD Load" if usd_test else "Database Access"
             return f"{node_type_name} {test_type} Test - {attribute.get_name()} value error"
 
+        self.assertTrue(test_node.get_attribute_exists("inputs:batchSize"))
+        attribute = test_node.get_attribute("inputs:batchSize")
+        db_value = database.inputs.batchSize
+        expected_value = 1
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:choicesFile"))
+        attribute = test_node.get_attribute("inputs:choicesFile")
+        db_value = database.inputs.choicesFile
+        expected_value = ""
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:epochMode"))
+        attribute = test_node.get_attribute("inputs:epochMode")
+        db_value = database.inputs.epochMode
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:frame"))
+        attribute = test_node.get_attribute("inputs:frame")
+        db_value = database.inputs.frame
+        expected_value = -1
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:groupKeys"))
+        attribute = test_node.get_attribute("inputs:groupKeys")
+        db_value = database.inputs.groupKeys
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:groupSize"))
+        attribute = test_node.get_attribute("inputs:groupSize")
+        db_value = database.inputs.groupSize
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:indexMode"))
+        attribute = test_node.get_attribute("inputs:indexMode")
+        db_value = database.inputs.indexMode
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:numSamples"))
+        attribute = test_node.get_attribute("inputs:numSamples")
+        db_value = database.inputs.numSamples
+        expected_value = -1
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:prefetchFrames"))
+        attribute = test_node.get_attribute("inputs:prefetchFrames")
+        db_value = database.inputs.prefetchFrames
+        expected_value = 0
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:randomAccess"))
+        attribute = test_node.get_attribute("inputs:randomAccess")
+        db_value = database.inputs.randomAccess
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:randomKeys"))
+        attribute = test_node.get_attribute("inputs:randomKeys")
+        db_value = database.inputs.randomKeys
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:scheduleFile"))
+        attribute = test_node.get_attribute("inputs:scheduleFile")
+        db_value = database.inputs.scheduleFile
+        expected_value = ""
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
         self.assertTrue(test_node.get_attribute_exists("inputs:seed"))
         attribute = test_node.get_attribute("inputs:seed")
         db_value = database.inputs.seed
@@ -31,3 +127,31 @@ class TestOgn(ogts.OmniGraphTestCase):
         actual_value = og.Controller.get(attribute)
         ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
         ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:tokenIds"))
+        attribute = test_node.get_attribute("inputs:tokenIds")
+        db_value = database.inputs.tokenIds
+        expected_value = False
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:weights"))
+        attribute = test_node.get_attribute("inputs:weights")
+        db_value = database.inputs.weights
+        expected_value = []
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:elementIndex"))
+        attribute = test_node.get_attribute("outputs:elementIndex")
+        db_value = database.outputs.elementIndex
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:epoch"))
+        attribute = test_node.get_attribute("outputs:epoch")
+        db_value = database.outputs.epoch
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:permutation"))
+        attribute = test_node.get_attribute("outputs:permutation")
+        db_value = database.outputs.permutation
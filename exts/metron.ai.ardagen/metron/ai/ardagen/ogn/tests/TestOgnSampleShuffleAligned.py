@@ -0,0 +1,37 @@
+import omni.kit.test  # flake8:
+import omni.graph.core as og
+import omni.graph.core.tests as ogts
+import os
+
+
+class TestOgn(ogts.OmniGraphTestCase):
+    async def test_data_access(self):
+        from metron.ai.ardagen.ogn.OgnSampleShuffleAlignedDatabase import OgnSampleShuffleAlignedDatabase
+
+        test_file_name = "OgnSampleShuffleAlignedTemplate.usda"
+        usd_path = os.path.join(os.path.dirname(__file__), "usd", test_file_name)
+        if not os.path.exists(usd_path):
+            self.assertTrue(False, f"{usd_path} not found for loading test")
+        (result, error) = await ogts.load_test_file(usd_path)
+        self.assertTrue(result, f"{error} on {usd_path}")
+        test_node = og.Controller.node("/TestGraph/Template_metron_ai_ardagen_SampleShuffleAligned")
+        database = OgnSampleShuffleAlignedDatabase(test_node)
+        self.assertTrue(test_node.is_valid())
+        node_type_name = test_node.get_type_name()
+        self.assertEqual(og.GraphRegistry().get_node_type_version(node_type_name), 1)
+
+        def _attr_error(attribute: og.Attribute, usd_test: bool) -> str:
+            test_type = "USD Load" if usd_test else "Database Access"
+            return f"{node_type_name} {test_type} Test - {attribute.get_name()} value error"
+
+        self.assertTrue(test_node.get_attribute_exists("inputs:seed"))
+        attribute = test_node.get_attribute("inputs:seed")
+        db_value = database.inputs.seed
+        expected_value = -1
+        actual_value = og.Controller.get(attribute)
+        ogts.verify_values(expected_value, actual_value, _attr_error(attribute, True))
+        ogts.verify_values(expected_value, db_value, _attr_error(attribute, False))
+
+        self.assertTrue(test_node.get_attribute_exists("outputs:permutation"))
+        attribute = test_node.get_attribute("outputs:permutation")
+        db_value = database.outputs.permutation
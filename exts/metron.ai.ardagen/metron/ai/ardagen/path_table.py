@@ -0,0 +1,123 @@
+"""
+Implements the interned prim path table of the extension.
+
+There is no OmniGraph base type for paths, so the distributions can shuffle `uint64` handles into the table instead of
+path strings. Every path is stored once per table and the downstream consumers resolve the handles in bulk into cached
+`Sdf.Path` objects, so there is no per-frame string creation and parsing.
+
+Token choices are interned into the same table, so the shuffling node reads and permutes them as integer ids, see
+`OgnSampleShuffle`'s `inputs:tokenIds`.
+"""
+import typing
+import numpy as np
+from pxr import Sdf
+
+# Dtype of the handles, it matches the `uint64[]` OmniGraph type.
+HANDLE_DTYPE = np.uint64
+# Handle which doesn't refer to any path, e.g. the default value of an unwritten output.
+INVALID_HANDLE = 0
+
+
+class PathTable:
+    """
+    Append-only table of interned prim paths. Handles stay valid until the table is cleared.
+    """
+
+    def __init__(self) -> None:
+        self._handles: typing.Dict[str, int] = {}
+        # Path strings and resolved paths by the handle, the invalid handle resolves to an empty path. Paths interned
+        # as strings are parsed on their first resolution, so the tokens don't pay for it.
+        self._strings: typing.List[str] = [""]
+        self._paths: typing.List[typing.Any] = [Sdf.Path()]
+        # Object arrays of `_strings` and `_paths` for the bulk resolution, rebuilt when the table grows.
+        self._string_array: typing.Optional[np.ndarray] = None
+        self._path_array: typing.Optional[np.ndarray] = None
+
+    def intern(self, paths: typing.Iterable[typing.Any]) -> np.ndarray:
+        """
+        Puts the paths into the table.
+
+        Args:
+            paths (Iterable[Any]): Paths as `Sdf.Path` objects or strings. The `Sdf.Path` objects are kept and returned
+                by `resolve`.
+
+        Returns:
+            np.ndarray: Handle of every path.
+        """
+        handles = []
+        for path in paths:
+            path_string = path.pathString if isinstance(path, Sdf.Path) else path
+            handle = self._handles.get(path_string)
+            if handle is None:
+                handle = self._handles[path_string] = len(self._strings)
+                self._strings.append(path_string)
+                self._paths.append(path if isinstance(path, Sdf.Path) else None)
+                self._string_array = self._path_array = None
+            handles.append(handle)
+        return np.array(handles, dtype=HANDLE_DTYPE)
+
+    def resolve(self, handles: typing.Any) -> np.ndarray:
+        """
+        Resolves the handles into paths.
+
+        Args:
+            handles (Any): Array-like handles.
+
+        Raises:
+            IndexError: Raised if a handle is not in the table.
+
+        Returns:
+            np.ndarray: Object array of the `Sdf.Path` objects.
+        """
+        if self._path_array is None:
+            self._paths = [
+                Sdf.Path(string) if path is None else path for string, path in zip(self._strings, self._paths)
+            ]
+            self._path_array = _object_array(self._paths)
+        return np.take(self._path_array, np.asarray(handles, dtype=np.intp))
+
+    def resolve_strings(self, handles: typing.Any) -> np.ndarray:
+        """
+        Resolves the handles into path strings.
+
+        Args:
+            handles (Any): Array-like handles.
+
+        Raises:
+            IndexError: Raised if a handle is not in the table.
+
+        Returns:
+            np.ndarray: Object array of the path strings.
+        """
+        if self._string_array is None:
+            self._string_array = _object_array(self._strings)
+        return np.take(self._string_array, np.asarray(handles, dtype=np.intp))
+
+    def clear(self) -> None:
+        """
+        Drops all paths, the issued handles become invalid.
+        """
+        self._handles.clear()
+        del self._strings[1:]
+        del self._paths[1:]
+        self._string_array = self._path_array = None
+
+    def __len__(self) -> int:
+        return len(self._strings) - 1
+
+
+def _object_array(values: typing.List[typing.Any]) -> np.ndarray:
+    """
+    Args:
+        values (List[Any]): Values.
+
+    Returns:
+        np.ndarray: One dimensional object array of the values, the values are not unpacked by NumPy.
+    """
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+# Table shared by the distributions of the extension.
+PATH_TABLE = PathTable()
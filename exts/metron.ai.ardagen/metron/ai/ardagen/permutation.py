@@ -0,0 +1,437 @@
+"""
+Implements NumPy permutation kernels used by the ArDaGen shuffling nodes.
+"""
+import typing
+import numpy as np
+
+# Index dtype used for the permutation arrays. It matches the `int[]` OmniGraph type of `outputs:permutation`.
+INDEX_DTYPE = np.int32
+
+_UINT64_MASK = (1 << 64) - 1
+
+
+def index_permutation(generator: np.random.Generator, length: int) -> np.ndarray:
+    """
+    Shuffles an index array instead of the payload.
+
+    The generator draws are the same as for shuffling a payload of the same length along the first axis, so
+    `gather(choices, index_permutation(generator, len(choices)))` is bit-identical to `generator.shuffle` of a copy.
+
+    Args:
+        generator (np.random.Generator): Generator used for the shuffling.
+        length (int): Number of the elements to be permuted.
+
+    Raises:
+        ValueError: Raised if the length doesn't fit into the index dtype.
+
+    Returns:
+        np.ndarray: Permutation of the `[0, length)` indices.
+    """
+    if length > np.iinfo(INDEX_DTYPE).max:
+        raise ValueError(f"Length {length} exceeds the maximal supported number of elements.")
+    indices = np.arange(length, dtype=INDEX_DTYPE)
+    generator.shuffle(indices)
+    return indices
+
+
+def sample_indices(generator: np.random.Generator, length: int, num_samples: int) -> np.ndarray:
+    """
+    Draws `num_samples` distinct indices in a random order, i.e. the first elements of a random permutation.
+
+    NumPy uses Floyd's sampling for small samples and a partial Fisher-Yates shuffle otherwise, so the cost depends on
+    `num_samples` rather than on `length`. Negative values and values not less than `length` produce the full
+    permutation with the same draws as `index_permutation`.
+
+    Args:
+        generator (np.random.Generator): Generator used for the sampling.
+        length (int): Number of the elements to be sampled from.
+        num_samples (int): Number of the sampled elements.
+
+    Returns:
+        np.ndarray: Sampled indices.
+    """
+    if num_samples < 0 or num_samples >= length:
+        return index_permutation(generator, length)
+    return generator.choice(length, size=num_samples, replace=False).astype(INDEX_DTYPE, copy=False)
+
+
+def frame_generator(seed: int, node_id: int, frame: int) -> np.random.Generator:
+    """
+    Creates a counter-based generator of the given frame.
+
+    The Philox key is derived from the seed and the node id and the frame index is put into the upper counter words.
+    Every frame has its own independent stream, so any frame can be regenerated without replaying the previous ones.
+
+    Args:
+        seed (int): Seed of the sampling.
+        node_id (int): Id of the node.
+        frame (int): Index of the frame.
+
+    Returns:
+        np.random.Generator: Generator of the frame.
+    """
+    key = (seed & _UINT64_MASK) | ((node_id & _UINT64_MASK) << 64)
+    counter = (frame & _UINT64_MASK) << 128
+    return np.random.Generator(np.random.Philox(key=key, counter=counter))
+
+
+def frame_permutation(seed: int, node_id: int, frame: int, length: int, num_samples: int = -1) -> np.ndarray:
+    """
+    Computes the permutation of the given frame directly, see `frame_generator`.
+
+    Args:
+        seed (int): Seed of the sampling.
+        node_id (int): Id of the node.
+        frame (int): Index of the frame.
+        length (int): Number of the elements to be permuted.
+        num_samples (int): Number of the sampled elements, see `sample_indices`. Defaults to all elements.
+
+    Returns:
+        np.ndarray: Permutation of the frame.
+    """
+    return sample_indices(frame_generator(seed, node_id, frame), length, num_samples)
+
+
+def group_ids(length: int, group_size: int = 0, group_keys: typing.Any = None) -> typing.Optional[np.ndarray]:
+    """
+    Assigns the elements to the groups of the block shuffle.
+
+    Args:
+        length (int): Number of the elements.
+        group_size (int): Size of the contiguous groups of the elements. Values less than 2 disable the grouping by
+            size.
+        group_keys (Any): Array-like group key of every element, e.g. an asset id. Elements with the same key form a
+            group. It takes precedence over `group_size` if not empty.
+
+    Raises:
+        ValueError: Raised if the number of the keys doesn't match the number of the elements.
+
+    Returns:
+        Optional[np.ndarray]: Group index of every element, None if the block shuffle is disabled.
+    """
+    if group_keys is not None and len(group_keys) > 0:
+        if len(group_keys) != length:
+            raise ValueError(
+                f"Number of the group keys {len(group_keys)} doesn't match the number of elements {length}."
+            )
+        return np.unique(np.asarray(group_keys), return_inverse=True)[1].reshape(length)
+    if group_size > 1:
+        return np.arange(length) // group_size
+    return None
+
+
+def block_permutation(generator: np.random.Generator, groups: np.ndarray) -> np.ndarray:
+    """
+    Shuffles the order of the groups and the order of the elements within every group, so the elements of a group stay
+    adjacent. Larger groups trade the randomness for the reuse of the loaded assets across consecutive samples.
+
+    Args:
+        generator (np.random.Generator): Generator used for the shuffling.
+        groups (np.ndarray): Group index of every element, see `group_ids`.
+
+    Returns:
+        np.ndarray: Permutation of the `[0, len(groups))` indices.
+    """
+    group_rank = generator.permutation(int(groups.max()) + 1)
+    within = generator.permutation(len(groups))
+    # The stable sort by the group rank keeps the random order of the elements within the groups.
+    return within[np.argsort(group_rank[groups[within]], kind="stable")].astype(INDEX_DTYPE)
+
+
+def check_weights(weights: typing.Any, length: int) -> np.ndarray:
+    """
+    Validates the weights of the weighted shuffle.
+
+    Args:
+        weights (Any): Array-like weight of every element.
+        length (int): Number of the elements.
+
+    Raises:
+        ValueError: Raised if the number of the weights doesn't match the number of the elements, if a weight is
+            negative or not finite, or if no weight is positive.
+
+    Returns:
+        np.ndarray: Float64 copy of the weights.
+    """
+    weights = np.array(weights, dtype=np.float64)
+    if weights.shape != (length,):
+        raise ValueError(f"Number of the weights {weights.size} doesn't match the number of elements {length}.")
+    if not np.all(np.isfinite(weights)) or np.any(weights < 0):
+        raise ValueError("Weights have to be finite and non-negative.")
+    if not np.any(weights > 0):
+        raise ValueError("At least one weight has to be positive.")
+    return weights
+
+
+def weighted_permutation(generator: np.random.Generator, weights: np.ndarray, num_samples: int = -1) -> np.ndarray:
+    """
+    Draws a weighted random order by the Efraimidis-Spirakis key sort. Every element gets the key `E / w`, where `E`
+    is drawn from the standard exponential distribution (i.e. `-log(u)`), and the elements are ordered by the
+    ascending keys. The first `k` elements are a weighted sample without replacement, so the weighting doesn't need
+    repeated choices and the cost is O(n log n) over the unique elements. Elements of zero weight follow all the others
+    in their original order.
+
+    Args:
+        generator (np.random.Generator): Generator the keys are drawn from.
+        weights (np.ndarray): Non-negative weight of every element, see `check_weights`.
+        num_samples (int): Number of the sampled elements. Only the smallest keys are sorted then, O(n + k log k).
+            Negative values and values not less than the number of the elements produce the whole order.
+
+    Returns:
+        np.ndarray: Indices of the elements in the weighted random order.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        keys = generator.standard_exponential(len(weights)) / weights
+    if 0 <= num_samples < len(weights):
+        if num_samples == 0:
+            return np.empty(0, dtype=INDEX_DTYPE)
+        candidates = np.argpartition(keys, num_samples - 1)[:num_samples]
+        return candidates[np.argsort(keys[candidates], kind="stable")].astype(INDEX_DTYPE)
+    return np.argsort(keys, kind="stable").astype(INDEX_DTYPE)
+
+
+def random_key_permutation(generator: np.random.Generator, length: int) -> np.ndarray:
+    """
+    Draws a permutation as the stable argsort of `length` uniform random keys. Unlike `index_permutation`, the
+    permutations of many generators are computed by a single sort, see `random_key_permutations`.
+
+    Args:
+        generator (np.random.Generator): Generator the keys are drawn from.
+        length (int): Number of the elements to be permuted.
+
+    Returns:
+        np.ndarray: Permutation of the `[0, length)` indices.
+    """
+    return np.argsort(generator.random(length), kind="stable").astype(INDEX_DTYPE)
+
+
+def random_key_permutations(generators: typing.Sequence[np.random.Generator], length: int) -> np.ndarray:
+    """
+    Draws the `random_key_permutation` of every generator at once. Every generator fills its own row of a
+    (generators x length) key matrix, which is sorted along the rows in one call, so the rows are bit-identical to the
+    permutations drawn one by one.
+
+    Args:
+        generators (Sequence[np.random.Generator]): Generators the keys are drawn from.
+        length (int): Number of the elements to be permuted.
+
+    Returns:
+        np.ndarray: Permutation of the `[0, length)` indices in every row.
+    """
+    keys = np.empty((len(generators), length))
+    for row, generator in zip(keys, generators):
+        generator.random(out=row)
+    return np.argsort(keys, axis=1, kind="stable").astype(INDEX_DTYPE)
+
+
+def gather(choices: typing.Any, permutation: np.ndarray) -> np.ndarray:
+    """
+    Gathers the payload in the order given by the permutation.
+
+    Args:
+        choices (Any): Array-like payload. Tuple valued elements are stored along the second axis.
+        permutation (np.ndarray): Indices of the elements to be gathered.
+
+    Returns:
+        np.ndarray: Gathered payload.
+    """
+    return np.take(choices, permutation, axis=0)
+
+
+class OutputBuffers:
+    """
+    Arrays of a node reused across the evaluations, so the steady state frames don't allocate.
+
+    The arrays are reallocated only when the length, the element shape or the dtype of the choices change. Indices are
+    kept as `np.intp`, because `np.take` converts other index types into a temporary array.
+    """
+
+    def __init__(self) -> None:
+        self._arrays: typing.Dict[str, np.ndarray] = {}
+        self._identity: typing.Optional[np.ndarray] = None
+
+    def array(self, name: str, shape: typing.Tuple[int, ...], dtype: typing.Any) -> np.ndarray:
+        """
+        Returns a reused array.
+
+        Args:
+            name (str): Name of the array.
+            shape (Tuple[int, ...]): Shape of the array.
+            dtype (Any): Dtype of the array.
+
+        Returns:
+            np.ndarray: Array of the name, its content is undefined if it was reallocated.
+        """
+        array = self._arrays.get(name)
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = self._arrays[name] = np.empty(shape, dtype=dtype)
+        return array
+
+    def index_permutation(self, generator: np.random.Generator, length: int) -> np.ndarray:
+        """
+        Shuffles a reused index array with the same draws as `index_permutation`.
+
+        Args:
+            generator (np.random.Generator): Generator used for the shuffling.
+            length (int): Number of the elements to be permuted.
+
+        Raises:
+            ValueError: Raised if the length doesn't fit into the index dtype.
+
+        Returns:
+            np.ndarray: Permutation of the `[0, length)` indices. It is valid until the next call.
+        """
+        if length > np.iinfo(INDEX_DTYPE).max:
+            raise ValueError(f"Length {length} exceeds the maximal supported number of elements.")
+        if self._identity is None or len(self._identity) != length:
+            self._identity = np.arange(length, dtype=np.intp)
+        indices = self.array("indices", (length,), np.intp)
+        np.copyto(indices, self._identity)
+        generator.shuffle(indices)
+        return indices
+
+    def gather(self, choices: typing.Any, permutation: np.ndarray) -> np.ndarray:
+        """
+        Gathers the payload into a reused array, see `gather`.
+
+        Args:
+            choices (Any): Array-like payload. Tuple valued elements are stored along the second axis.
+            permutation (np.ndarray): Indices of the elements to be gathered.
+
+        Returns:
+            np.ndarray: Gathered payload. It is valid until the next call.
+        """
+        choices = np.asarray(choices)
+        if permutation.dtype != np.intp:
+            indices = self.array("gather_indices", permutation.shape, np.intp)
+            np.copyto(indices, permutation)
+            permutation = indices
+        samples = self.array("samples", permutation.shape + choices.shape[1:], choices.dtype)
+        # The indices are valid, so the clipping changes nothing, but unlike the default mode it doesn't buffer `out`.
+        return np.take(choices, permutation, axis=0, out=samples, mode="clip")
+
+    def clear(self) -> None:
+        """
+        Drops the arrays.
+        """
+        self._arrays.clear()
+        self._identity = None
+
+
+class PermutationBuffer:
+    """
+    Ring buffer of precomputed index permutations.
+
+    The permutations are generated in bulk by a single `Generator.permuted` call over a tiled index matrix. Its rows are
+    shuffled one after another with the same draws as `index_permutation`, so the produced sequence doesn't depend on
+    the buffer capacity.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: typing.Optional[np.ndarray] = None
+        self._identity: typing.Optional[np.ndarray] = None
+        self._cursor = 0
+        self._generator_state: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+    def next(self, generator: np.random.Generator, length: int, capacity: int) -> np.ndarray:
+        """
+        Pops the next permutation. The buffer is refilled in bulk when it runs out.
+
+        Args:
+            generator (np.random.Generator): Generator used for the shuffling.
+            length (int): Number of the elements to be permuted.
+            capacity (int): Number of the permutations precomputed at once. Values less than 2 disable the buffering.
+
+        Returns:
+            np.ndarray: Permutation of the `[0, length)` indices. It is a view valid until the next call.
+        """
+        if capacity < 2:
+            self.rewind(generator)
+            return index_permutation(generator, length)
+
+        if self._buffer is not None and self._buffer.shape != (capacity, length):
+            self.rewind(generator)
+        if self._buffer is None or self._cursor == len(self._buffer):
+            self._refill(generator, length, capacity)
+
+        permutation = self._buffer[self._cursor]  # type: ignore
+        self._cursor += 1
+        return permutation
+
+    def rewind(self, generator: np.random.Generator) -> None:
+        """
+        Drops the buffered permutations and puts the generator into the state as if only the already popped permutations
+        were drawn.
+
+        Args:
+            generator (np.random.Generator): Generator the buffer was filled from.
+        """
+        if self._buffer is None:
+            return
+
+        self._replay(generator)
+        self.clear()
+
+    def lookahead_generator(self, generator: np.random.Generator) -> np.random.Generator:
+        """
+        Copies the generator in the state `rewind` would put it into, so the upcoming permutations can be drawn ahead
+        without touching the buffer and the generator.
+
+        Args:
+            generator (np.random.Generator): Generator the buffer was filled from.
+
+        Returns:
+            np.random.Generator: Independent copy of the generator.
+        """
+        copy = np.random.Generator(type(generator.bit_generator)())
+        copy.bit_generator.state = generator.bit_generator.state
+        self._replay(copy)
+        return copy
+
+    def _replay(self, generator: np.random.Generator) -> None:
+        """
+        Puts the generator into the state after the already popped permutations of the buffer.
+
+        Args:
+            generator (np.random.Generator): Generator the buffer was filled from or its copy.
+        """
+        if self._buffer is None or self._generator_state is None or self._cursor == len(self._buffer):
+            return
+        generator.bit_generator.state = self._generator_state
+        if self._cursor > 0:
+            consumed = np.tile(np.arange(self._buffer.shape[1], dtype=INDEX_DTYPE), (self._cursor, 1))
+            generator.permuted(consumed, axis=1, out=consumed)
+
+    def clear(self) -> None:
+        """
+        Drops the buffered permutations. Used when the generator is reinitialized.
+        """
+        self._buffer = None
+        self._cursor = 0
+        self._generator_state = None
+
+    def _refill(self, generator: np.random.Generator, length: int, capacity: int) -> None:
+        """
+        Precomputes `capacity` permutations with one vectorized call.
+
+        Args:
+            generator (np.random.Generator): Generator used for the shuffling.
+            length (int): Number of the elements to be permuted.
+            capacity (int): Number of the permutations.
+
+        Raises:
+            ValueError: Raised if the length doesn't fit into the index dtype.
+        """
+        if length > np.iinfo(INDEX_DTYPE).max:
+            raise ValueError(f"Length {length} exceeds the maximal supported number of elements.")
+        if self._buffer is None or self._buffer.shape != (capacity, length):
+            self._buffer = np.empty((capacity, length), dtype=INDEX_DTYPE)
+
+        if self._identity is None or len(self._identity) != length:
+            self._identity = np.arange(length, dtype=INDEX_DTYPE)
+
+        # The stubs declare a read-only mapping, but the getter returns a new dict which is owned here.
+        self._generator_state = dict(generator.bit_generator.state)
+        self._buffer[:] = self._identity
+        generator.permuted(self._buffer, axis=1, out=self._buffer)
+        self._cursor = 0
@@ -0,0 +1,291 @@
+"""
+Implements the lookahead prefetch of the asset files used by the upcoming frames.
+
+The SampleShuffle output is determined by the seed, so a node with `inputs:prefetchFrames` knows the asset paths of its
+next evaluations before they are rendered. It schedules them into `ASSET_PREFETCHER`, whose bounded thread pool reads
+the files ahead (into the OS page cache by default, or by a pluggable loader). The bytes read ahead and not used yet are
+limited by a memory budget, the pending reads of a node are cancelled when its seed changes. Every path a node uses in
+its prefetch window is recorded as a hit if it was loaded ahead, so the hit rate shows whether the prefetch keeps up
+with the renderer.
+The prefetcher is driven from the compute thread, which doesn't touch the file system. The worker threads stat the
+scheduled paths, reserve their bytes in the memory budget and load them.
+"""
+import os
+import threading
+import typing
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Loader of a path. It gets a callable telling whether the load was cancelled and returns the number of loaded bytes.
+Loader = typing.Callable[[str, typing.Callable[[], bool]], int]
+
+
+def read_ahead(path: str, is_cancelled: typing.Callable[[], bool]) -> int:
+    """
+    Default loader which reads the file in chunks, so it is in the OS page cache when the renderer opens it.
+
+    Args:
+        path (str): Path of the file.
+        is_cancelled (Callable[[], bool]): Returns True if the read should stop.
+
+    Returns:
+        int: Number of the read bytes.
+    """
+    buffer = bytearray(READ_CHUNK_SIZE)
+    loaded = 0
+    with open(path, "rb", buffering=0) as asset_file:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(asset_file.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        while not is_cancelled():
+            read = asset_file.readinto(buffer)  # type: ignore
+            if not read:
+                break
+            loaded += read
+    return loaded
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    """
+    Path scheduled by a node.
+    """
+
+    __slots__ = ("size", "uses", "future", "cancelled", "loaded")
+
+    def __init__(self) -> None:
+        # Bytes reserved in the memory budget, set by the worker thread before the load.
+        self.size = 0
+        # Number of the scheduled evaluations which use the path and weren't released yet.
+        self.uses = 1
+        self.future: typing.Optional[Future] = None
+        self.cancelled = False
+        # The path was loaded, i.e. it exists and it fit into the memory budget.
+        self.loaded = False
+
+
+class AssetPrefetcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Bounded thread pool reading the asset files ahead of their use. The paths are scheduled and used per owner, usually
+    the node path, so the owners are cancelled independently.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        loader: typing.Optional[Loader] = None,
+    ) -> None:
+        """
+        Args:
+            max_workers (int): Number of the loading threads.
+            memory_budget (int): Maximal number of the bytes scheduled and not used yet.
+            loader (Optional[Loader]): Loader of the paths, `read_ahead` is used if None.
+        """
+        self._lock = threading.Lock()
+        self._entries: typing.Dict[typing.Tuple[str, str], _Entry] = {}
+        self._executor: typing.Optional[ThreadPoolExecutor] = None
+        self.max_workers = max_workers
+        self.memory_budget = memory_budget
+        self.loader: Loader = loader or read_ahead
+        self.pending_bytes = 0
+        self.reset_stats()
+
+    def configure(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        loader: typing.Optional[Loader] = None,
+    ) -> None:
+        """
+        Cancels all scheduled paths and applies a new configuration.
+
+        Args:
+            max_workers (int): Number of the loading threads.
+            memory_budget (int): Maximal number of the bytes scheduled and not used yet.
+            loader (Optional[Loader]): Loader of the paths, `read_ahead` is used if None.
+        """
+        self.shutdown()
+        self.max_workers = max_workers
+        self.memory_budget = memory_budget
+        self.loader = loader or read_ahead
+
+    def prefetch(self, owner: str, paths: typing.Iterable[typing.Any]) -> typing.List[str]:
+        """
+        Schedules the paths used by an upcoming evaluation. Paths already scheduled by the owner are loaded once. The
+        worker threads skip the missing files and the paths which don't fit into the memory budget.
+
+        Args:
+            owner (str): Owner of the paths, usually the node path.
+            paths (Iterable[Any]): Paths, they are converted by `str`.
+
+        Returns:
+            List[str]: Scheduled paths, they are passed to `release` after the evaluation.
+        """
+        scheduled = []
+        for path in paths:
+            path = str(path)
+            entry = self._entries.get((owner, path))
+            if entry is not None:
+                entry.uses += 1
+                scheduled.append(path)
+                continue
+            entry = self._entries[(owner, path)] = _Entry()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="metron.ai.ardagen.prefetch")
+            entry.future = self._executor.submit(self._load, path, entry)
+            self.scheduled += 1
+            scheduled.append(path)
+        return scheduled
+
+    def use(self, owner: str, paths: typing.Iterable[typing.Any]) -> None:
+        """
+        Records the paths used by an evaluation. A path is a hit if it was loaded before the use, a path still being
+        loaded is a late miss.
+
+        Args:
+            owner (str): Owner of the paths, usually the node path.
+            paths (Iterable[Any]): Used paths, they are converted by `str`.
+        """
+        for path in paths:
+            entry = self._entries.get((owner, str(path)))
+            future: typing.Optional[Future] = entry.future if entry is not None else None
+            if future is not None and future.done() and entry.loaded:  # type: ignore
+                self.hits += 1
+                continue
+            self.misses += 1
+            if future is not None and not future.done():
+                self.late += 1
+
+    def release(self, owner: str, paths: typing.Iterable[str]) -> None:
+        """
+        Releases the paths scheduled for an evaluation which was done. Paths not scheduled for other evaluations are
+        dropped and their bytes are returned to the memory budget.
+
+        Args:
+            owner (str): Owner of the paths, usually the node path.
+            paths (Iterable[str]): Paths returned by `prefetch`.
+        """
+        for path in paths:
+            key = (owner, path)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            entry.uses -= 1
+            if entry.uses == 0:
+                del self._entries[key]
+                with self._lock:
+                    # A load which didn't start yet isn't needed anymore.
+                    entry.cancelled = True
+                    self.pending_bytes -= entry.size
+
+    def cancel(self, owner: typing.Optional[str] = None) -> int:
+        """
+        Cancels the scheduled paths of an owner. Queued loads are dropped and the running ones stop at the next chunk.
+
+        Args:
+            owner (Optional[str]): Owner of the paths, all owners if None.
+
+        Returns:
+            int: Number of the cancelled paths.
+        """
+        keys = [key for key in self._entries if owner is None or key[0] == owner]
+        for key in keys:
+            entry = self._entries.pop(key)
+            entry.future.cancel()  # type: ignore
+            with self._lock:
+                entry.cancelled = True
+                self.pending_bytes -= entry.size
+        self.cancelled += len(keys)
+        return len(keys)
+
+    def wait(self) -> None:
+        """
+        Waits until the scheduled loads finish.
+        """
+        for entry in list(self._entries.values()):
+            if entry.future is not None and not entry.future.cancelled():
+                entry.future.exception()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns:
+            float: Fraction of the used paths which were loaded ahead, 0 if no path was used.
+        """
+        uses = self.hits + self.misses
+        return self.hits / uses if uses else 0.0
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns:
+            Dict[str, Any]: JSON serializable statistics of the prefetch. Late uses are counted also as misses.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "late": self.late,
+            "hit_rate": self.hit_rate,
+            "scheduled": self.scheduled,
+            "cancelled": self.cancelled,
+            "budget_skips": self.budget_skips,
+            "loaded_bytes": self.loaded_bytes,
+            "pending_bytes": self.pending_bytes,
+        }
+
+    def reset_stats(self) -> None:
+        """
+        Zeroes the statistics.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.late = 0
+        self.scheduled = 0
+        self.cancelled = 0
+        self.budget_skips = 0
+        self.loaded_bytes = 0
+
+    def shutdown(self) -> None:
+        """
+        Cancels all scheduled paths and stops the loading threads.
+        """
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self, path: str, entry: _Entry) -> None:
+        """
+        Loads a path in a worker thread. The size of the file is reserved in the memory budget before the load, the
+        missing files and the files over the budget are skipped.
+
+        Args:
+            path (str): Path of the file.
+            entry (_Entry): Scheduled entry of the path.
+        """
+        if entry.cancelled:
+            return
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            if entry.cancelled:
+                return
+            if self.pending_bytes + size > self.memory_budget:
+                self.budget_skips += 1
+                return
+            entry.size = size
+            self.pending_bytes += size
+        loaded = self.loader(path, lambda: entry.cancelled)
+        with self._lock:
+            self.loaded_bytes += loaded
+        entry.loaded = not entry.cancelled
+
+
+# Prefetcher shared by the nodes of the extension.
+ASSET_PREFETCHER = AssetPrefetcher()
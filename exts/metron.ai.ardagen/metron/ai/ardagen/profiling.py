@@ -0,0 +1,197 @@
+"""
+Implements per-node compute statistics of the ArDaGen nodes.
+
+The nodes ask for the active profiler once per compute by `get_profiler`. It returns None while the profiling is
+disabled, so the disabled collection costs only the single call.
+"""
+import csv
+import json
+import math
+import typing
+
+# Upper bounds of the compute latency histogram bins in microseconds, the last bin is unbounded.
+LATENCY_BIN_EDGES_US = (10, 30, 100, 300, 1_000, 3_000, 10_000, 30_000, 100_000, math.inf)
+# Failure reasons recorded by the nodes.
+FAILURE_EMPTY_CHOICES = "empty_choices"
+FAILURE_EXCEPTION = "exception"
+FAILURE_UNRESOLVED_PREFIX = "unresolved:"
+# Scalar statistics exported as CSV columns.
+_CSV_STAT_KEYS = ("calls", "mean_latency_ms", "max_latency_ms", "bytes_copied", "rng_reinits")
+
+
+class NodeStats:  # pylint: disable=too-few-public-methods
+    """
+    Compute statistics of a single node.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.latency_histogram = [0] * len(LATENCY_BIN_EDGES_US)
+        self.bytes_copied = 0
+        self.rng_reinits = 0
+        self.failures: typing.Dict[str, int] = {}
+
+    def to_dict(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns:
+            Dict[str, Any]: JSON serializable statistics. Latencies are in milliseconds.
+        """
+        return {
+            "calls": self.calls,
+            "mean_latency_ms": self.total_latency / self.calls * 1e3 if self.calls else 0.0,
+            "max_latency_ms": self.max_latency * 1e3,
+            "latency_histogram": dict(zip((str(edge) for edge in LATENCY_BIN_EDGES_US), self.latency_histogram)),
+            "bytes_copied": self.bytes_copied,
+            "rng_reinits": self.rng_reinits,
+            "failures": dict(self.failures),
+        }
+
+
+class ComputeProfiler:
+    """
+    Collects statistics of the node computes keyed by the node path.
+    """
+
+    def __init__(self) -> None:
+        self._stats: typing.Dict[str, NodeStats] = {}
+
+    def node_stats(self, node_path: str) -> NodeStats:
+        """
+        Args:
+            node_path (str): Path of the node.
+
+        Returns:
+            NodeStats: Statistics of the node, created on the first use.
+        """
+        stats = self._stats.get(node_path)
+        if stats is None:
+            stats = self._stats[node_path] = NodeStats()
+        return stats
+
+    def record_compute(self, node_path: str, latency: float) -> None:
+        """
+        Records a finished compute.
+
+        Args:
+            node_path (str): Path of the node.
+            latency (float): Compute latency in seconds.
+        """
+        stats = self.node_stats(node_path)
+        stats.calls += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+        latency_us = latency * 1e6
+        for bin_idx, edge in enumerate(LATENCY_BIN_EDGES_US):
+            if latency_us <= edge:
+                stats.latency_histogram[bin_idx] += 1
+                break
+
+    def record_bytes_copied(self, node_path: str, num_bytes: int) -> None:
+        """
+        Args:
+            node_path (str): Path of the node.
+            num_bytes (int): Number of the bytes written into the node outputs.
+        """
+        self.node_stats(node_path).bytes_copied += num_bytes
+
+    def record_rng_reinit(self, node_path: str) -> None:
+        """
+        Args:
+            node_path (str): Path of the node which re-initialized its RNG.
+        """
+        self.node_stats(node_path).rng_reinits += 1
+
+    def record_failure(self, node_path: str, reason: str) -> None:
+        """
+        Args:
+            node_path (str): Path of the node.
+            reason (str): Failure reason, one of the `FAILURE_*` constants. Unresolved attributes are recorded as
+                `FAILURE_UNRESOLVED_PREFIX` followed by the attribute name.
+        """
+        failures = self.node_stats(node_path).failures
+        failures[reason] = failures.get(reason, 0) + 1
+
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics of every node, see `NodeStats.to_dict`.
+        """
+        return {node_path: stats.to_dict() for node_path, stats in sorted(self._stats.items())}
+
+    def export_json(self, path: str) -> None:
+        """
+        Writes the statistics as JSON.
+
+        Args:
+            path (str): Path of the JSON file.
+        """
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump(self.snapshot(), json_file, indent=2)
+
+    def export_csv(self, path: str) -> None:
+        """
+        Writes the statistics as CSV with one row per node. Histogram bins and failure reasons get their own columns.
+
+        Args:
+            path (str): Path of the CSV file.
+        """
+        snapshot = self.snapshot()
+        failure_reasons = sorted({reason for stats in snapshot.values() for reason in stats["failures"]})
+        bin_columns = [f"latency_le_{edge}us" for edge in LATENCY_BIN_EDGES_US]
+        with open(path, "w", encoding="utf-8", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(
+                ["node"] + list(_CSV_STAT_KEYS) + bin_columns + [f"failures_{reason}" for reason in failure_reasons]
+            )
+            for node_path, stats in snapshot.items():
+                writer.writerow(
+                    [node_path]
+                    + [stats[key] for key in _CSV_STAT_KEYS]
+                    + list(stats["latency_histogram"].values())
+                    + [stats["failures"].get(reason, 0) for reason in failure_reasons]
+                )
+
+    def reset(self) -> None:
+        """
+        Drops all statistics.
+        """
+        self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+
+# Profiler shared by the nodes of the extension.
+PROFILER = ComputeProfiler()
+
+# Profiler the nodes record into, None while the profiling is disabled.
+_ACTIVE_PROFILER: typing.Optional[ComputeProfiler] = None
+
+
+def set_profiling_enabled(enabled: bool) -> None:
+    """
+    Enables or disables the statistics collection. Collected statistics are kept when disabled.
+
+    Args:
+        enabled (bool): If True, the nodes record into `PROFILER`.
+    """
+    global _ACTIVE_PROFILER  # pylint: disable=global-statement
+    _ACTIVE_PROFILER = PROFILER if enabled else None
+
+
+def is_profiling_enabled() -> bool:
+    """
+    Returns:
+        bool: True if the statistics are collected.
+    """
+    return _ACTIVE_PROFILER is not None
+
+
+def get_profiler() -> typing.Optional[ComputeProfiler]:
+    """
+    Returns:
+        Optional[ComputeProfiler]: Profiler the nodes record into, None if the profiling is disabled.
+    """
+    return _ACTIVE_PROFILER
@@ -0,0 +1,141 @@
+"""
+Implements the profiling panel of the ArDaGen extension window.
+"""
+import os
+import time
+import typing
+import omni.kit.app
+from omni import ui
+from .profiling import LATENCY_BIN_EDGES_US, PROFILER, is_profiling_enabled, set_profiling_enabled
+
+# Period of the live statistics refresh in seconds.
+REFRESH_PERIOD = 0.5
+DEFAULT_EXPORT_PATH = os.path.join(os.getcwd(), "ardagen_profile")
+
+
+class ProfilingWindow:  # pylint: disable=too-few-public-methods
+    """
+    Window showing the per-node compute statistics collected by `profiling.PROFILER` with controls to enable the
+    collection, reset it and export it to JSON or CSV.
+    """
+
+    def __init__(self, title: str) -> None:
+        """
+        Builds the window.
+
+        Args:
+            title (str): Window title.
+        """
+        self._last_refresh = 0.0
+        self._update_sub: typing.Any = None
+        self._enabled_model = ui.SimpleBoolModel(is_profiling_enabled())
+        self._enabled_model.add_value_changed_fn(self._on_enabled_changed)
+        self._export_path_model = ui.SimpleStringModel(DEFAULT_EXPORT_PATH)
+
+        self._window = ui.Window(title, width=640, height=400)
+        with self._window.frame:
+            with ui.VStack(spacing=4):
+                with ui.HStack(height=22, spacing=4):
+                    ui.CheckBox(model=self._enabled_model, width=20)
+                    ui.Label("Collect SampleShuffle node statistics", width=0)
+                    ui.Spacer()
+                    ui.Button("Reset", width=60, clicked_fn=self._on_reset)
+                with ui.HStack(height=22, spacing=4):
+                    ui.Label("Export path", width=80)
+                    ui.StringField(model=self._export_path_model)
+                    ui.Button("JSON", width=50, clicked_fn=lambda: PROFILER.export_json(self._export_path(".json")))
+                    ui.Button("CSV", width=50, clicked_fn=lambda: PROFILER.export_csv(self._export_path(".csv")))
+                with ui.ScrollingFrame():
+                    self._stats_frame = ui.Frame(build_fn=_build_stats)
+        self._update_subscription(is_profiling_enabled())
+
+    def destroy(self) -> None:
+        """
+        Stops the refresh and destroys the window.
+        """
+        self._update_sub = None
+        self._window.destroy()
+
+    def _export_path(self, suffix: str) -> str:
+        """
+        Args:
+            suffix (str): File suffix.
+
+        Returns:
+            str: Export path from the path field with the suffix.
+        """
+        path = self._export_path_model.get_value_as_string()
+        return path if path.endswith(suffix) else f"{path}{suffix}"
+
+    def _on_enabled_changed(self, model: typing.Any) -> None:
+        """
+        Args:
+            model (ui.SimpleBoolModel): Model of the enable check box.
+        """
+        enabled = model.get_value_as_bool()
+        set_profiling_enabled(enabled)
+        self._update_subscription(enabled)
+
+    def _on_reset(self) -> None:
+        """
+        Drops the collected statistics.
+        """
+        PROFILER.reset()
+        self._stats_frame.rebuild()
+
+    def _update_subscription(self, enabled: bool) -> None:
+        """
+        The statistics are refreshed live only while the collection is enabled.
+
+        Args:
+            enabled (bool): Whether the collection is enabled.
+        """
+        if enabled and self._update_sub is None:
+            self._update_sub = (
+                omni.kit.app.get_app()
+                .get_update_event_stream()
+                .create_subscription_to_pop(self._on_update, name="metron.ai.ardagen profiling panel")
+            )
+        elif not enabled:
+            self._update_sub = None
+
+    def _on_update(self, event: typing.Any) -> None:  # pylint: disable=unused-argument
+        """
+        App update callback rebuilding the statistics at most once per `REFRESH_PERIOD`.
+
+        Args:
+            event (Any): Update event.
+        """
+        now = time.monotonic()
+        if self._window.visible and now - self._last_refresh >= REFRESH_PERIOD:
+            self._last_refresh = now
+            self._stats_frame.rebuild()
+
+
+def _build_stats() -> None:
+    """
+    Builds the statistics table, one row per node.
+    """
+    snapshot = PROFILER.snapshot()
+    columns = ["Node", "Calls", "Mean [ms]", "Max [ms]", "Copied [MB]", "RNG reinits", "Failures", "Latency bins"]
+    with ui.VStack(height=0, spacing=2):
+        with ui.HStack(height=20):
+            for column in columns:
+                ui.Label(column, width=ui.Fraction(3 if column == "Node" else 1))
+        if not snapshot:
+            ui.Label("No statistics collected.")
+        for node_path, stats in snapshot.items():
+            failures = ", ".join(f"{reason}: {count}" for reason, count in stats["failures"].items())
+            with ui.HStack(height=20):
+                ui.Label(node_path, width=ui.Fraction(3), elided_text=True, tooltip=node_path)
+                ui.Label(str(stats["calls"]), width=ui.Fraction(1))
+                ui.Label(f"{stats['mean_latency_ms']:.3f}", width=ui.Fraction(1))
+                ui.Label(f"{stats['max_latency_ms']:.3f}", width=ui.Fraction(1))
+                ui.Label(f"{stats['bytes_copied'] / 2**20:.2f}", width=ui.Fraction(1))
+                ui.Label(str(stats["rng_reinits"]), width=ui.Fraction(1))
+                ui.Label(failures or "-", width=ui.Fraction(1), elided_text=True, tooltip=failures)
+                ui.Label(
+                    " ".join(str(count) for count in stats["latency_histogram"].values()),
+                    width=ui.Fraction(1),
+                    tooltip="Computes with the latency up to " + ", ".join(f"{e} us" for e in LATENCY_BIN_EDGES_US),
+                )
@@ -0,0 +1,114 @@
+"""
+Implements the extension-level RNG pool of the ArDaGen nodes.
+
+Every seed is a root `np.random.SeedSequence` and a node gets the child substream keyed by its node id, i.e.
+`SeedSequence(seed, spawn_key=(node_id,))`, which is the child `spawn` would create at the position `node_id`. The
+substreams are independent, depend only on (seed, node id) and not on the order the nodes are created in. The
+generators are created lazily on the first draw, so the nodes which never draw sequentially (random access and schedule
+modes) never build one.
+"""
+import typing
+import numpy as np
+
+_UINT64_MASK = (1 << 64) - 1
+
+
+class PooledRNG:  # pylint: disable=too-few-public-methods
+    """
+    Substream of a node. It provides the `seed` and `generator` attributes of `rep.rng.ReplicatorRNG` used by the nodes.
+    """
+
+    __slots__ = ("seed", "node_id", "effective_seed", "_generator")
+
+    def __init__(self, seed: int, node_id: int, effective_seed: int) -> None:
+        """
+        Args:
+            seed (int): Seed requested by the node.
+            node_id (int): Id of the node.
+            effective_seed (int): Seed of the root sequence, i.e. the seed with the global seed used for negative
+                values.
+        """
+        self.seed = seed
+        self.node_id = node_id
+        self.effective_seed = effective_seed
+        self._generator: typing.Optional[np.random.Generator] = None
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """
+        Returns:
+            np.random.Generator: Generator of the substream, created on the first access.
+        """
+        if self._generator is None:
+            entropy = self.effective_seed & _UINT64_MASK
+            seed_sequence = np.random.SeedSequence(entropy, spawn_key=(self.node_id & _UINT64_MASK,))
+            self._generator = np.random.Generator(np.random.PCG64(seed_sequence))
+        return self._generator
+
+
+class RNGPool:
+    """
+    Substreams of the nodes keyed by the node path.
+    """
+
+    def __init__(self) -> None:
+        self._streams: typing.Dict[str, PooledRNG] = {}
+        # Replicator's global seed, set by the extension.
+        self.global_seed = 0
+
+    def acquire(self, key: str, seed: int, node_id: int) -> PooledRNG:
+        """
+        Starts a new substream of the node, the previous one of the key is dropped.
+
+        Args:
+            key (str): Key of the node, usually its prim path.
+            seed (int): Seed of the node. A value of less than 0 will indicate using `global_seed`.
+            node_id (int): Id of the node.
+
+        Returns:
+            PooledRNG: Substream of (seed, node id).
+        """
+        stream = self._streams[key] = PooledRNG(seed, node_id, self.effective_seed(seed))
+        return stream
+
+    def effective_seed(self, seed: int) -> int:
+        """
+        Args:
+            seed (int): Seed of a node.
+
+        Returns:
+            int: The seed, or `global_seed` if the seed is less than 0.
+        """
+        return seed if seed >= 0 else self.global_seed
+
+    def release(self, key: str) -> None:
+        """
+        Reclaims the substream of a released node.
+
+        Args:
+            key (str): Key of the node.
+        """
+        self._streams.pop(key, None)
+
+    def set_global_seed(self, seed: int) -> None:
+        """
+        Sets the seed used by the nodes with a negative seed. The nodes start their new substreams on their next
+        compute, see `PooledRNG.effective_seed`.
+
+        Args:
+            seed (int): Global seed.
+        """
+        self.global_seed = seed
+
+    def clear(self) -> None:
+        """
+        Drops all substreams.
+        """
+        self._streams.clear()
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+
+# Pool shared by the nodes of the extension.
+RNG_POOL = RNGPool()
@@ -0,0 +1,256 @@
+"""
+Implements the offline permutation schedule planner for distributed render workers.
+
+The schedule stores the random access permutations (see `permutation.frame_permutation`) of a frame range into
+memory-mapped `.npy` shards, one shard per worker, plus a JSON manifest. The SampleShuffle node then reads the rows
+directly in the schedule file mode without any RNG work at runtime.
+"""
+import argparse
+import bisect
+import json
+import os
+import typing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .permutation import INDEX_DTYPE, frame_permutation
+
+MANIFEST_FILE_NAME = "schedule.json"
+SCHEDULE_VERSION = 1
+
+
+def shard_frame_ranges(start_frame: int, stop_frame: int, num_shards: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Splits the frame range into contiguous shards of (nearly) equal size.
+
+    Args:
+        start_frame (int): First frame of the schedule.
+        stop_frame (int): Frame after the last frame of the schedule.
+        num_shards (int): Number of the shards.
+
+    Raises:
+        ValueError: Raised if the frame range is empty or the number of shards is not positive.
+
+    Returns:
+        List[Tuple[int, int]]: Half-open frame range of every shard.
+    """
+    if stop_frame <= start_frame:
+        raise ValueError(f"Frame range [{start_frame}, {stop_frame}) is empty.")
+    if num_shards < 1:
+        raise ValueError("Number of shards has to be positive.")
+
+    bounds = np.linspace(start_frame, stop_frame, num_shards + 1).round().astype(np.int64)
+    return [(int(bounds[i]), int(bounds[i + 1])) for i in range(num_shards)]
+
+
+def sample_width(num_choices: int, num_samples: int) -> int:
+    """
+    Args:
+        num_choices (int): Number of the shuffled choices.
+        num_samples (int): Number of the sampled elements, see `permutation.sample_indices`.
+
+    Returns:
+        int: Number of the elements of a permutation, all choices for negative or too large `num_samples`.
+    """
+    return num_choices if num_samples < 0 or num_samples >= num_choices else num_samples
+
+
+def write_shard(  # pylint: disable=too-many-arguments
+    path: str,
+    num_choices: int,
+    seed: int,
+    node_id: int,
+    start_frame: int,
+    stop_frame: int,
+    num_samples: int = -1,
+) -> None:
+    """
+    Writes permutations of the frame range into a memory-mapped `.npy` file.
+
+    Args:
+        path (str): Path of the shard file.
+        num_choices (int): Number of the shuffled choices.
+        seed (int): Seed of the sampling.
+        node_id (int): Id of the node.
+        start_frame (int): First frame of the shard.
+        stop_frame (int): Frame after the last frame of the shard.
+        num_samples (int): Number of the sampled elements, see `permutation.sample_indices`. Defaults to all elements.
+    """
+    width = sample_width(num_choices, num_samples)
+    rows = np.lib.format.open_memmap(path, mode="w+", dtype=INDEX_DTYPE, shape=(stop_frame - start_frame, width))
+    for row, frame in enumerate(range(start_frame, stop_frame)):
+        rows[row] = frame_permutation(seed, node_id, frame, num_choices, num_samples)
+    rows.flush()
+    del rows
+
+
+def plan_schedule(  # pylint: disable=too-many-arguments,too-many-locals
+    output_dir: str,
+    num_choices: int,
+    seed: int,
+    node_id: int,
+    frames: typing.Tuple[int, int],
+    num_shards: int = 1,
+    num_samples: int = -1,
+    processes: int = 1,
+) -> str:
+    """
+    Precomputes the permutation schedule of the frame range into shards.
+
+    Args:
+        output_dir (str): Directory the shards and the manifest are written to.
+        num_choices (int): Number of the shuffled choices.
+        seed (int): Seed of the sampling.
+        node_id (int): Id of the node.
+        frames (Tuple[int, int]): Half-open frame range.
+        num_shards (int): Number of the shards, usually the number of the render workers.
+        num_samples (int): Number of the sampled elements, see `permutation.sample_indices`. Defaults to all elements.
+        processes (int): Number of the processes writing the shards in parallel.
+
+    Raises:
+        ValueError: Raised if there are no choices.
+
+    Returns:
+        str: Path of the schedule manifest.
+    """
+    if num_choices < 1:
+        raise ValueError("Number of choices has to be positive.")
+
+    os.makedirs(output_dir, exist_ok=True)
+    ranges = shard_frame_ranges(frames[0], frames[1], num_shards)
+    shard_names = [f"shard_{shard_idx:05d}.npy" for shard_idx in range(num_shards)]
+    shard_args = [
+        (os.path.join(output_dir, name), num_choices, seed, node_id, start, stop, num_samples)
+        for name, (start, stop) in zip(shard_names, ranges)
+    ]
+
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            list(executor.map(write_shard, *zip(*shard_args)))
+    else:
+        for args in shard_args:
+            write_shard(*args)
+
+    manifest = {
+        "version": SCHEDULE_VERSION,
+        "num_choices": num_choices,
+        "num_samples": num_samples,
+        "seed": seed,
+        "node_id": node_id,
+        "shards": [
+            {"path": name, "start_frame": start, "stop_frame": stop} for name, (start, stop) in zip(shard_names, ranges)
+        ],
+    }
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE_NAME)
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+    return manifest_path
+
+
+class Schedule:  # pylint: disable=too-many-instance-attributes
+    """
+    Read-only access to a planned permutation schedule. The shards are memory-mapped lazily, so a worker needs only the
+    manifest and the shards of its frames.
+    """
+
+    def __init__(self, manifest_path: str) -> None:
+        """
+        Args:
+            manifest_path (str): Path of the schedule manifest.
+
+        Raises:
+            ValueError: Raised if the schedule version is not supported.
+        """
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest.get("version") != SCHEDULE_VERSION:
+            raise ValueError(f"Schedule version {manifest.get('version')} is not supported.")
+
+        self.path = manifest_path
+        self.num_choices: int = manifest["num_choices"]
+        self.num_samples: int = manifest["num_samples"]
+        self.seed: int = manifest["seed"]
+        self.node_id: int = manifest["node_id"]
+        shards_dir = os.path.dirname(manifest_path)
+        self._shard_paths = [os.path.join(shards_dir, shard["path"]) for shard in manifest["shards"]]
+        self._start_frames = [shard["start_frame"] for shard in manifest["shards"]]
+        self._stop_frames = [shard["stop_frame"] for shard in manifest["shards"]]
+        self._shards: typing.List[typing.Optional[np.ndarray]] = [None] * len(self._shard_paths)
+
+    def check(self, num_choices: int, seed: int, node_id: int, num_samples: int = -1) -> None:
+        """
+        Checks that the schedule was planned for the node, so a stale schedule file doesn't replay the sequence of
+        another node or seed.
+
+        Args:
+            num_choices (int): Number of the choices of the node.
+            seed (int): Seed of the node.
+            node_id (int): Id of the node.
+            num_samples (int): Number of the sampled elements of the node, see `permutation.sample_indices`.
+
+        Raises:
+            ValueError: Raised if any of the values doesn't match the planned one.
+        """
+        if self.num_choices != num_choices:
+            raise ValueError(f"Schedule {self.path} is planned for {self.num_choices} choices, not {num_choices}.")
+        if self.seed != seed or self.node_id != node_id:
+            raise ValueError(
+                f"Schedule {self.path} is planned for seed {self.seed} and node id {self.node_id}, not seed {seed} and"
+                f" node id {node_id}."
+            )
+        if sample_width(self.num_choices, self.num_samples) != sample_width(num_choices, num_samples):
+            raise ValueError(f"Schedule {self.path} is planned for {self.num_samples} samples, not {num_samples}.")
+
+    def row(self, frame: int) -> np.ndarray:
+        """
+        Returns the permutation of the frame.
+
+        Args:
+            frame (int): Index of the frame.
+
+        Raises:
+            IndexError: Raised if the frame is not in the schedule.
+
+        Returns:
+            np.ndarray: Read-only view into the memory-mapped shard.
+        """
+        shard_idx = bisect.bisect_right(self._start_frames, frame) - 1
+        if shard_idx < 0 or frame >= self._stop_frames[shard_idx]:
+            raise IndexError(f"Frame {frame} is not in the schedule {self.path}.")
+
+        shard = self._shards[shard_idx]
+        if shard is None:
+            shard = np.load(self._shard_paths[shard_idx], mmap_mode="r")
+            self._shards[shard_idx] = shard
+        return shard[frame - self._start_frames[shard_idx]]
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Command line entry point of the planner.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments. `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description="Precompute a SampleShuffle permutation schedule into .npy shards.")
+    parser.add_argument("--output-dir", required=True, help="Directory the shards and the manifest are written to.")
+    parser.add_argument("--num-choices", type=int, required=True, help="Number of the shuffled choices.")
+    parser.add_argument("--seed", type=int, required=True, help="Seed of the sampling.")
+    parser.add_argument("--node-id", type=int, default=0, help="Id of the node.")
+    parser.add_argument("--start-frame", type=int, default=0, help="First frame of the schedule.")
+    parser.add_argument("--stop-frame", type=int, required=True, help="Frame after the last frame of the schedule.")
+    parser.add_argument("--num-shards", type=int, default=1, help="Number of the shards.")
+    parser.add_argument("--num-samples", type=int, default=-1, help="Number of the sampled elements.")
+    parser.add_argument("--processes", type=int, default=1, help="Number of the processes writing the shards.")
+    args = parser.parse_args(argv)
+
+    manifest_path = plan_schedule(
+        args.output_dir,
+        args.num_choices,
+        args.seed,
+        args.node_id,
+        (args.start_frame, args.stop_frame),
+        num_shards=args.num_shards,
+        num_samples=args.num_samples,
+        processes=args.processes,
+    )
+    print(f"Schedule written to '{manifest_path}'")
@@ -1,13 +1,72 @@
 """
 Implements utilities for the extension.
 """
+import operator
 import typing
+import numpy as np
 
+# Base data type name per Python element type. Tuple valued elements get the tuple length suffix, except of bool.
+_BASE_TYPE_NAMES = {int: "int", float: "double", bool: "bool", str: "token"}
+# Base data type name per NumPy dtype kind.
+_DTYPE_KIND_TYPES = {"i": int, "u": int, "f": float, "b": bool, "U": str, "S": str}
 
-def get_data_type(data_list: typing.List[typing.Any]) -> typing.Any:  # pylint: disable=too-many-branches
+
+def get_data_type(data_list: typing.Any) -> typing.Any:
     """
     Obtain data types.
 
+    NumPy arrays are resolved from their dtype and shape. Lists are resolved from the set of element types, which is
+    collected in a single pass, and the per-element check is used only as a fallback for mixed or unsupported data.
+
+    Args:
+        data_list (Any): List of objects or NumPy array. Tuple valued elements are stored along the second axis.
+
+    Raises:
+        ValueError: Raised if list items are of different data types or non supported types are present.
+
+    Returns:
+        Any: Base data type of the items in the list.
+    """
+    if isinstance(data_list, np.ndarray) and data_list.dtype.kind in _DTYPE_KIND_TYPES and data_list.ndim in (1, 2):
+        el_len = data_list.shape[1] if data_list.ndim == 2 else ""
+        return _base_type_name(_DTYPE_KIND_TYPES[data_list.dtype.kind], el_len)
+
+    el_types = set(map(type, data_list))
+    el_len = ""
+    if el_types <= {list, tuple}:
+        el_len = len(data_list[0])
+        el_types = set(map(type, map(operator.itemgetter(0), data_list)))
+
+    if el_types == {int, float}:
+        el_types = {float}
+    if len(el_types) == 1:
+        (el_type,) = el_types
+        if el_type in _BASE_TYPE_NAMES:
+            return _base_type_name(el_type, el_len)
+
+    return _get_data_type_by_element(data_list)
+
+
+def _base_type_name(el_type: typing.Any, el_len: typing.Any) -> str:
+    """
+    Composes base data type name.
+
+    Args:
+        el_type (Any): Python type of the elements.
+        el_len (Any): Tuple length of the elements or empty string for scalar elements.
+
+    Returns:
+        str: Base data type name.
+    """
+    if el_type in (int, float):
+        return f"{_BASE_TYPE_NAMES[el_type]}{el_len}"
+    return _BASE_TYPE_NAMES[el_type]
+
+
+def _get_data_type_by_element(data_list: typing.List[typing.Any]) -> typing.Any:  # pylint: disable=too-many-branches
+    """
+    Obtain data types by checking every element.
+
     Args:
         data_list (List[Any]): List of objects.
 
@@ -0,0 +1,115 @@
+"""
+Implements validation policy of the distribution parameters.
+
+Validation levels:
+    full: Every element of the choices is checked. The element type check is done by the data type inference itself, so
+        the choices are walked only once.
+    sampled: Only evenly spaced sample of the choices is checked.
+    first_element: Only the first element of the choices is checked.
+    off: Parameters are not validated, the data type is inferred from the first element.
+"""
+import importlib.util
+import typing
+from .utils import get_data_type
+
+VALIDATION_LEVELS = ("full", "sampled", "first_element", "off")
+# Maximal number of the elements checked in the `sampled` level.
+SAMPLE_SIZE = 1024
+
+_VALIDATION_LEVEL = "full"
+_IS_TYPEGUARD_CHECKED = False
+
+
+def set_validation_level(level: str) -> None:
+    """
+    Sets the extension-wide validation level used by the distributions without explicit `validation` argument.
+
+    Args:
+        level (str): One of `VALIDATION_LEVELS`.
+    """
+    _validation_level_check(level)
+    global _VALIDATION_LEVEL  # pylint: disable=global-statement
+    _VALIDATION_LEVEL = level
+
+
+def get_validation_level() -> str:
+    """
+    Returns the extension-wide validation level.
+
+    Returns:
+        str: One of `VALIDATION_LEVELS`.
+    """
+    return _VALIDATION_LEVEL
+
+
+def resolve_validation_level(level: typing.Optional[str]) -> str:
+    """
+    Resolves the validation level of a distribution call.
+
+    Args:
+        level (Optional[str]): Level requested by the call. The extension-wide level is used if None.
+
+    Returns:
+        str: One of `VALIDATION_LEVELS`.
+    """
+    if level is None:
+        return _VALIDATION_LEVEL
+    _validation_level_check(level)
+    return level
+
+
+def infer_choices_data_type(choices: typing.Any, level: str) -> typing.Any:
+    """
+    Validates the choices elements to the extent given by the level and infers their base data type.
+
+    Args:
+        choices (Any): Choices of the distribution.
+        level (str): One of `VALIDATION_LEVELS`.
+
+    Raises:
+        ValueError: Raised if there are no choices, if the checked elements are of different data types or non
+            supported types are present.
+
+    Returns:
+        Any: Base data type of the choices.
+    """
+    if len(choices) == 0:
+        raise ValueError("At least one choice has to be provided.")
+
+    if level == "full":
+        return get_data_type(choices)
+    if level == "sampled" and len(choices) > SAMPLE_SIZE:
+        step = (len(choices) - 1) / (SAMPLE_SIZE - 1)
+        return get_data_type([choices[round(i * step)] for i in range(SAMPLE_SIZE)])
+    if level == "sampled":
+        return get_data_type(choices)
+    return get_data_type(choices[:1])
+
+
+def ensure_typeguard() -> None:
+    """
+    Installs typeguard used by the `metron_shared` parameter validators if it is missing. The check runs once, on the
+    first import of the distributions, instead of on every extension load.
+    """
+    global _IS_TYPEGUARD_CHECKED  # pylint: disable=global-statement
+    if _IS_TYPEGUARD_CHECKED:
+        return
+    if importlib.util.find_spec("typeguard") is None:
+        import omni.kit.pipapi  # pylint: disable=import-outside-toplevel
+
+        omni.kit.pipapi.install("typeguard", module="typeguard")
+    _IS_TYPEGUARD_CHECKED = True
+
+
+def _validation_level_check(level: str) -> None:
+    """
+    Checks the validation level value.
+
+    Args:
+        level (str): Checked level.
+
+    Raises:
+        ValueError: Raised if the level is not one of `VALIDATION_LEVELS`.
+    """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(f"Validation level '{level}' is not supported. Use one of {VALIDATION_LEVELS}.")
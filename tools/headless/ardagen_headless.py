@@ -0,0 +1,34 @@
+"""
+Makes the ArDaGen extension Python module importable outside of a Kit application.
+
+The package `__init__` files of the extension import Kit modules, so the packages are registered without executing
+them. Modules which depend only on NumPy (e.g. `metron.ai.ardagen.permutation`) can be then imported as usual.
+"""
+
+import os
+import sys
+import types
+
+REPO_ROOT = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+EXT_ROOT = os.path.join(REPO_ROOT, "exts", "metron.ai.ardagen")
+
+
+def load_ardagen(run_package_init: bool = False) -> None:
+    """
+    Registers `metron`, `metron.ai` and `metron.ai.ardagen` packages without executing their `__init__` files.
+
+    Args:
+        run_package_init (bool): If True, `metron.ai.ardagen` is not registered, so its `__init__` is executed on the
+            first import like in Kit. The Kit modules it imports have to be provided, see `ardagen_standin`.
+    """
+    package_path = EXT_ROOT
+    package_name = ""
+    for name_part in ["metron", "ai"] if run_package_init else ["metron", "ai", "ardagen"]:
+        package_name = f"{package_name}.{name_part}" if package_name else name_part
+        package_path = os.path.join(package_path, name_part)
+        if package_name in sys.modules:
+            continue
+        package = types.ModuleType(package_name)
+        package.__path__ = [package_path]  # type: ignore
+        package.__package__ = package_name
+        sys.modules[package_name] = package
@@ -0,0 +1,204 @@
+"""
+Lightweight stand-in of the Kit runtime parts used by the SampleShuffle node and the ArDaGen distributions.
+
+It covers `omni.graph.core` (nodes, attributes, type resolution, connections, `og.Controller.edit`, see `og`),
+`omni.replicator.core` (`utils.create_node`, `rng.ReplicatorRNG`, `distribution.register`, see `rep`), `pxr.Sdf.Path`,
+the `metron_shared` parameter validators (see `kit`) and the `og.Database` machinery used by the generated node
+databases (see `database`). Node types of the extension are read from their `.ogn` files and evaluated by the
+`abi.compute` of their generated databases, so the node logic and the distribution builders run under plain pytest. The
+other Kit modules imported by the extension (`omni.ext`, `omni.kit.pipapi`, `carb.settings`, ...) are empty shells, so
+the package `__init__` and the extension module can be imported too, e.g. by the import time benchmark.
+
+Usage:
+    install_standins()
+    node = create_node("metron.ai.ardagen.SampleShuffle", seed=3)
+    evaluate(node)
+"""
+import contextlib
+import importlib
+import importlib.util
+import os
+import sys
+import types
+import typing
+from ardagen_headless import EXT_ROOT, load_ardagen
+from .database import (
+    Database,
+    DynamicAttributeAccess,
+    DynamicAttributeInterface,
+    MetadataKeys,
+    ReadOnlyError,
+    RuntimeAttribute,
+    _commit_output_attributes_data,
+    _prefetch_input_attributes_data,
+    evaluate,
+)
+from .kit import IExt, SdfPath, check_type
+from .og import (
+    DEFAULT_GRAPH_PATH,
+    OGN_NODES_DIR,
+    RUNTIME,
+    Attribute,
+    AttributePortType,
+    AttributeType,
+    AttributeValueHelper,
+    BaseDataType,
+    Controller,
+    Graph,
+    Node,
+    StandInRuntime,
+    Type,
+    create_node,
+)
+from .rep import ReplicatorRNG, create_replicator_node
+
+
+def _module(name: str, **members: typing.Any) -> types.ModuleType:
+    """
+    Creates and registers a module unless it is already imported.
+
+    Args:
+        name (str): Full module name.
+        **members (Any): Module members.
+
+    Returns:
+        types.ModuleType: Registered module.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        module = types.ModuleType(name)
+        sys.modules[name] = module
+        parent_name, _, child_name = name.rpartition(".")
+        if parent_name in sys.modules:
+            setattr(sys.modules[parent_name], child_name, module)
+    for member_name, member in members.items():
+        setattr(module, member_name, member)
+    return module
+
+
+def load_node_class(node_name: str) -> typing.Any:
+    """
+    Loads the Python implementation of an extension node type.
+
+    Args:
+        node_name (str): Node name, e.g. `SampleShuffle`.
+
+    Returns:
+        Any: Node class.
+    """
+    module_name = f"metron.ai.ardagen.ogn.nodes.Ogn{node_name}"
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(OGN_NODES_DIR, f"Ogn{node_name}.py"))
+    module = importlib.util.module_from_spec(spec)  # type: ignore
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)  # type: ignore
+    return getattr(module, f"Ogn{node_name}")
+
+
+def install_standins(run_package_init: bool = False) -> None:
+    """
+    Registers the stand-in modules and loads the extension node types.
+
+    Args:
+        run_package_init (bool): If True, the `metron.ai.ardagen` package is imported with its `__init__` like in Kit
+            and the node types are not loaded, so no extension module is imported by this function.
+    """
+    load_ardagen(run_package_init)
+    _module("omni")
+    _module("omni.graph")
+    _module(
+        "omni.graph.core",
+        BaseDataType=BaseDataType,
+        Type=Type,
+        Attribute=Attribute,
+        AttributePortType=AttributePortType,
+        AttributeType=AttributeType,
+        AttributeValueHelper=AttributeValueHelper,
+        Controller=Controller,
+        Graph=Graph,
+        Node=Node,
+        RuntimeAttribute=RuntimeAttribute,
+        Database=Database,
+        DynamicAttributeAccess=DynamicAttributeAccess,
+        DynamicAttributeInterface=DynamicAttributeInterface,
+        ReadOnlyError=ReadOnlyError,
+        eComputeRule=types.SimpleNamespace(E_ON_REQUEST="on_request"),
+        in_compute=contextlib.nullcontext,
+        register_node_type=lambda *args: None,
+        deregister_node_type=lambda *args: None,
+        register_ogn_nodes=lambda *args: None,
+    )
+    _module(
+        "omni.graph.core._omni_graph_core",
+        _prefetch_input_attributes_data=_prefetch_input_attributes_data,
+        _commit_output_attributes_data=_commit_output_attributes_data,
+    )
+    _module("omni.graph.tools")
+    _module("omni.graph.tools.ogn", MetadataKeys=MetadataKeys)
+    _module("omni.replicator")
+    _module("omni.replicator.core", rng=None, utils=None, distribution=None)
+    _module("omni.replicator.core.rng", ReplicatorRNG=ReplicatorRNG, release=lambda path: None)
+    _module("omni.replicator.core.utils", create_node=create_replicator_node)
+    _module("omni.replicator.core.distribution", register=RUNTIME.registered_distributions.append)
+    _module("pxr", Sdf=None)
+    _module("pxr.Sdf", Path=SdfPath)
+    _module("omni.ext", IExt=IExt)
+    _module("omni.kit", app=None, pipapi=None)
+    _module("omni.kit.app")
+    _module("omni.kit.pipapi", install=lambda package, module=None: RUNTIME.pip_installs.append(package))
+    _module("omni.ui")
+    _module("omni.usd")
+    _module("carb", settings=None)
+    _module("carb.settings")
+    if not os.path.exists(os.path.join(EXT_ROOT, "metron", "ai", "ardagen", "metron_shared", "param_validators.py")):
+        _module("metron.ai.ardagen.metron_shared", __path__=[])
+        _module("metron.ai.ardagen.metron_shared.param_validators", check_type=check_type)
+    if not run_package_init:
+        load_node_types()
+
+
+def load_node_types() -> None:
+    """
+    Loads the extension node types, i.e. the stand-in of the node registration done by the extension startup.
+    """
+    for ogn_file_name in sorted(os.listdir(OGN_NODES_DIR)):
+        if ogn_file_name.endswith(".ogn"):
+            node_name = ogn_file_name[len("Ogn") : -len(".ogn")]
+            node_class = load_node_class(node_name)
+            database = importlib.import_module(f"metron.ai.ardagen.ogn.Ogn{node_name}Database")
+            getattr(database, f"Ogn{node_name}Database").register(node_class)
+            RUNTIME.node_classes[f"metron.ai.ardagen.{node_name}"] = node_class
+            RUNTIME.databases[f"metron.ai.ardagen.{node_name}"] = getattr(database, f"Ogn{node_name}Database")
+
+
+# Defines what is imported when `from ardagen_standin import *` is called.
+__all__ = [
+    "RUNTIME",
+    "DEFAULT_GRAPH_PATH",
+    "OGN_NODES_DIR",
+    "Attribute",
+    "AttributePortType",
+    "AttributeType",
+    "AttributeValueHelper",
+    "BaseDataType",
+    "Controller",
+    "Database",
+    "DynamicAttributeAccess",
+    "DynamicAttributeInterface",
+    "Graph",
+    "IExt",
+    "MetadataKeys",
+    "Node",
+    "ReadOnlyError",
+    "ReplicatorRNG",
+    "RuntimeAttribute",
+    "SdfPath",
+    "StandInRuntime",
+    "Type",
+    "check_type",
+    "create_node",
+    "create_replicator_node",
+    "evaluate",
+    "install_standins",
+    "load_node_class",
+    "load_node_types",
+]
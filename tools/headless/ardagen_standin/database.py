@@ -0,0 +1,228 @@
+"""
+Stand-in of the `og.Database` machinery used by the generated node databases.
+"""
+import types
+import typing
+import numpy as np
+from .og import _NUMPY_TYPES, RUNTIME, Attribute, Node, Type
+
+
+class RuntimeAttribute:
+    """
+    Stand-in of `og.RuntimeAttribute` of an extended attribute.
+    """
+
+    def __init__(  # pylint: disable=unused-argument
+        self, attribute: Attribute, context: typing.Any = None, read_only: bool = True
+    ) -> None:
+        self._attribute = attribute
+
+    @property
+    def type(self) -> Type:
+        """
+        Returns:
+            Type: Resolved type.
+        """
+        return self._attribute.type
+
+    @property
+    def value(self) -> typing.Any:
+        """
+        Returns:
+            Any: Attribute value.
+        """
+        return self._attribute.get()
+
+    @value.setter
+    def value(self, value: typing.Any) -> None:
+        self._attribute.value = value
+
+    def array_value(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: Value as an array of the resolved type. Tokens are returned as an object array.
+        """
+        value = self._attribute.get()
+        if value is None:
+            return np.empty(0)
+        return np.asarray(value, dtype=_NUMPY_TYPES.get(self.type.base_type))
+
+
+class ReadOnlyError(Exception):
+    """
+    Stand-in of `og.ReadOnlyError`.
+    """
+
+
+class DynamicAttributeInterface:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `og.DynamicAttributeInterface`.
+    """
+
+
+class DynamicAttributeAccess:
+    """
+    Stand-in of `og.DynamicAttributeAccess`, the base of the generated attribute accessors. Names which are not defined
+    by the generated class are looked up in the dynamic attributes of the node.
+    """
+
+    def __init__(self, context: typing.Any, node: Node, attributes: typing.Any, dynamic_attributes: str) -> None:
+        """
+        Args:
+            context (Any): Graph context.
+            node (Node): Node of the attributes.
+            attributes (Any): Static attributes by their names without the port prefix.
+            dynamic_attributes (str): Port prefix of the dynamic attributes, see `Database.dynamic_attribute_data`.
+        """
+        object.__setattr__(self, "_context", context)
+        object.__setattr__(self, "_node", node)
+        object.__setattr__(self, "_attributes", attributes)
+        object.__setattr__(self, "_port", dynamic_attributes)
+        object.__setattr__(self, "_setting_locked", False)
+
+    def __getattr__(self, item: str) -> typing.Any:
+        node = object.__getattribute__(self, "_node")
+        attr_name = f"{object.__getattribute__(self, '_port')}:{item}"
+        if node.get_attribute_exists(attr_name):
+            return node.get_attribute(attr_name).get()
+        raise AttributeError(item)
+
+    def __setattr__(self, item: str, value: typing.Any) -> None:
+        attr_name = f"{self._port}:{item}"
+        if not hasattr(type(self), item) and self._node.get_attribute_exists(attr_name):
+            self._node.get_attribute(attr_name).value = value
+        else:
+            object.__setattr__(self, item, value)
+
+
+class Database:
+    """
+    Stand-in of `og.Database`, the base of the generated node databases.
+    """
+
+    PER_NODE_DATA: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+    INTERFACE: typing.List[str] = []
+
+    def __init__(self, node: Node) -> None:
+        self.node = node
+        ports: typing.Dict[str, typing.Dict[str, Attribute]] = {"inputs": {}, "outputs": {}, "state": {}}
+        for attr_name in type(self).INTERFACE:
+            port, _, name = attr_name.partition(":")
+            ports[port][name] = node.get_attribute(attr_name)
+        self.attributes = types.SimpleNamespace(
+            **{port: types.SimpleNamespace(**attributes) for port, attributes in ports.items()}
+        )
+
+    @staticmethod
+    def _get_interface(attributes: typing.List[typing.Tuple[typing.Any, ...]]) -> typing.List[str]:
+        """
+        Args:
+            attributes (List[Tuple[Any, ...]]): Generated attribute descriptions.
+
+        Returns:
+            List[str]: Attribute names.
+        """
+        return [attribute[0] for attribute in attributes]
+
+    @staticmethod
+    def dynamic_attribute_data(node: Node, port: str) -> str:  # pylint: disable=unused-argument
+        """
+        Args:
+            node (Node): N/A.
+            port (str): Port type, see `AttributePortType`.
+
+        Returns:
+            str: Port prefix of the attribute names.
+        """
+        return port
+
+    @property
+    def internal_state(self) -> typing.Any:
+        """
+        Returns:
+            Any: Internal state of the node.
+        """
+        return self.node.internal_state
+
+    def log_warning(self, message: str) -> None:
+        """
+        Args:
+            message (str): Logged message.
+        """
+        self.node.errors.append(message)
+
+    def log_error(self, message: str, add_context: bool = True) -> None:  # pylint: disable=unused-argument
+        """
+        Args:
+            message (str): Logged message.
+            add_context (bool): N/A.
+        """
+        self.node.errors.append(message)
+
+    @classmethod
+    def _initialize_per_node_data(cls, node: Node) -> None:
+        """
+        Args:
+            node (Node): Initialized node.
+        """
+        cls.PER_NODE_DATA[node.node_id()] = {}
+
+    @classmethod
+    def _release_per_node_data(cls, node: Node) -> None:
+        """
+        Args:
+            node (Node): Released node.
+        """
+        cls.PER_NODE_DATA.pop(node.node_id(), None)
+
+
+def _prefetch_input_attributes_data(attributes: typing.List[Attribute]) -> typing.List[typing.Any]:
+    """
+    Stand-in of `_og._prefetch_input_attributes_data`.
+
+    Args:
+        attributes (List[Attribute]): Prefetched attributes.
+
+    Returns:
+        List[Any]: Values of the attributes.
+    """
+    return [attribute.get() for attribute in attributes]
+
+
+def _commit_output_attributes_data(values: typing.Dict[Attribute, typing.Any]) -> None:
+    """
+    Stand-in of `_og._commit_output_attributes_data`.
+
+    Args:
+        values (Dict[Attribute, Any]): Written values by the attributes.
+    """
+    for attribute, value in values.items():
+        attribute.value = value
+
+
+class MetadataKeys:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `ogn.MetadataKeys`.
+    """
+
+    CATEGORIES = "__categories"
+    CATEGORY_DESCRIPTIONS = "__categoryDescriptions"
+    DEFAULT = "__default"
+    DESCRIPTION = "__description"
+    EXTENSION = "__extension"
+    LANGUAGE = "__language"
+    UI_NAME = "uiName"
+
+
+def evaluate(node: Node) -> bool:
+    """
+    Evaluates the node by the `abi.compute` of its generated database: unresolved required extended attributes skip the
+    compute, and the warnings and raised errors are logged into `Node.errors`.
+
+    Args:
+        node (Node): Evaluated node.
+
+    Returns:
+        bool: Result of the compute.
+    """
+    return RUNTIME.databases[node.type_name].abi.compute(None, node)
@@ -0,0 +1,57 @@
+"""
+Stand-ins of the small Kit modules (`pxr.Sdf`, `omni.ext`) and the `metron_shared` parameter validators.
+"""
+import typing
+
+
+def check_type(value: typing.Any, expected_type: typing.Any) -> None:
+    """
+    Stand-in of `metron_shared.param_validators.check_type` supporting plain classes, `Optional`, `Any` and `List`. As
+    in typeguard, `int` values are accepted for `float`.
+
+    Args:
+        value (Any): Checked value.
+        expected_type (Any): Expected type.
+
+    Raises:
+        TypeError: Raised if the value doesn't match the expected type.
+    """
+    origin = typing.get_origin(expected_type)
+    if expected_type is typing.Any:
+        return
+    if origin is typing.Union:
+        for option in typing.get_args(expected_type):
+            try:
+                check_type(value, option)
+                return
+            except TypeError:
+                pass
+        raise TypeError(f"{value!r} is not {expected_type}.")
+    if origin is list:
+        check_type(value, list)
+        for item in value:
+            check_type(item, typing.get_args(expected_type)[0])
+        return
+    if expected_type is type(None):
+        if value is not None:
+            raise TypeError(f"{value!r} is not None.")
+        return
+    if expected_type is float and isinstance(value, int):
+        return
+    if not isinstance(value, expected_type):
+        raise TypeError(f"{value!r} is not {expected_type}.")
+
+
+class SdfPath:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `pxr.Sdf.Path`.
+    """
+
+    def __init__(self, path: str = "") -> None:
+        self.pathString = path  # pylint: disable=invalid-name
+
+
+class IExt:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `omni.ext.IExt`.
+    """
@@ -0,0 +1,605 @@
+"""
+Stand-in of the `omni.graph.core` types, attributes, nodes, graphs and `og.Controller`, and the state of the stand-in
+runtime.
+"""
+import json
+import os
+import typing
+import numpy as np
+from ardagen_headless import EXT_ROOT
+
+OGN_NODES_DIR = os.path.join(EXT_ROOT, "metron", "ai", "ardagen", "ogn", "nodes")
+DEFAULT_GRAPH_PATH = "/Replicator/SDGPipeline"
+
+
+class BaseDataType:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `og.BaseDataType`.
+    """
+
+    UNKNOWN = "unknown"
+    BOOL = "bool"
+    INT = "int"
+    INT64 = "int64"
+    UINT64 = "uint64"
+    DOUBLE = "double"
+    FLOAT = "float"
+    TOKEN = "token"
+    STRING = "string"
+
+
+_BASE_TYPES = {
+    "bool": BaseDataType.BOOL,
+    "int": BaseDataType.INT,
+    "int64": BaseDataType.INT64,
+    "uint64": BaseDataType.UINT64,
+    "double": BaseDataType.DOUBLE,
+    "float": BaseDataType.FLOAT,
+    "token": BaseDataType.TOKEN,
+    "string": BaseDataType.STRING,
+    "any": BaseDataType.UNKNOWN,
+}
+_NUMPY_TYPES = {
+    BaseDataType.BOOL: np.bool_,
+    BaseDataType.INT: np.int32,
+    BaseDataType.INT64: np.int64,
+    BaseDataType.UINT64: np.uint64,
+    BaseDataType.DOUBLE: np.float64,
+    BaseDataType.FLOAT: np.float32,
+    BaseDataType.TOKEN: object,
+}
+
+
+class Type:
+    """
+    Stand-in of `og.Type`.
+    """
+
+    def __init__(self, base_type: str, tuple_count: int = 1, array_depth: int = 0, role: typing.Any = None) -> None:
+        self.base_type = base_type
+        self.tuple_count = tuple_count
+        self.array_depth = array_depth
+        self.role = role
+
+    @staticmethod
+    def from_ogn_type_name(type_name: str) -> "Type":
+        """
+        Parses OGN type name like `double3[]`.
+
+        Args:
+            type_name (str): OGN type name.
+
+        Returns:
+            Type: Parsed type.
+        """
+        array_depth = 1 if type_name.endswith("[]") else 0
+        base_name = type_name[:-2] if array_depth else type_name
+        tuple_count = 1
+        if base_name[-1].isdigit() and base_name not in _BASE_TYPES:
+            tuple_count = int(base_name[-1])
+            base_name = base_name[:-1]
+        return Type(_BASE_TYPES[base_name], tuple_count, array_depth)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Type) and (self.base_type, self.tuple_count, self.array_depth) == (
+            other.base_type,
+            other.tuple_count,
+            other.array_depth,
+        )
+
+    def __repr__(self) -> str:
+        return f"Type({self.base_type}, {self.tuple_count}, {self.array_depth})"
+
+
+class AttributeType:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `og.AttributeType`.
+    """
+
+    @staticmethod
+    def type_from_ogn_type_name(type_name: str) -> Type:
+        """
+        Args:
+            type_name (str): OGN type name.
+
+        Returns:
+            Type: Parsed type.
+        """
+        return Type.from_ogn_type_name(type_name)
+
+
+class AttributePortType:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `og.AttributePortType`.
+    """
+
+    ATTRIBUTE_PORT_TYPE_INPUT = "inputs"
+    ATTRIBUTE_PORT_TYPE_OUTPUT = "outputs"
+    ATTRIBUTE_PORT_TYPE_STATE = "state"
+
+
+class Attribute:
+    """
+    Stand-in of `og.Attribute`.
+    """
+
+    def __init__(self, node: "Node", name: str, attr_type: Type, default: typing.Any = None) -> None:
+        self.node = node
+        self.name = name
+        self.type = attr_type
+        self.value = default
+        # Value authored into USD, i.e. persisted with the stage. Values written by computes live in Fabric only.
+        self.usd_value = default
+        self.upstream: typing.List["Attribute"] = []
+        self.downstream: typing.List["Attribute"] = []
+
+    def get_name(self) -> str:
+        """
+        Returns:
+            str: Attribute name.
+        """
+        return self.name
+
+    def get_node(self) -> "Node":
+        """
+        Returns:
+            Node: Owning node.
+        """
+        return self.node
+
+    def get_resolved_type(self) -> Type:
+        """
+        Returns:
+            Type: Resolved type of the attribute.
+        """
+        return self.type
+
+    def get_attribute_data(self) -> "Attribute":
+        """
+        Returns:
+            Attribute: The attribute itself, it holds its data.
+        """
+        return self
+
+    def set_resolved_type(self, attr_type: Type) -> None:
+        """
+        Args:
+            attr_type (Type): Resolved type.
+        """
+        self.type = attr_type
+
+    def get(self) -> typing.Any:
+        """
+        Returns:
+            Any: Value of the attribute, the upstream value for connected inputs.
+        """
+        return self.upstream[0].get() if self.upstream else self.value
+
+    def set(self, value: typing.Any) -> None:
+        """
+        Sets the value. Values of the resolved array attributes are stored as typed arrays, like in Fabric.
+
+        Args:
+            value (Any): New value.
+        """
+        RUNTIME.edit_count += 1
+        if self.type.array_depth == 1 and self.type.base_type in _NUMPY_TYPES and value is not None:
+            value = np.asarray(value, dtype=_NUMPY_TYPES[self.type.base_type])
+        self.value = self.usd_value = value
+        self.node.on_value_changed(self)
+
+    def connect(self, other: "Attribute", modify_usd: bool) -> None:  # pylint: disable=unused-argument
+        """
+        Connects the attribute to a downstream attribute.
+
+        Args:
+            other (Attribute): Downstream attribute.
+            modify_usd (bool): N/A.
+        """
+        RUNTIME.edit_count += 1
+        self.downstream.append(other)
+        other.upstream.append(self)
+        for callback in other.node.connected_callbacks:
+            callback(self, other)
+
+    def disconnect(self, other: "Attribute", modify_usd: bool) -> None:  # pylint: disable=unused-argument
+        """
+        Disconnects the attribute from a downstream attribute.
+
+        Args:
+            other (Attribute): Downstream attribute.
+            modify_usd (bool): N/A.
+        """
+        RUNTIME.edit_count += 1
+        self.downstream.remove(other)
+        other.upstream.remove(self)
+        for callback in other.node.disconnected_callbacks:
+            callback(self, other)
+
+    def get_downstream_connection_count(self) -> int:
+        """
+        Returns:
+            int: Number of the downstream connections.
+        """
+        return len(self.downstream)
+
+
+class AttributeValueHelper:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `og.AttributeValueHelper`.
+    """
+
+    def __init__(self, attribute: Attribute) -> None:
+        self.attribute = attribute
+
+    def resolve_type(self, attr_type: Type) -> None:
+        """
+        Args:
+            attr_type (Type): Resolved type.
+        """
+        self.attribute.set_resolved_type(attr_type)
+
+    def get(self, reserved_element_count: typing.Optional[int] = None) -> typing.Any:  # pylint: disable=unused-argument
+        """
+        Args:
+            reserved_element_count (Optional[int]): N/A.
+
+        Returns:
+            Any: Attribute value.
+        """
+        return self.attribute.get()
+
+    def set(self, value: typing.Any, update_usd: bool = False) -> None:
+        """
+        Writes the value into Fabric, i.e. without an authoring edit. Values of the resolved array attributes are stored
+        as typed arrays.
+
+        Args:
+            value (Any): New value.
+            update_usd (bool): If True, the value is authored into USD too.
+        """
+        attr_type = self.attribute.type
+        if attr_type.array_depth == 1 and attr_type.base_type in _NUMPY_TYPES and value is not None:
+            value = np.asarray(value, dtype=_NUMPY_TYPES[attr_type.base_type])
+        self.attribute.value = value
+        if update_usd:
+            self.attribute.usd_value = value
+
+    def get_array_size(self) -> int:
+        """
+        Returns:
+            int: Number of the elements of an array value.
+        """
+        return 0 if self.attribute.value is None else len(self.attribute.value)
+
+
+class Node:  # pylint: disable=too-many-instance-attributes
+    """
+    Stand-in of `og.Node`.
+    """
+
+    _next_node_id = 0
+
+    def __init__(self, graph: "Graph", path: str, type_name: str) -> None:
+        self.graph = graph
+        self.path = path
+        self.type_name = type_name
+        self.valid = True
+        self.attributes: typing.Dict[str, Attribute] = {}
+        self.connected_callbacks: typing.List[typing.Callable[[Attribute, Attribute], None]] = []
+        self.disconnected_callbacks: typing.List[typing.Callable[[Attribute, Attribute], None]] = []
+        self.internal_state: typing.Any = None
+        self.errors: typing.List[str] = []
+        self._node_id = Node._next_node_id
+        Node._next_node_id += 1
+
+    def node_id(self) -> int:
+        """
+        Returns:
+            int: Unique node id.
+        """
+        return self._node_id
+
+    def get_prim_path(self) -> str:
+        """
+        Returns:
+            str: Node path.
+        """
+        return self.path
+
+    def get_type_name(self) -> str:
+        """
+        Returns:
+            str: Node type name.
+        """
+        return self.type_name
+
+    def get_graph(self) -> "Graph":
+        """
+        Returns:
+            Graph: Owning graph.
+        """
+        return self.graph
+
+    def is_valid(self) -> bool:
+        """
+        Returns:
+            bool: False once the node was deleted.
+        """
+        return self.valid
+
+    def get_attribute(self, name: str) -> Attribute:
+        """
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            Attribute: Attribute of the node.
+        """
+        return self.attributes[name]
+
+    def get_attributes(self) -> typing.List[Attribute]:
+        """
+        Returns:
+            List[Attribute]: All attributes of the node including the dynamic ones.
+        """
+        return list(self.attributes.values())
+
+    def get_attribute_exists(self, name: str) -> bool:
+        """
+        Args:
+            name (str): Attribute name.
+
+        Returns:
+            bool: True if the node has the attribute.
+        """
+        return name in self.attributes
+
+    def register_on_connected_callback(self, callback: typing.Callable[[Attribute, Attribute], None]) -> None:
+        """
+        Args:
+            callback (Callable[[Attribute, Attribute], None]): Callback called when an input gets connected.
+        """
+        self.connected_callbacks.append(callback)
+
+    def register_on_disconnected_callback(self, callback: typing.Callable[[Attribute, Attribute], None]) -> None:
+        """
+        Args:
+            callback (Callable[[Attribute, Attribute], None]): Callback called when an input gets disconnected.
+        """
+        self.disconnected_callbacks.append(callback)
+
+    def on_value_changed(self, attribute: Attribute) -> None:
+        """
+        Resolves `inputs:array` of the Replicator array node from `inputs:arrayType`.
+
+        Args:
+            attribute (Attribute): Changed attribute.
+        """
+        if self.type_name == "omni.replicator.core.OgnArray" and attribute.name == "inputs:arrayType":
+            self.attributes["inputs:array"].type = Type.from_ogn_type_name(f"{attribute.value}[]")
+
+
+class Graph:
+    """
+    Stand-in of `og.Graph`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.nodes: typing.Dict[str, Node] = {}
+
+    def get_path_to_graph(self) -> str:
+        """
+        Returns:
+            str: Graph path.
+        """
+        return self.path
+
+    def get_default_graph_context(self) -> None:  # pylint: disable=no-self-use
+        """
+        Returns:
+            None: The stand-in has no graph context.
+        """
+        return None
+
+    def get_node(self, path: str) -> Node:
+        """
+        Args:
+            path (str): Node path.
+
+        Returns:
+            Node: Node of the path, or an invalid node if there is none.
+        """
+        node = self.nodes.get(path)
+        if node is None:
+            node = Node(self, path, "")
+            node.valid = False
+        return node
+
+    def create_node(self, name: str, type_name: str, **input_values: typing.Any) -> Node:
+        """
+        Creates a node with the attributes of its type.
+
+        Args:
+            name (str): Node name.
+            type_name (str): Node type name.
+            **input_values (Any): Input values by the input names without the `inputs:` prefix.
+
+        Returns:
+            Node: Created node.
+        """
+        RUNTIME.edit_count += 1
+        node = Node(self, f"{self.path}/{name}", type_name)
+        for attr_name, (attr_type, default) in RUNTIME.node_type_attributes(type_name).items():
+            node.attributes[attr_name] = Attribute(node, attr_name, Type.from_ogn_type_name(attr_type), default)
+        self.nodes[node.path] = node
+        node_class = RUNTIME.node_classes.get(type_name)
+        if node_class is not None:
+            node.internal_state = node_class.internal_state()
+            RUNTIME.databases[type_name].abi.initialize(None, node)
+        for input_name, value in input_values.items():
+            node.get_attribute(f"inputs:{input_name}").set(value)
+        return node
+
+    def free_node_name(self, base_name: str) -> str:
+        """
+        Args:
+            base_name (str): Base of the node name.
+
+        Returns:
+            str: Node name not used in the graph yet.
+        """
+        name = base_name
+        index = 0
+        while f"{self.path}/{name}" in self.nodes:
+            index += 1
+            name = f"{base_name}_{index:02d}"
+        return name
+
+
+class Controller:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `og.Controller`.
+    """
+
+    class Keys:  # pylint: disable=too-few-public-methods
+        """
+        Stand-in of `og.Controller.Keys`.
+        """
+
+        CREATE_NODES = "create_nodes"
+        SET_VALUES = "set_values"
+        CONNECT = "connect"
+
+    @staticmethod
+    def create_attribute(  # pylint: disable=unused-argument
+        node: Node, name: str, type_name: str, port: str
+    ) -> Attribute:
+        """
+        Creates a dynamic attribute.
+
+        Args:
+            node (Node): Node of the attribute.
+            name (str): Attribute name with the port prefix.
+            type_name (str): OGN type name.
+            port (str): N/A, the port is given by the name prefix.
+
+        Returns:
+            Attribute: Created attribute.
+        """
+        RUNTIME.edit_count += 1
+        attribute = Attribute(node, name, Type.from_ogn_type_name(type_name))
+        node.attributes[name] = attribute
+        return attribute
+
+    @staticmethod
+    def edit(graph: Graph, edits: typing.Dict[str, typing.Any]) -> None:
+        """
+        Applies the graph edits in the order creation, connection and value setting.
+
+        Args:
+            graph (Graph): Edited graph.
+            edits (Dict[str, Any]): Edits by the `Keys`.
+        """
+        RUNTIME.edit_count += 1
+        RUNTIME.controller_edit_count += 1
+        for name, type_name in edits.get(Controller.Keys.CREATE_NODES, []):
+            graph.create_node(name, type_name)
+        for src_path, dst_path in edits.get(Controller.Keys.CONNECT, []):
+            _attribute_of_path(graph, src_path).connect(_attribute_of_path(graph, dst_path), True)
+        for attr_path, value in edits.get(Controller.Keys.SET_VALUES, []):
+            _attribute_of_path(graph, attr_path).set(value)
+
+
+def _attribute_of_path(graph: Graph, attr_path: str) -> Attribute:
+    """
+    Args:
+        graph (Graph): Graph of the attribute.
+        attr_path (str): Attribute path `<node path>.<attribute name>`.
+
+    Returns:
+        Attribute: Attribute of the path.
+    """
+    node_path, attr_name = attr_path.rsplit(".", 1)
+    return graph.nodes[node_path].get_attribute(attr_name)
+
+
+class StandInRuntime:  # pylint: disable=too-many-instance-attributes
+    """
+    State of the stand-in runtime: graphs, loaded node classes and edit counters.
+    """
+
+    def __init__(self) -> None:
+        self.graphs: typing.Dict[str, Graph] = {}
+        self.node_classes: typing.Dict[str, typing.Any] = {}
+        self.databases: typing.Dict[str, typing.Any] = {}
+        self.registered_distributions: typing.List[typing.Callable[..., typing.Any]] = []
+        self.pip_installs: typing.List[str] = []
+        self.edit_count = 0
+        self.controller_edit_count = 0
+        # Number of the nodes created by the `rep.utils.create_node` stand-in, the last node id it set.
+        self.replicator_node_count = 0
+        self._node_type_attributes: typing.Dict[str, typing.Dict[str, typing.Tuple[str, typing.Any]]] = {
+            "omni.replicator.core.OgnArray": {"inputs:arrayType": ("token", "int"), "inputs:array": ("any", None)}
+        }
+
+    def reset(self) -> None:
+        """
+        Drops all graphs and resets the counters.
+        """
+        self.graphs.clear()
+        self.edit_count = 0
+        self.controller_edit_count = 0
+        self.replicator_node_count = 0
+
+    def graph(self, path: str = DEFAULT_GRAPH_PATH) -> Graph:
+        """
+        Args:
+            path (str): Graph path.
+
+        Returns:
+            Graph: Graph of the path, it is created if it doesn't exist.
+        """
+        if path not in self.graphs:
+            self.graphs[path] = Graph(path)
+        return self.graphs[path]
+
+    def node_type_attributes(self, type_name: str) -> typing.Dict[str, typing.Tuple[str, typing.Any]]:
+        """
+        Returns attributes of a node type. Extension node types are read from their `.ogn` files.
+
+        Args:
+            type_name (str): Node type name.
+
+        Returns:
+            Dict[str, Tuple[str, Any]]: OGN type name and default value by the attribute name.
+        """
+        if type_name not in self._node_type_attributes:
+            node_name = type_name.rsplit(".", 1)[-1]
+            with open(os.path.join(OGN_NODES_DIR, f"Ogn{node_name}.ogn"), "r", encoding="utf-8") as ogn_file:
+                spec = json.load(ogn_file)[node_name]
+            attributes = {}
+            for port in ("inputs", "outputs"):
+                for attr_name, attr_spec in spec.get(port, {}).items():
+                    attributes[f"{port}:{attr_name}"] = (attr_spec["type"], attr_spec.get("default"))
+            self._node_type_attributes[type_name] = attributes
+        return self._node_type_attributes[type_name]
+
+
+RUNTIME = StandInRuntime()
+
+
+def create_node(node_type_id: str, **kwargs: typing.Any) -> Node:
+    """
+    Creates a node in the default Replicator graph. The node has no `inputs:nodeId`, so its node id is 0.
+
+    Args:
+        node_type_id (str): Node type name.
+        **kwargs (Any): Input values by the input names without the `inputs:` prefix.
+
+    Returns:
+        Node: Created node.
+    """
+    graph = RUNTIME.graph()
+    return graph.create_node(graph.free_node_name(node_type_id.rsplit(".", 1)[-1]), node_type_id, **kwargs)
@@ -0,0 +1,44 @@
+"""
+Stand-in of the `omni.replicator.core` parts used by the extension.
+"""
+import typing
+import numpy as np
+from .og import RUNTIME, Controller, Node, create_node
+
+
+class ReplicatorRNG:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in of `rep.rng.ReplicatorRNG`.
+    """
+
+    def __init__(self) -> None:
+        self.seed: typing.Optional[int] = None
+        self.generator = np.random.default_rng()
+
+    def initialize(self, seed: int, node: typing.Any, node_id: int) -> None:  # pylint: disable=unused-argument
+        """
+        Args:
+            seed (int): Seed, a value less than 0 means the global seed 0.
+            node (Any): N/A.
+            node_id (int): Id of the node.
+        """
+        self.seed = seed
+        self.generator = np.random.default_rng([max(seed, 0), node_id])
+
+
+def create_replicator_node(node_type_id: str, **kwargs: typing.Any) -> Node:
+    """
+    Stand-in of `rep.utils.create_node`. Like Replicator, it creates the node in the default Replicator graph and sets
+    its `inputs:nodeId` to a new id, so the nodes with the same seed draw different streams.
+
+    Args:
+        node_type_id (str): Node type name.
+        **kwargs (Any): Input values by the input names without the `inputs:` prefix.
+
+    Returns:
+        Node: Created node.
+    """
+    node = create_node(node_type_id, **kwargs)
+    RUNTIME.replicator_node_count += 1
+    Controller.create_attribute(node, "inputs:nodeId", "int", "input").set(RUNTIME.replicator_node_count)
+    return node
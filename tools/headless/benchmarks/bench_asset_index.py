@@ -0,0 +1,88 @@
+"""
+Benchmark of the asset directory index: cold scan, warm refresh and refresh after a change of one directory.
+
+Generates a tree of empty asset files in a temporary directory. The warm refresh only stats the directories, so it
+should take milliseconds also for hundreds of thousands of assets.
+
+Run: `python tools/headless/benchmarks/bench_asset_index.py --assets 200000`
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ardagen_standin  # noqa: E402 pylint: disable=wrong-import-position
+
+ardagen_standin.install_standins()
+
+from metron.ai.ardagen.asset_index import AssetIndex  # noqa: E402 pylint: disable=wrong-import-position
+
+ASSETS = 200_000
+ASSETS_PER_DIRECTORY = 100
+
+
+def make_tree(root: str, num_assets: int) -> None:
+    """
+    Creates a two level tree of empty `.usd` files.
+
+    Args:
+        root (str): Root directory of the tree.
+        num_assets (int): Number of the files.
+    """
+    for asset_idx in range(num_assets):
+        dir_idx = asset_idx // ASSETS_PER_DIRECTORY
+        directory = os.path.join(root, f"group_{dir_idx // 100:04d}", f"dir_{dir_idx:06d}")
+        if asset_idx % ASSETS_PER_DIRECTORY == 0:
+            os.makedirs(directory)
+        open(os.path.join(directory, f"asset_{asset_idx}.usd"), "wb").close()  # pylint: disable=consider-using-with
+
+
+def timed_refresh(root: str, index_dir: str) -> typing.Tuple[float, bool]:
+    """
+    Loads the stored index and refreshes it.
+
+    Args:
+        root (str): Root directory of the assets.
+        index_dir (str): Directory of the index.
+
+    Returns:
+        Tuple[float, bool]: Time in milliseconds and whether the index was changed.
+    """
+    start = time.perf_counter()
+    is_changed = AssetIndex(root, index_dir, (".usd",)).refresh()
+    return (time.perf_counter() - start) * 1e3, is_changed
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark and prints the timings.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--assets", type=int, default=ASSETS, help="Number of the generated assets.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = os.path.join(tmp_dir, "assets")
+        index_dir = os.path.join(tmp_dir, "index")
+        make_tree(root, args.assets)
+
+        cold_ms, _ = timed_refresh(root, index_dir)
+        warm_ms, warm_changed = timed_refresh(root, index_dir)
+        open(os.path.join(root, "group_0000", "dir_000000", "new.usd"), "wb").close()  # pylint: disable=R1732
+        changed_ms, _ = timed_refresh(root, index_dir)
+
+    print(f"assets: {args.assets}")
+    print(f"cold scan [ms]:           {cold_ms:10.1f}")
+    print(f"warm refresh [ms]:        {warm_ms:10.1f} (changed: {warm_changed})")
+    print(f"one changed dir [ms]:     {changed_ms:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark of a frame of many SampleShuffle nodes in the random keys mode evaluated one by one and by the batch
+evaluator.
+
+The frames run through the generated `OgnSampleShuffleDatabase.abi.compute` on the stand-in runtime:
+    unbatched: every node computes its permutation and gathers its samples.
+    batched: `BATCH_EVALUATOR.evaluate` draws and gathers all nodes by length groups, the node computes then only
+        acknowledge the written outputs.
+    batch pass: `BATCH_EVALUATOR.evaluate` alone.
+The outputs of both paths are checked to be identical before the timing.
+
+Run: `python tools/headless/benchmarks/bench_batch_evaluator.py --nodes 1000`
+"""
+import argparse
+import functools
+import os
+import sys
+import timeit
+import typing
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ardagen_standin  # noqa: E402 pylint: disable=wrong-import-position
+
+ardagen_standin.install_standins()
+
+from metron.ai.ardagen.batch_evaluator import BATCH_EVALUATOR  # noqa: E402 pylint: disable=wrong-import-position
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+NODES = 1000
+FRAMES = 20
+REPEATS = 5
+
+
+def make_nodes(count: int, sizes: typing.Sequence[int]) -> typing.List[typing.Any]:
+    """
+    Creates random keys shuffle nodes fed by int array nodes, the sizes are assigned round robin.
+
+    Args:
+        count (int): Number of the shuffle nodes.
+        sizes (Sequence[int]): Numbers of the choices.
+
+    Returns:
+        List[Any]: Shuffle nodes.
+    """
+    nodes = []
+    for index in range(count):
+        node = ardagen_standin.create_node(SHUFFLE_NODE_TYPE, seed=index, randomKeys=True)
+        array_node = ardagen_standin.create_node("omni.replicator.core.OgnArray", arrayType="int")
+        array_node.get_attribute("inputs:array").set(list(range(sizes[index % len(sizes)])))
+        array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+        nodes.append(node)
+    return nodes
+
+
+def frame_samples(nodes: typing.List[typing.Any], batched: bool) -> typing.List[np.ndarray]:
+    """
+    Evaluates a frame.
+
+    Args:
+        nodes (List[Any]): Evaluated nodes.
+        batched (bool): If True, the batch evaluator runs before the node computes.
+
+    Returns:
+        List[np.ndarray]: Samples of every node.
+    """
+    evaluate_frame(nodes, batched)
+    return [np.copy(node.get_attribute("outputs:samples").value) for node in nodes]
+
+
+def evaluate_frame(nodes: typing.List[typing.Any], batched: bool) -> None:
+    """
+    Args:
+        nodes (List[Any]): Evaluated nodes.
+        batched (bool): If True, the batch evaluator runs before the node computes.
+    """
+    if batched:
+        BATCH_EVALUATOR.evaluate()
+    for node in nodes:
+        ardagen_standin.evaluate(node)
+
+
+def batch_pass(nodes: typing.List[typing.Any]) -> None:
+    """
+    Runs the batch evaluator alone. The batched outputs are marked as consumed, so every pass evaluates all nodes.
+
+    Args:
+        nodes (List[Any]): Registered nodes.
+    """
+    BATCH_EVALUATOR.evaluate()
+    for node in nodes:
+        node.internal_state.batched = False
+
+
+def frame_ms(func: typing.Callable[[], None], frames: int) -> float:
+    """
+    Args:
+        func (Callable[[], None]): Evaluation of a frame.
+        frames (int): Number of the frames per repeat.
+
+    Returns:
+        float: Best average time of a frame in milliseconds.
+    """
+    return min(timeit.repeat(func, number=frames, repeat=REPEATS)) / frames * 1e3
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark and prints the results table.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--nodes", type=int, default=NODES, help="Number of the shuffle nodes.")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="Number of the frames per repeat.")
+    args = parser.parse_args(argv)
+
+    print(f"{'sizes':<14} {'unbatched [ms]':>15} {'batched [ms]':>13} {'batch pass [ms]':>16} {'speedup':>8}")
+    for sizes in ((8,), (64,), (256,), (8, 64, 256)):
+        # Both paths start from the same seeds, so their frames have to be identical. The first frame registers the
+        # nodes into the batch evaluator.
+        expected_nodes = make_nodes(args.nodes, sizes)
+        expected = [frame_samples(expected_nodes, batched=False) for _ in range(3)]
+        ardagen_standin.RUNTIME.reset()
+        BATCH_EVALUATOR.clear()
+        nodes = make_nodes(args.nodes, sizes)
+        for frame, expected_frame in enumerate(expected):
+            for samples, expected_samples in zip(frame_samples(nodes, batched=frame > 0), expected_frame):
+                np.testing.assert_array_equal(samples, expected_samples)
+
+        unbatched_ms = frame_ms(functools.partial(evaluate_frame, nodes, False), args.frames)
+        batched_ms = frame_ms(functools.partial(evaluate_frame, nodes, True), args.frames)
+        batch_pass_ms = frame_ms(functools.partial(batch_pass, nodes), args.frames)
+        label = ",".join(str(size) for size in sizes)
+        print(
+            f"{label:<14} {unbatched_ms:>15.2f} {batched_ms:>13.2f} {batch_pass_ms:>16.2f}"
+            f" {unbatched_ms / batched_ms:>7.2f}x"
+        )
+        ardagen_standin.RUNTIME.reset()
+        BATCH_EVALUATOR.clear()
+
+
+if __name__ == "__main__":
+    main()
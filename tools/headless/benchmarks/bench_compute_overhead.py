@@ -0,0 +1,97 @@
+"""
+Benchmark of the fixed per-evaluation cost of the SampleShuffle node on tiny arrays, where it dominates.
+
+Both columns run on the stand-in runtime:
+    generated: the generated `OgnSampleShuffleDatabase.abi.compute`, i.e. the per-node data lookup, the compute
+        signature introspection, prefetch, the node's compute and commit. The node checks the resolved types of its
+        extended attributes only after a connection change.
+    kernel: the node's compute called with the prefetched database directly, i.e. the floor of the generated compute.
+The stand-in attributes are plain Python objects, so the absolute numbers are lower than in Kit.
+
+Run: `python tools/headless/benchmarks/bench_compute_overhead.py --evaluations 20000`
+"""
+import argparse
+import os
+import sys
+import timeit
+import typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ardagen_standin  # noqa: E402 pylint: disable=wrong-import-position
+
+ardagen_standin.install_standins()
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+EVALUATIONS = 20_000
+REPEATS = 5
+
+
+def make_node(size: int, **inputs: typing.Any) -> typing.Any:
+    """
+    Creates a shuffle node fed by an int array node.
+
+    Args:
+        size (int): Number of the choices.
+        **inputs (Any): Inputs of the shuffle node.
+
+    Returns:
+        Any: Shuffle node.
+    """
+    node = ardagen_standin.create_node(SHUFFLE_NODE_TYPE, seed=1, **inputs)
+    array_node = ardagen_standin.create_node("omni.replicator.core.OgnArray", arrayType="int")
+    array_node.get_attribute("inputs:array").set(list(range(size)))
+    array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+    return node
+
+
+def bench(func: typing.Callable[[], typing.Any], number: int) -> float:
+    """
+    Measures the best average time of a single call.
+
+    Args:
+        func (Callable[[], Any]): Benchmarked function.
+        number (int): Number of calls per repeat.
+
+    Returns:
+        float: Time in microseconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number * 1e6
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark and prints the results table.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--evaluations", type=int, default=EVALUATIONS, help="Number of the evaluations per repeat.")
+    args = parser.parse_args(argv)
+
+    database = ardagen_standin.RUNTIME.databases[SHUFFLE_NODE_TYPE]
+    node_class = ardagen_standin.RUNTIME.node_classes[SHUFFLE_NODE_TYPE]
+    print(f"{'mode':<14} {'size':>5} {'generated [us]':>15} {'kernel [us]':>12}")
+    for mode, inputs in {"default": {}, "random access": {"randomAccess": True}, "epoch": {"epochMode": True}}.items():
+        for size in (4, 64):
+            node = make_node(size, **inputs)
+            assert database.abi.compute(None, node), node.errors
+
+            def generated(node: typing.Any = node) -> None:
+                database.abi.compute(None, node)
+
+            node_db = database.PER_NODE_DATA[node.node_id()]["_db"]
+
+            def kernel(node_db: typing.Any = node_db) -> None:
+                node_db.inputs._prefetch()  # pylint: disable=protected-access
+                node_class.compute(node_db)
+                node_db.outputs._commit()  # pylint: disable=protected-access
+
+            generated_us = bench(generated, args.evaluations)
+            kernel_us = bench(kernel, args.evaluations)
+            print(f"{mode:<14} {size:>5} {generated_us:>15.2f} {kernel_us:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
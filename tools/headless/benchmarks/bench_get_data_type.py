@@ -0,0 +1,73 @@
+"""
+Compares the data type inference with the per-element check across list sizes.
+
+Run: `python tools/headless/benchmarks/bench_get_data_type.py`
+"""
+import os
+import sys
+import timeit
+import typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ardagen_headless import load_ardagen  # noqa: E402 pylint: disable=wrong-import-position
+
+load_ardagen()
+
+from metron.ai.ardagen import utils  # noqa: E402 pylint: disable=wrong-import-position
+
+SIZES = [1_000, 10_000, 100_000, 500_000]
+REPEATS = 5
+
+
+def make_lists(size: int) -> typing.Dict[str, typing.List[typing.Any]]:
+    """
+    Creates lists of the benchmarked element types.
+
+    Args:
+        size (int): Number of the elements.
+
+    Returns:
+        Dict[str, List[Any]]: List per element type name.
+    """
+    return {
+        "int": list(range(size)),
+        "double": [float(i) for i in range(size)],
+        "double3": [(float(i), 0.0, 1.0) for i in range(size)],
+        "token": [f"/World/Assets/asset_{i}" for i in range(size)],
+    }
+
+
+def bench(func: typing.Callable[[typing.Any], typing.Any], data_list: typing.List[typing.Any], number: int) -> float:
+    """
+    Measures the best total time of the calls.
+
+    Args:
+        func (Callable[[Any], Any]): Benchmarked function.
+        data_list (List[Any]): Function argument.
+        number (int): Number of calls per repeat.
+
+    Returns:
+        float: Time in seconds.
+    """
+    return min(timeit.repeat(lambda: func(data_list), number=number, repeat=REPEATS))
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results table.
+    """
+    print(f"{'type':<8} {'size':>8} {'per-element [ms]':>17} {'inference [ms]':>15} {'speedup':>8}")
+    for size in SIZES:
+        number = max(1, 100_000 // size)
+        for type_name, data_list in make_lists(size).items():
+            baseline = bench(utils._get_data_type_by_element, data_list, number)  # pylint: disable=protected-access
+            inference = bench(utils.get_data_type, data_list, number)
+            print(
+                f"{type_name:<8} {size:>8} {baseline / number * 1e3:>17.3f} {inference / number * 1e3:>15.3f}"
+                f" {baseline / inference:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark of the `metron.ai.ardagen` import time against the stand-in Kit modules.
+
+Every case runs in a fresh interpreter with `-X importtime`. The stand-ins (and NumPy, which Kit has loaded already)
+are imported before the measured part. The `lazy` case is the package import done by Kit or a batch worker, the
+`eager` case also touches the extension, the distributions and the node registration, i.e. what the package import
+did before the lazy loading. The report lists the wall time and the slowest modules by their self time.
+
+Run: `python tools/headless/benchmarks/bench_import_time.py --repeats 5`
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import typing
+
+HEADLESS_DIR = os.path.join(os.path.dirname(__file__), "..")
+MARKER = "--- measured imports ---"
+REPEATS = 5
+TOP_MODULES = 8
+
+_SETUP = f"""
+import sys
+import time
+sys.path.insert(0, {os.path.abspath(HEADLESS_DIR)!r})
+from ardagen_standin import install_standins
+install_standins(run_package_init=True)
+print({MARKER!r}, file=sys.stderr, flush=True)
+start = time.perf_counter()
+import metron.ai.ardagen as ardagen
+"""
+CASES = {
+    "lazy": "",
+    "eager": "ardagen.ArDaGenExt, ardagen.distribution, ardagen.ogn\n",
+}
+_REPORT = "print((time.perf_counter() - start) * 1e3)\n"
+
+
+def run_case(body: str) -> typing.Tuple[float, typing.Dict[str, int]]:
+    """
+    Runs one import in a fresh interpreter.
+
+    Args:
+        body (str): Code run after the package import.
+
+    Returns:
+        Tuple[float, Dict[str, int]]: Wall time in milliseconds and the self time in microseconds of every module
+            imported in the measured part.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SETUP + body + _REPORT],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    self_times: typing.Dict[str, int] = {}
+    is_measured = False
+    for line in completed.stderr.splitlines():
+        if line == MARKER:
+            is_measured = True
+        elif is_measured and line.startswith("import time:") and "|" in line:
+            self_us, _, name = line[len("import time:") :].split("|")
+            if self_us.strip().isdigit():
+                self_times[name.strip()] = int(self_us)
+    return float(completed.stdout.splitlines()[-1]), self_times
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark and prints the report.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--repeats", type=int, default=REPEATS, help="Number of the runs per case.")
+    args = parser.parse_args(argv)
+
+    for name, body in CASES.items():
+        runs = [run_case(body) for _ in range(args.repeats)]
+        wall_ms = statistics.median(wall for wall, _ in runs)
+        self_times = runs[-1][1]
+        print(f"{name}: {wall_ms:.1f} ms median wall time, {len(self_times)} modules imported")
+        for module_name, self_us in sorted(self_times.items(), key=lambda item: -item[1])[:TOP_MODULES]:
+            print(f"    {self_us / 1e3:8.2f} ms  {module_name}")
+
+
+if __name__ == "__main__":
+    main()
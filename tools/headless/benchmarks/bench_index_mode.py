@@ -0,0 +1,81 @@
+"""
+Compares the payload shuffle with the index permutation mode of the SampleShuffle node.
+
+Run: `python tools/headless/benchmarks/bench_index_mode.py`
+"""
+import os
+import sys
+import timeit
+import typing
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ardagen_headless import load_ardagen  # noqa: E402 pylint: disable=wrong-import-position
+
+load_ardagen()
+
+from metron.ai.ardagen.permutation import gather, index_permutation  # noqa: E402 pylint: disable=wrong-import-position
+
+SIZES = [1_000, 100_000, 1_000_000]
+REPEATS = 5
+
+
+def make_payloads(size: int) -> typing.Dict[str, np.ndarray]:
+    """
+    Creates payloads of the benchmarked element types.
+
+    Args:
+        size (int): Number of the elements.
+
+    Returns:
+        Dict[str, np.ndarray]: Payload per element type name.
+    """
+    return {
+        "token": np.array([f"/World/Assets/asset_{i}" for i in range(size)], dtype=object),
+        "double3": np.random.default_rng(0).random((size, 3)),
+    }
+
+
+def bench(func: typing.Callable[[], typing.Any], number: int) -> float:
+    """
+    Measures the best average time of a single call.
+
+    Args:
+        func (Callable[[], Any]): Benchmarked function.
+        number (int): Number of calls per repeat.
+
+    Returns:
+        float: Time in milliseconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number * 1e3
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results table.
+    """
+    print(f"{'type':<8} {'size':>9} {'payload [ms]':>13} {'indices [ms]':>13} {'idx+gather [ms]':>16}")
+    for size in SIZES:
+        number = max(1, 100_000 // size)
+        for type_name, choices in make_payloads(size).items():
+            generator = np.random.default_rng(0)
+
+            def payload_shuffle() -> None:
+                shuffled = np.copy(choices)  # pylint: disable=cell-var-from-loop
+                generator.shuffle(shuffled, axis=0)  # pylint: disable=cell-var-from-loop
+
+            def index_only() -> None:
+                index_permutation(generator, len(choices))  # pylint: disable=cell-var-from-loop
+
+            def index_gather() -> None:
+                gather(choices, index_permutation(generator, len(choices)))  # pylint: disable=cell-var-from-loop
+
+            print(
+                f"{type_name:<8} {size:>9} {bench(payload_shuffle, number):>13.3f} {bench(index_only, number):>13.3f}"
+                f" {bench(index_gather, number):>16.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
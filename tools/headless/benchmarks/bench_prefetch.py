@@ -0,0 +1,121 @@
+"""
+Benchmark of the lookahead asset prefetch of a SampleShuffle node over a directory of dummy asset files.
+
+Every frame evaluates the node and "renders" its samples: the renderer takes `--frame-ms`, and every sample which was
+not prefetched is loaded synchronously first. The storage latency of a load is emulated by `--latency-ms` of sleep
+before the file is read, in the renderer as well as in the prefetch threads. The table shows the hit rate and the
+average frame time for several values of `inputs:prefetchFrames`, 0 being the baseline without the prefetch.
+
+Run: `python tools/headless/benchmarks/bench_prefetch.py --latency-ms 5 --workers 4`
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ardagen_standin  # noqa: E402 pylint: disable=wrong-import-position
+
+ardagen_standin.install_standins()
+
+from metron.ai.ardagen.prefetch import ASSET_PREFETCHER, read_ahead  # noqa: E402 pylint: disable=wrong-import-position
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+ASSETS = 200
+ASSET_SIZE = 64 * 1024
+NUM_SAMPLES = 8
+FRAMES = 30
+PREFETCH_FRAMES = [0, 1, 2, 4]
+
+
+def make_assets(directory: str, count: int) -> typing.List[str]:
+    """
+    Args:
+        directory (str): Directory of the assets.
+        count (int): Number of the assets.
+
+    Returns:
+        List[str]: Paths of the written dummy asset files.
+    """
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"asset_{index}.usd")
+        with open(path, "wb") as asset_file:
+            asset_file.write(os.urandom(ASSET_SIZE))
+        paths.append(path)
+    return paths
+
+
+def run(paths: typing.List[str], prefetch_frames: int, args: argparse.Namespace) -> typing.Tuple[float, float]:
+    """
+    Renders the frames of a new shuffle node.
+
+    Args:
+        paths (List[str]): Asset paths.
+        prefetch_frames (int): Value of `inputs:prefetchFrames`.
+        args (argparse.Namespace): Benchmark arguments.
+
+    Returns:
+        Tuple[float, float]: Hit rate and the average frame time in milliseconds.
+    """
+    latency = args.latency_ms / 1000
+
+    def slow_loader(path: str, is_cancelled: typing.Callable[[], bool]) -> int:
+        time.sleep(latency)
+        return read_ahead(path, is_cancelled)
+
+    ardagen_standin.RUNTIME.reset()
+    ASSET_PREFETCHER.configure(max_workers=args.workers, loader=slow_loader)
+    ASSET_PREFETCHER.reset_stats()
+    node = ardagen_standin.create_node(
+        SHUFFLE_NODE_TYPE, seed=1, numSamples=args.num_samples, prefetchFrames=prefetch_frames
+    )
+    array_node = ardagen_standin.create_node("omni.replicator.core.OgnArray", arrayType="token")
+    array_node.get_attribute("inputs:array").set(paths)
+    array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        misses = ASSET_PREFETCHER.misses
+        assert ardagen_standin.evaluate(node)
+        samples = node.get_attribute("outputs:samples").value
+        # Without the prefetch the node doesn't record its uses, so all samples are loaded by the renderer.
+        sync_loads = ASSET_PREFETCHER.misses - misses if prefetch_frames > 0 else len(samples)
+        for path in samples[:sync_loads]:
+            slow_loader(path, lambda: False)
+        time.sleep(args.frame_ms / 1000)
+    frame_ms = (time.perf_counter() - start) / args.frames * 1000
+    hit_rate = ASSET_PREFETCHER.hit_rate
+    ASSET_PREFETCHER.shutdown()
+    return hit_rate, frame_ms
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark and prints the results table.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--assets", type=int, default=ASSETS, help="Number of the dummy asset files.")
+    parser.add_argument("--num-samples", type=int, default=NUM_SAMPLES, help="Number of the assets per frame.")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="Number of the rendered frames.")
+    parser.add_argument("--frame-ms", type=float, default=20.0, help="Render time of a frame.")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Emulated storage latency of a load.")
+    parser.add_argument("--workers", type=int, default=4, help="Number of the prefetch threads.")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_assets(directory, args.assets)
+        print(f"{'prefetch':>9} {'hit rate':>9} {'frame [ms]':>11}")
+        for prefetch_frames in PREFETCH_FRAMES:
+            hit_rate, frame_ms = run(paths, prefetch_frames, args)
+            print(f"{prefetch_frames:>9} {hit_rate:>9.1%} {frame_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
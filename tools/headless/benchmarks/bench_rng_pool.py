@@ -0,0 +1,105 @@
+"""
+Benchmark of the RNG initialization of many shuffle nodes: per-node generators versus `rng_pool.RNG_POOL` substreams.
+
+Measures the init time and the traced memory of the generators of 10k nodes. The per-node baseline seeds a generator
+from (seed, node id) like the stand-in `ReplicatorRNG`. The pool is measured with the lazily created generators
+untouched (random access and schedule modes) and after the first draw of every node.
+
+Run: `python tools/headless/benchmarks/bench_rng_pool.py --nodes 10000`
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import typing
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ardagen_standin  # noqa: E402 pylint: disable=wrong-import-position
+
+ardagen_standin.install_standins()
+
+from metron.ai.ardagen.rng_pool import RNGPool  # noqa: E402 pylint: disable=wrong-import-position
+
+NODES = 10_000
+SEED = 42
+
+
+def per_node(num_nodes: int) -> typing.List[typing.Any]:
+    """
+    Args:
+        num_nodes (int): Number of the nodes.
+
+    Returns:
+        List[Any]: Initialized per-node generators.
+    """
+    rngs = []
+    for node_id in range(num_nodes):
+        rng = ardagen_standin.ReplicatorRNG()
+        rng.initialize(SEED, None, node_id)
+        rngs.append(rng)
+    return rngs
+
+
+def pooled(num_nodes: int, draw: bool) -> RNGPool:
+    """
+    Args:
+        num_nodes (int): Number of the nodes.
+        draw (bool): If True, every substream draws once, so its generator is created.
+
+    Returns:
+        RNGPool: Pool with the substreams of the nodes.
+    """
+    pool = RNGPool()
+    for node_id in range(num_nodes):
+        stream = pool.acquire(f"/Replicator/SDGPipeline/SampleShuffle_{node_id}", SEED, node_id)
+        if draw:
+            stream.generator.random()
+    return pool
+
+
+def measure(function: typing.Callable[[], typing.Any]) -> typing.Tuple[float, float]:
+    """
+    Args:
+        function (Callable[[], Any]): Measured function, its result is kept alive until the memory is read.
+
+    Returns:
+        Tuple[float, float]: Time in milliseconds and traced memory of the result in MiB.
+    """
+    start = time.perf_counter()
+    function()
+    elapsed_ms = (time.perf_counter() - start) * 1e3
+
+    tracemalloc.start()
+    result = function()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed_ms, current / 2**20
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark and prints the results.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--nodes", type=int, default=NODES, help="Number of the nodes.")
+    args = parser.parse_args(argv)
+
+    cases = {
+        "per-node generators": lambda: per_node(args.nodes),
+        "pool, no draw": lambda: pooled(args.nodes, False),
+        "pool, first draw": lambda: pooled(args.nodes, True),
+    }
+    print(f"{'case':<22} {'init [ms]':>10} {'memory [MiB]':>13}")
+    for name, function in cases.items():
+        elapsed_ms, memory_mib = measure(function)
+        print(f"{name:<22} {elapsed_ms:>10.1f} {memory_mib:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
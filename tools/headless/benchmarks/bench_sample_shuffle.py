@@ -0,0 +1,162 @@
+"""
+Benchmark suite of the SampleShuffle node compute run on the stand-in runtime.
+
+Covers choice array sizes, element types (token, token ids, int, double3, bool), seed-change patterns and node modes.
+Results are printed as a table and optionally written as JSON, so they can be tracked for regressions.
+
+Run: `python tools/headless/benchmarks/bench_sample_shuffle.py --output bench_sample_shuffle.json`
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import typing
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import ardagen_standin  # noqa: E402 pylint: disable=wrong-import-position
+
+ardagen_standin.install_standins()
+
+from metron.ai.ardagen.path_table import PATH_TABLE  # noqa: E402 pylint: disable=wrong-import-position
+
+SIZES = [1_000, 10_000, 100_000]
+ELEMENT_TYPES = ["token", "token_id", "int", "double3", "bool"]
+# Frame period of the seed change, 0 means the seed never changes.
+SEED_PATTERNS = {"fixed": 0, "every_frame": 1, "every_10_frames": 10}
+MODES: typing.Dict[str, typing.Dict[str, typing.Any]] = {
+    "payload": {},
+    "index": {"indexMode": True},
+    "batched": {"batchSize": 8},
+}
+FRAMES = 50
+
+
+def make_choices(element_type: str, size: int) -> typing.List[typing.Any]:
+    """
+    Creates choices of the benchmarked element type.
+
+    Args:
+        element_type (str): One of `ELEMENT_TYPES`.
+        size (int): Number of the elements.
+
+    Returns:
+        List[Any]: Choices.
+    """
+    if element_type == "token":
+        return [f"/World/Assets/asset_{i}" for i in range(size)]
+    if element_type == "token_id":
+        return list(PATH_TABLE.intern(make_choices("token", size)))
+    if element_type == "int":
+        return list(range(size))
+    if element_type == "double3":
+        return [(float(i), 0.0, 1.0) for i in range(size)]
+    return [i % 2 == 0 for i in range(size)]
+
+
+def bench_case(
+    choices: typing.List[typing.Any], element_type: str, seed_period: int, inputs: typing.Dict[str, typing.Any]
+) -> typing.List[float]:
+    """
+    Evaluates a node with a consumer of its samples for `FRAMES` frames.
+
+    Args:
+        choices (List[Any]): Choices of the node.
+        element_type (str): One of `ELEMENT_TYPES`.
+        seed_period (int): Frame period of the seed change, 0 means the seed never changes.
+        inputs (Dict[str, Any]): Inputs of the mode.
+
+    Returns:
+        List[float]: Compute time of every frame in milliseconds.
+    """
+    ardagen_standin.RUNTIME.reset()
+    is_token_id = element_type == "token_id"
+    node = ardagen_standin.create_node("metron.ai.ardagen.SampleShuffle", seed=0, tokenIds=is_token_id, **inputs)
+    array_type = "uint64" if is_token_id else element_type
+    array_node = ardagen_standin.create_node("omni.replicator.core.OgnArray", arrayType=array_type)
+    array_node.get_attribute("inputs:array").set(choices)
+    array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+    consumer = ardagen_standin.create_node("metron.ai.ardagen.SampleShuffle")
+    node.get_attribute("outputs:samples").connect(consumer.get_attribute("inputs:choices"), True)
+
+    times = []
+    for frame in range(FRAMES):
+        if seed_period and frame % seed_period == 0:
+            node.get_attribute("inputs:seed").set(frame // seed_period + 1)
+        start = time.perf_counter()
+        if not ardagen_standin.evaluate(node):
+            raise RuntimeError(f"Compute failed: {node.errors}")
+        times.append((time.perf_counter() - start) * 1e3)
+    return times
+
+
+def run(sizes: typing.List[int]) -> typing.List[typing.Dict[str, typing.Any]]:
+    """
+    Runs all benchmark cases.
+
+    Args:
+        sizes (List[int]): Choice array sizes.
+
+    Returns:
+        List[Dict[str, Any]]: Result of every case.
+    """
+    results = []
+    for size in sizes:
+        for element_type in ELEMENT_TYPES:
+            # Choices are stored as a typed array when set, so the conversion is not part of the measured compute.
+            choices = make_choices(element_type, size)
+            for seed_pattern, seed_period in SEED_PATTERNS.items():
+                for mode, inputs in MODES.items():
+                    times = bench_case(choices, element_type, seed_period, inputs)
+                    results.append(
+                        {
+                            "size": size,
+                            "type": element_type,
+                            "seed_pattern": seed_pattern,
+                            "mode": mode,
+                            "frames": FRAMES,
+                            "mean_ms": statistics.fmean(times),
+                            "median_ms": statistics.median(times),
+                            "p95_ms": float(np.percentile(times, 95)),
+                        }
+                    )
+    return results
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """
+    Runs the benchmark, prints the results table and writes the JSON report.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--output", help="Path of the JSON report.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Choice array sizes.")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes)
+    print(f"{'type':<8} {'size':>8} {'seed':<16} {'mode':<8} {'median [ms]':>12} {'p95 [ms]':>9}")
+    for result in results:
+        print(
+            f"{result['type']:<8} {result['size']:>8} {result['seed_pattern']:<16} {result['mode']:<8}"
+            f" {result['median_ms']:>12.3f} {result['p95_ms']:>9.3f}"
+        )
+    if args.output:
+        report = {
+            "benchmark": "sample_shuffle",
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compares `distribution.shuffle_many` with a loop of `distribution.shuffle` calls for 10, 100 and 1000 distributions.
+
+The benchmark builds real OmniGraph nodes, so it runs inside a Kit application with the extension enabled:
+`app/kit/kit --ext-folder exts --enable metron.ai.ardagen --exec tools/headless/benchmarks/bench_shuffle_many.py`
+"""
+import time
+import typing
+
+COUNTS = [10, 100, 1000]
+CHOICES_LENGTH = 50
+
+
+def build_with_shuffle(list_of_choices: typing.List[typing.List[str]]) -> float:
+    """
+    Builds the distributions by a loop of `shuffle` calls in a new stage.
+
+    Args:
+        list_of_choices (List[List[str]]): Choices of every distribution.
+
+    Returns:
+        float: Build time in seconds.
+    """
+    import omni.usd  # pylint: disable=import-outside-toplevel
+    from metron.ai.ardagen import distribution  # pylint: disable=import-outside-toplevel
+
+    omni.usd.get_context().new_stage()
+    start = time.perf_counter()
+    for seed, choices in enumerate(list_of_choices):
+        distribution.shuffle(choices, seed=seed)
+    return time.perf_counter() - start
+
+
+def build_with_shuffle_many(list_of_choices: typing.List[typing.List[str]]) -> float:
+    """
+    Builds the distributions by a single `shuffle_many` call in a new stage.
+
+    Args:
+        list_of_choices (List[List[str]]): Choices of every distribution.
+
+    Returns:
+        float: Build time in seconds.
+    """
+    import omni.usd  # pylint: disable=import-outside-toplevel
+    from metron.ai.ardagen import distribution  # pylint: disable=import-outside-toplevel
+
+    omni.usd.get_context().new_stage()
+    start = time.perf_counter()
+    distribution.shuffle_many(list_of_choices, seeds=list(range(len(list_of_choices))))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the results table.
+    """
+    print(f"{'distributions':>13} {'shuffle loop [ms]':>18} {'shuffle_many [ms]':>18} {'speedup':>8}")
+    for count in COUNTS:
+        list_of_choices = [
+            [f"/World/Assets/group_{group_idx}/asset_{asset_idx}" for asset_idx in range(CHOICES_LENGTH)]
+            for group_idx in range(count)
+        ]
+        loop_time = build_with_shuffle(list_of_choices)
+        batch_time = build_with_shuffle_many(list_of_choices)
+        print(f"{count:>13} {loop_time * 1e3:>18.1f} {batch_time * 1e3:>18.1f} {loop_time / batch_time:>7.1f}x")
+
+
+main()
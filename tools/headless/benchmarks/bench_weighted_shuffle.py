@@ -0,0 +1,96 @@
+"""
+Compares the weighted shuffle over the unique choices with the weighting emulated by repeating the choices.
+
+The repeated choices are shuffled as in the default mode of the SampleShuffle node, the weighted shuffle draws the
+Efraimidis-Spirakis order of the unique choices, fully and as a sample of `--num-samples` elements. The integer weights
+are drawn uniformly from `[1, 2 * multiplicity - 1]`, so the repeated array is about `multiplicity` times larger.
+
+Run: `python tools/headless/benchmarks/bench_weighted_shuffle.py --num-samples 16`
+"""
+import argparse
+import functools
+import os
+import sys
+import timeit
+import typing
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ardagen_headless import load_ardagen  # noqa: E402 pylint: disable=wrong-import-position
+
+load_ardagen()
+
+from metron.ai.ardagen.permutation import (  # noqa: E402 pylint: disable=wrong-import-position
+    check_weights,
+    gather,
+    index_permutation,
+    weighted_permutation,
+)
+
+SIZES = [100, 1_000, 10_000]
+MULTIPLICITIES = [10, 100]
+NUM_SAMPLES = 16
+REPEATS = 5
+
+
+def bench(func: typing.Callable[[], typing.Any], number: int) -> float:
+    """
+    Measures the best average time of a single call.
+
+    Args:
+        func (Callable[[], Any]): Benchmarked function.
+        number (int): Number of calls per repeat.
+
+    Returns:
+        float: Time in microseconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=REPEATS)) / number * 1e6
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:  # pylint: disable=too-many-locals
+    """
+    Runs the benchmark and prints the results table.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, `sys.argv` is used if None.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0].strip())
+    parser.add_argument("--num-samples", type=int, default=NUM_SAMPLES, help="Number of the weighted samples.")
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'unique':>7} {'mult':>5} {'repeated len':>13} {'repeated [us]':>14} {'weighted [us]':>14}"
+        f" {'weighted k [us]':>16}"
+    )
+    for size in SIZES:
+        choices = np.array([f"/World/Assets/asset_{i}" for i in range(size)], dtype=object)
+        for multiplicity in MULTIPLICITIES:
+            counts = np.random.default_rng(0).integers(1, 2 * multiplicity, size)
+            repeated = np.repeat(choices, counts)
+            weights = check_weights(counts, size)
+            generator = np.random.default_rng(1)
+            number = max(1, 200_000 // len(repeated))
+
+            def repeated_shuffle(repeated: np.ndarray = repeated, generator: np.random.Generator = generator) -> None:
+                gather(repeated, index_permutation(generator, len(repeated)))
+
+            def weighted_shuffle(
+                choices: np.ndarray = choices,
+                weights: np.ndarray = weights,
+                generator: np.random.Generator = generator,
+                num_samples: int = -1,
+            ) -> None:
+                gather(choices, weighted_permutation(generator, weights, num_samples))
+
+            repeated_us = bench(repeated_shuffle, number)
+            weighted_us = bench(weighted_shuffle, number)
+            sample_us = bench(functools.partial(weighted_shuffle, num_samples=args.num_samples), number)
+            print(
+                f"{size:>7} {multiplicity:>5} {len(repeated):>13} {repeated_us:>14.1f} {weighted_us:>14.1f}"
+                f" {sample_us:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
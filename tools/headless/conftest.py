@@ -0,0 +1,64 @@
+"""
+Pytest configuration of the headless ArDaGen tests. The Kit modules are replaced by the stand-ins, see
+`ardagen_standin`.
+"""
+import os
+import sys
+import typing
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ardagen_standin import RUNTIME, create_node, install_standins  # noqa: E402 pylint: disable=wrong-import-position
+
+install_standins()
+
+# pylint: disable=wrong-import-position,wrong-import-order
+from metron.ai.ardagen.batch_evaluator import BATCH_EVALUATOR  # noqa: E402
+from metron.ai.ardagen.node_cache import ARRAY_NODE_CACHE  # noqa: E402
+from metron.ai.ardagen.path_table import PATH_TABLE  # noqa: E402
+from metron.ai.ardagen.rng_pool import RNG_POOL  # noqa: E402
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+
+
+@pytest.fixture(autouse=True)
+def _reset_runtime() -> None:
+    """
+    Every test starts with an empty graph, array node cache, path table, RNG pool and batch evaluator.
+    """
+    RUNTIME.reset()
+    ARRAY_NODE_CACHE.clear()
+    PATH_TABLE.clear()
+    RNG_POOL.clear()
+    RNG_POOL.set_global_seed(0)
+    BATCH_EVALUATOR.clear()
+
+
+def _create_shuffle_node(choices: typing.List[typing.Any], array_type: str, **inputs: typing.Any) -> typing.Any:
+    """
+    Creates a shuffle node fed by an array node.
+
+    Args:
+        choices (List[Any]): Values of the array node.
+        array_type (str): Data type of the array node.
+        **inputs (Any): Inputs of the shuffle node.
+
+    Returns:
+        Any: Shuffle node.
+    """
+    node = create_node(SHUFFLE_NODE_TYPE, **inputs)
+    array_node = create_node("omni.replicator.core.OgnArray", arrayType=array_type)
+    array_node.get_attribute("inputs:array").set(choices)
+    array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+    return node
+
+
+@pytest.fixture(name="shuffle_node")
+def _shuffle_node() -> typing.Callable[..., typing.Any]:
+    """
+    Returns:
+        Callable[..., Any]: Factory of shuffle nodes fed by an array node, it takes the choices, the array type and the
+            shuffle node inputs.
+    """
+    return _create_shuffle_node
@@ -0,0 +1,141 @@
+"""
+Tests of the cached asset directory index.
+"""
+import os
+import pytest
+from ardagen_standin import evaluate
+from metron.ai.ardagen import distribution
+from metron.ai.ardagen.asset_index import AssetIndex, index_assets
+from metron.ai.ardagen.choices_file import ChoicesFile
+
+
+def _touch(*parts: str) -> str:
+    """
+    Creates an empty file with its directories.
+
+    Args:
+        *parts (str): Path components of the file.
+
+    Returns:
+        str: Path of the file.
+    """
+    path = os.path.join(*parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "wb").close()  # pylint: disable=consider-using-with
+    return path
+
+
+def _indexed(assets_path: str) -> list:
+    """
+    Args:
+        assets_path (str): Path of the asset file of the index.
+
+    Returns:
+        list: Asset paths of the stored index.
+    """
+    assets_file = ChoicesFile(assets_path)
+    return [assets_file.element(index) for index in range(len(assets_file))]
+
+
+@pytest.fixture(name="asset_root")
+def _asset_root(tmp_path: str) -> str:
+    """
+    Asset tree with nested directories and a file not matching the suffixes.
+    """
+    root = os.path.join(tmp_path, "assets")
+    for path in [("chairs", "a.usd"), ("chairs", "b.USDA"), ("chairs", "wood", "c.usd"), ("tables", "d.usd")]:
+        _touch(root, *path)
+    _touch(root, "tables", "readme.txt")
+    return root
+
+
+def test_scan_indexes_matching_files(asset_root: str, tmp_path: str) -> None:
+    """
+    Files with the suffixes are indexed in the sorted walk order.
+    """
+    index_dir = os.path.join(tmp_path, "index")
+    asset_index = AssetIndex(asset_root, index_dir, (".usd", ".usda"))
+
+    assert asset_index.refresh()
+    assert len(asset_index) == 4
+    assert [os.path.relpath(path, asset_root) for path in _indexed(asset_index.assets_path)] == [
+        os.path.join("chairs", "a.usd"),
+        os.path.join("chairs", "b.USDA"),
+        os.path.join("chairs", "wood", "c.usd"),
+        os.path.join("tables", "d.usd"),
+    ]
+
+
+def test_warm_index_is_not_rewritten(asset_root: str, tmp_path: str) -> None:
+    """
+    Unchanged tree is detected from the stored directory signatures without listing or rewriting.
+    """
+    index_dir = os.path.join(tmp_path, "index")
+    cold_index = AssetIndex(asset_root, index_dir, (".usd",))
+    cold_index.refresh()
+    assets_mtime = os.stat(cold_index.assets_path).st_mtime_ns
+
+    warm_index = AssetIndex(asset_root, index_dir, (".usd",))
+    assert not warm_index.refresh()
+    assert len(warm_index) == 3
+    assert warm_index.assets_path == cold_index.assets_path
+    assert os.stat(warm_index.assets_path).st_mtime_ns == assets_mtime
+
+
+def test_refresh_picks_up_changes(asset_root: str, tmp_path: str) -> None:
+    """
+    Added and removed files and directories are reflected, the rest is kept from the index.
+    """
+    index_dir = os.path.join(tmp_path, "index")
+    AssetIndex(asset_root, index_dir).refresh()
+
+    os.remove(os.path.join(asset_root, "chairs", "a.usd"))
+    new_path = _touch(asset_root, "lamps", "e.usd")
+    asset_index = AssetIndex(asset_root, index_dir)
+
+    assert asset_index.refresh()
+    indexed = _indexed(asset_index.assets_path)
+    assert new_path in indexed
+    assert os.path.join(asset_root, "chairs", "a.usd") not in indexed
+    assert os.path.join(asset_root, "chairs", "wood", "c.usd") in indexed
+    assert len(indexed) == len(asset_index) == 5
+
+
+def test_changed_suffixes_rescan(asset_root: str, tmp_path: str) -> None:
+    """
+    Index of other suffixes is not reused.
+    """
+    index_dir = os.path.join(tmp_path, "index")
+    AssetIndex(asset_root, index_dir, (".usd",)).refresh()
+
+    asset_index = AssetIndex(asset_root, index_dir, (".txt",))
+    assert asset_index.refresh()
+    assert len(os.listdir(index_dir)) == 3
+    assert _indexed(asset_index.assets_path) == [os.path.join(asset_root, "tables", "readme.txt")]
+
+
+def test_index_feeds_shuffle_from_file(asset_root: str, tmp_path: str) -> None:
+    """
+    The asset file of the index is shuffled directly by the file-backed distribution.
+    """
+    assets_path = index_assets(asset_root, os.path.join(tmp_path, "index"), (".usd", ".usda"))
+    node = distribution.shuffle_from_file(assets_path, seed=3)
+
+    assert evaluate(node)
+    assert sorted(node.get_attribute("outputs:samples").value) == sorted(_indexed(assets_path))
+
+
+def test_refresh_keeps_mapped_assets_valid(asset_root: str, tmp_path: str) -> None:
+    """
+    A refresh writes a new asset file instead of replacing the file mapped by a node, the previous file is removed.
+    """
+    index_dir = os.path.join(tmp_path, "index")
+    old_path = index_assets(asset_root, index_dir, (".usd",))
+    mapped = _indexed(old_path)
+
+    _touch(asset_root, "lamps", "e.usd")
+    new_path = index_assets(asset_root, index_dir, (".usd",))
+
+    assert new_path != old_path and not os.path.exists(old_path)
+    assert sorted(_indexed(new_path)) == sorted(mapped + [os.path.join(asset_root, "lamps", "e.usd")])
+    assert sorted(os.listdir(index_dir)) == sorted(["index.json", "directories.npz", os.path.basename(new_path)])
@@ -0,0 +1,139 @@
+"""
+Tests of the batched evaluation of the SampleShuffle nodes run on the stand-in runtime.
+"""
+import typing
+import numpy as np
+from ardagen_standin import RUNTIME, evaluate
+from metron.ai.ardagen.batch_evaluator import BATCH_EVALUATOR
+from metron.ai.ardagen.rng_pool import RNG_POOL
+
+# Choices, array type and inputs of the nodes. Nodes of the same length with different dtypes share a batch group.
+NODE_SPECS: typing.List[typing.Tuple[typing.List[typing.Any], str, typing.Dict[str, typing.Any]]] = [
+    (list(range(6)), "int", {"seed": 1}),
+    (list(range(10, 16)), "int", {"seed": 2}),
+    ([f"/World/asset_{i}" for i in range(6)], "token", {"seed": 3}),
+    (list(range(9)), "int", {"seed": 4, "numSamples": 4}),
+    (list(range(9)), "int", {"seed": 5, "batchSize": 3}),
+    ([[i, i, i] for i in range(5)], "float3", {"seed": 6}),
+    ([[i, -i, i] for i in range(5)], "float3", {"seed": 7}),
+]
+
+
+def _shuffle_nodes(shuffle_node: typing.Callable[..., typing.Any]) -> typing.List[typing.Any]:
+    """
+    Args:
+        shuffle_node (Callable[..., Any]): Factory of the shuffle nodes.
+
+    Returns:
+        List[Any]: Random keys shuffle nodes of `NODE_SPECS` fed by array nodes.
+    """
+    return [shuffle_node(choices, array_type, randomKeys=True, **inputs) for choices, array_type, inputs in NODE_SPECS]
+
+
+def _run(nodes: typing.List[typing.Any], frames: int, batched: bool) -> typing.List[typing.List[np.ndarray]]:
+    """
+    Evaluates the nodes frame by frame.
+
+    Args:
+        nodes (List[Any]): Evaluated nodes.
+        frames (int): Number of the frames.
+        batched (bool): If True, the batch evaluator runs before every frame.
+
+    Returns:
+        List[List[np.ndarray]]: Samples of every node in every frame.
+    """
+    outputs = []
+    for _ in range(frames):
+        if batched:
+            BATCH_EVALUATOR.evaluate()
+        assert all(evaluate(node) for node in nodes)
+        outputs.append([np.copy(node.get_attribute("outputs:samples").value) for node in nodes])
+    return outputs
+
+
+def test_batched_outputs_match_node_computes(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Batched evaluation outputs the same samples as the node computes, the first frame registers the nodes.
+    """
+    expected = _run(_shuffle_nodes(shuffle_node), 5, batched=False)
+    RUNTIME.reset()
+    BATCH_EVALUATOR.clear()
+    nodes = _shuffle_nodes(shuffle_node)
+    batched = _run(nodes, 5, batched=True)
+
+    assert len(BATCH_EVALUATOR) == len(nodes)
+    for expected_frame, batched_frame in zip(expected, batched):
+        for expected_samples, batched_samples in zip(expected_frame, batched_frame):
+            np.testing.assert_array_equal(batched_samples, expected_samples)
+    assert len(batched[-1][3]) == 4 and batched[-1][5].shape == (5, 3)
+    # Nodes outside the random keys mode are not registered.
+    default_node = shuffle_node(list(range(6)), "int", seed=1)
+    assert evaluate(default_node)
+    assert len(BATCH_EVALUATOR) == len(nodes)
+
+
+def test_only_due_and_batchable_nodes_are_evaluated(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Nodes with unconsumed batched outputs, released nodes and nodes in other modes are skipped.
+    """
+    nodes = _shuffle_nodes(shuffle_node)
+    for node in nodes:
+        assert evaluate(node)
+
+    assert BATCH_EVALUATOR.evaluate() == len(nodes)
+    assert BATCH_EVALUATOR.evaluate() == 0
+    # The batch reads the simple inputs prefetched by the previous compute.
+    nodes[1].get_attribute("inputs:epochMode").set(True)
+    assert evaluate(nodes[0]) and evaluate(nodes[1])
+    nodes[2].valid = False
+
+    assert BATCH_EVALUATOR.evaluate() == 1
+    assert len(BATCH_EVALUATOR) == len(nodes) - 1
+
+
+def _edit_inputs(node: typing.Any, frame: int) -> None:
+    """
+    Changes the inputs of a node between the batch evaluation and the compute of the frame.
+
+    Args:
+        node (Any): Random keys shuffle node of the first `NODE_SPECS` entry.
+        frame (int): Index of the frame.
+    """
+    array = node.get_attribute("inputs:choices").upstream[0]
+    if frame == 1:
+        node.get_attribute("inputs:seed").set(11)
+    elif frame == 2:
+        array.set(np.arange(20, 26, dtype=np.int32))
+    elif frame == 3:
+        array.get()[0] = 40
+    elif frame == 4:
+        node.get_attribute("inputs:numSamples").set(3)
+    elif frame == 5:
+        RNG_POOL.set_global_seed(5)
+        node.get_attribute("inputs:seed").set(-1)
+
+
+def test_batched_nodes_compute_changed_inputs(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    A batched node whose inputs changed after the batch evaluation computes its outputs for the new inputs, the same
+    as without the batch evaluator. The choices are changed both by a new array and in place.
+    """
+    outputs = []
+    for batched in (False, True):
+        RUNTIME.reset()
+        BATCH_EVALUATOR.clear()
+        RNG_POOL.clear()
+        RNG_POOL.set_global_seed(0)
+        node = shuffle_node(*NODE_SPECS[0][:2], randomKeys=True, **NODE_SPECS[0][2])
+        samples = []
+        for frame in range(8):
+            if batched:
+                BATCH_EVALUATOR.evaluate()
+            _edit_inputs(node, frame)
+            assert evaluate(node)
+            samples.append(np.copy(node.get_attribute("outputs:samples").value))
+        outputs.append(samples)
+
+    for expected_samples, batched_samples in zip(*outputs):
+        np.testing.assert_array_equal(batched_samples, expected_samples)
+    assert 40 in outputs[1][3] and len(outputs[1][4]) == 3
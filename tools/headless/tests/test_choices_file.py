@@ -0,0 +1,104 @@
+"""
+Tests of the memory-mapped choices files and the file-backed shuffle distribution.
+"""
+import os
+import numpy as np
+import pytest
+from ardagen_standin import RUNTIME, evaluate
+from metron.ai.ardagen import distribution
+from metron.ai.ardagen.choices_file import ChoicesFile, write_token_file
+from metron.ai.ardagen.permutation import OutputBuffers
+
+TOKENS = [f"/World/asset_{i}" * (1 + i % 3) for i in range(50)] + ["/World/é"]
+
+
+def test_token_file_round_trip(tmp_path: str) -> None:
+    """
+    Tokens of different lengths are padded into fixed-width lines and decoded back.
+    """
+    path = os.path.join(tmp_path, "assets.txt")
+    write_token_file(path, TOKENS)
+    choices_file = ChoicesFile(path)
+
+    assert len(choices_file) == len(TOKENS)
+    assert choices_file.data_type == "token"
+    assert isinstance(choices_file.data, np.memmap)
+    assert choices_file.element(len(TOKENS) - 1) == "/World/é"
+    permutation = np.array([3, 0, 50], dtype=np.int32)
+    assert list(choices_file.gather(permutation, OutputBuffers())) == [TOKENS[3], TOKENS[0], TOKENS[50]]
+
+
+def test_npy_file_is_gathered_like_array(tmp_path: str) -> None:
+    """
+    Tuple valued `.npy` choices are gathered like in-memory choices.
+    """
+    path = os.path.join(tmp_path, "scales.npy")
+    values = np.arange(30.0).reshape(10, 3)
+    np.save(path, values)
+    choices_file = ChoicesFile(path)
+
+    assert choices_file.data_type == "double3"
+    permutation = np.array([9, 1, 4], dtype=np.int32)
+    np.testing.assert_array_equal(choices_file.gather(permutation, OutputBuffers()), values[permutation])
+    np.testing.assert_array_equal(choices_file.element(2), values[2])
+
+
+def test_invalid_token_file_is_rejected(tmp_path: str) -> None:
+    """
+    Files with lines of different lengths and empty files are rejected.
+    """
+    path = os.path.join(tmp_path, "ragged.txt")
+    with open(path, "wb") as token_file:
+        token_file.write(b"ab\nabc\n")
+    with pytest.raises(ValueError):
+        ChoicesFile(path)
+
+    empty_path = os.path.join(tmp_path, "empty.npy")
+    np.save(empty_path, np.empty(0))
+    with pytest.raises(ValueError):
+        ChoicesFile(empty_path)
+
+
+def test_shuffle_from_file_matches_shuffle(tmp_path: str) -> None:
+    """
+    The file-backed node outputs the same samples as the node fed by an array node with the same seed and node id.
+    """
+    path = os.path.join(tmp_path, "assets.txt")
+    write_token_file(path, TOKENS)
+    file_node = distribution.shuffle_from_file(path, seed=5)
+    array_node = distribution.shuffle(TOKENS, seed=5)
+    array_node.get_attribute("inputs:nodeId").set(file_node.get_attribute("inputs:nodeId").get())
+
+    assert file_node.get_attribute("inputs:choices").get() is None
+    for _ in range(3):
+        assert evaluate(file_node) and evaluate(array_node)
+        assert list(file_node.get_attribute("outputs:samples").value) == list(
+            array_node.get_attribute("outputs:samples").value
+        )
+
+
+def test_shuffle_from_file_epoch_mode(tmp_path: str) -> None:
+    """
+    In the epoch mode only the current element is materialized as a string.
+    """
+    path = os.path.join(tmp_path, "assets.txt")
+    write_token_file(path, TOKENS)
+    node = distribution.shuffle_from_file(path, seed=1, epoch_mode=True)
+
+    elements = []
+    for _ in range(len(TOKENS)):
+        assert evaluate(node)
+        element = node.get_attribute("outputs:element").value
+        assert element == TOKENS[node.get_attribute("outputs:elementIndex").value]
+        elements.append(element)
+    assert sorted(elements) == sorted(TOKENS)
+
+
+def test_shuffle_from_file_rejects_invalid_file(tmp_path: str) -> None:
+    """
+    Invalid files are reported before any node is created.
+    """
+    path = os.path.join(tmp_path, "missing.npy")
+    with pytest.raises(FileNotFoundError):
+        distribution.shuffle_from_file(path)
+    assert RUNTIME.edit_count == 0
@@ -0,0 +1,171 @@
+"""
+Tests of the distribution builders run on the stand-in runtime.
+"""
+import typing
+import pytest
+from ardagen_standin import RUNTIME, SdfPath, evaluate
+from metron.ai.ardagen import distribution
+from metron.ai.ardagen.path_table import PATH_TABLE
+
+
+def _array_values(attribute: typing.Any) -> list:
+    """
+    Args:
+        attribute (Attribute): Array attribute.
+
+    Returns:
+        list: Values of the attribute, token ids are resolved to the tokens.
+    """
+    values = attribute.get()
+    if attribute.get_resolved_type().base_type == "uint64":
+        values = PATH_TABLE.resolve_strings(values)
+    return list(values)
+
+
+def test_shuffle_builds_connected_nodes() -> None:
+    """
+    The shuffle node gets its inputs and the choices from the connected array node.
+    """
+    node = distribution.shuffle([SdfPath("/World/a"), SdfPath("/World/b")], seed=7, index_mode=True, num_samples=1)
+
+    choices_attr = node.get_attribute("inputs:choices")
+    assert choices_attr.get_resolved_type().base_type == "token"
+    assert list(choices_attr.get()) == ["/World/a", "/World/b"]
+    assert node.get_attribute("inputs:seed").get() == 7
+    assert node.get_attribute("inputs:indexMode").get() is True
+    assert node.get_attribute("inputs:numSamples").get() == 1
+    assert evaluate(node)
+
+
+def test_shuffle_rejects_invalid_parameters() -> None:
+    """
+    Parameters are validated before any node is created.
+    """
+    with pytest.raises(TypeError):
+        distribution.shuffle(["a"], seed="1")  # type: ignore
+    with pytest.raises(ValueError):
+        distribution.shuffle(["a", 1])
+    with pytest.raises(ValueError):
+        distribution.shuffle(["a", "b"], group_keys=[1])
+    with pytest.raises(ValueError):
+        distribution.shuffle(["a", "b"], weights=[1.0, -1.0])
+    with pytest.raises(TypeError):
+        distribution.shuffle(["a", "b"], weights=["1", "2"])  # type: ignore
+    assert RUNTIME.edit_count == 0
+
+
+def test_shuffle_many_matches_shuffle() -> None:
+    """
+    Batched build creates nodes with the same inputs and outputs as separate `shuffle` calls.
+    """
+    list_of_choices = [[1, 2, 3], [0.5, 1.5], ["a", "b", "c", "d"]]
+    nodes = distribution.shuffle_many(list_of_choices, seeds=[1, 2, 3], batch_size=2)
+
+    assert RUNTIME.controller_edit_count == 2
+    for node, choices, seed in zip(nodes, list_of_choices, [1, 2, 3]):
+        assert _array_values(node.get_attribute("inputs:choices")) == choices
+        assert node.get_attribute("inputs:seed").get() == seed
+        assert node.get_attribute("inputs:batchSize").get() == 2
+        assert evaluate(node)
+        assert sorted(node.get_attribute("outputs:samples").value) == sorted(choices)
+
+
+def test_shuffle_many_nodes_with_same_seed_draw_different_streams() -> None:
+    """
+    Every node gets its own node id from Replicator, so the nodes with the same seed and choices differ.
+    """
+    choices = list(range(20))
+    nodes = distribution.shuffle_many([choices, choices], seeds=[3, 3])
+
+    node_ids = [node.get_attribute("inputs:nodeId").get() for node in nodes]
+    assert len(set(node_ids)) == 2
+    frames = []
+    for node in nodes:
+        assert evaluate(node) and evaluate(node)
+        frames.append(list(node.get_attribute("outputs:samples").value))
+    assert frames[0] != frames[1]
+
+
+def test_shuffle_many_dedup_shares_array_nodes() -> None:
+    """
+    Choices with the same content are fed by one array node, also across the calls.
+    """
+    nodes = distribution.shuffle_many([["a", "b"], ["a", "b"], ["c"]], dedup=True)
+    node = distribution.shuffle(["a", "b"], dedup=True)
+
+    upstream = [n.get_attribute("inputs:choices").upstream[0].get_node() for n in nodes + [node]]
+    assert upstream[0] is upstream[1] is upstream[3]
+    assert upstream[2] is not upstream[0]
+    assert _array_values(upstream[2].get_attribute("inputs:array")) == ["c"]
+
+
+def test_shuffle_aligned_keeps_arrays_in_lockstep() -> None:
+    """
+    All arrays are gathered with one permutation, the first one like by `shuffle` with the same seed and node id.
+    """
+    paths = [f"/World/asset_{i}" for i in range(20)]
+    scales = [(float(i), float(i), 1.0) for i in range(20)]
+    labels = list(range(20))
+    node = distribution.shuffle_aligned([paths, scales, labels], seed=4)
+    shuffle_node = distribution.shuffle(paths, seed=4)
+    shuffle_node.get_attribute("inputs:nodeId").set(node.get_attribute("inputs:nodeId").get())
+
+    for _ in range(3):
+        assert evaluate(node)
+        assert evaluate(shuffle_node)
+        sampled_paths = node.get_attribute("outputs:samples").value
+        sampled_scales = node.get_attribute("outputs:samples_1").value
+        sampled_labels = node.get_attribute("outputs:samples_2").value
+        assert list(sampled_paths) == list(shuffle_node.get_attribute("outputs:samples").value)
+        assert list(sampled_labels) == list(node.get_attribute("outputs:permutation").value)
+        assert [scale[0] for scale in sampled_scales] == list(sampled_labels)
+        assert [paths.index(path) for path in sampled_paths] == list(sampled_labels)
+
+
+def test_shuffle_aligned_rejects_unaligned_lists() -> None:
+    """
+    Lists of different lengths are rejected before any node is created.
+    """
+    with pytest.raises(ValueError):
+        distribution.shuffle_aligned([["a", "b"], [1]])
+    with pytest.raises(ValueError):
+        distribution.shuffle_aligned([])
+    assert RUNTIME.edit_count == 0
+
+
+def test_shuffle_token_ids_outputs_tokens() -> None:
+    """
+    Token choices are fed as ids, the samples are the same tokens as without the ids. The ids are not authored into
+    USD.
+    """
+    choices = [f"/World/asset_{i}" for i in range(40)]
+    id_node = distribution.shuffle(choices, seed=4, token_ids=True)
+    many_id_node = distribution.shuffle_many([choices], seeds=[4], token_ids=True)[0]
+    string_node = distribution.shuffle(choices, seed=4)
+    string_node.get_attribute("inputs:nodeId").set(id_node.get_attribute("inputs:nodeId").get())
+
+    assert id_node.get_attribute("inputs:choices").get_resolved_type().base_type == "uint64"
+    for node in (id_node, many_id_node):
+        array_attr = node.get_attribute("inputs:choices").upstream[0]
+        assert array_attr.usd_value is None
+        assert PATH_TABLE.resolve_strings(array_attr.value).tolist() == choices
+    assert list(string_node.get_attribute("inputs:choices").upstream[0].usd_value) == choices
+    assert id_node.get_attribute("outputs:samples").get_resolved_type().base_type == "token"
+    assert id_node.get_attribute("outputs:element").get_resolved_type().base_type == "token"
+    for _ in range(3):
+        assert evaluate(id_node) and evaluate(string_node)
+        assert list(id_node.get_attribute("outputs:samples").value) == list(
+            string_node.get_attribute("outputs:samples").value
+        )
+
+
+def test_shuffle_weights_replace_repeated_choices() -> None:
+    """
+    Weights are passed to the node as doubles and the unique choices are sampled by them.
+    """
+    node = distribution.shuffle(["a", "b", "c"], seed=1, num_samples=2, weights=[3, 0, 1])
+
+    assert list(node.get_attribute("inputs:weights").get()) == [3.0, 0.0, 1.0]
+    for _ in range(10):
+        assert evaluate(node)
+        assert sorted(node.get_attribute("outputs:samples").value) == ["a", "c"]
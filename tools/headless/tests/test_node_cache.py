@@ -0,0 +1,49 @@
+"""
+Tests of the array node cache.
+"""
+import numpy as np
+from metron.ai.ardagen import node_cache
+
+
+class _Node:  # pylint: disable=too-few-public-methods
+    """
+    Node stand-in with controllable validity.
+    """
+
+    def __init__(self) -> None:
+        self.valid = True
+
+    def is_valid(self) -> bool:
+        """
+        Returns:
+            bool: Validity of the node.
+        """
+        return self.valid
+
+
+def test_content_key_depends_on_type_and_content() -> None:
+    """
+    Same content maps to the same key, any change of the data type or content to a different key.
+    """
+    key = node_cache.content_key("token", ["a", "b"])
+
+    assert node_cache.content_key("token", ["a", "b"]) == key
+    assert node_cache.content_key("token", ["b", "a"]) != key
+    assert node_cache.content_key("int", [1, 2]) != node_cache.content_key("double", [1, 2])
+    assert node_cache.content_key("int", np.arange(3)) == node_cache.content_key("int", np.arange(3))
+
+
+def test_cache_evicts_invalid_nodes() -> None:
+    """
+    Nodes removed with their graph are not returned anymore.
+    """
+    cache = node_cache.ArrayNodeCache()
+    node = _Node()
+    cache.put("/Replicator/SDGPipeline", "key", node)
+
+    assert cache.get("/Replicator/SDGPipeline", "key") is node
+    assert cache.get("/OtherGraph", "key") is None
+
+    node.valid = False
+    assert cache.get("/Replicator/SDGPipeline", "key") is None
+    assert len(cache) == 0
@@ -0,0 +1,96 @@
+"""
+Tests of the lazy package import. The package `__init__` runs in a fresh interpreter, because the other tests import the
+package modules directly.
+"""
+import json
+import os
+import subprocess
+import sys
+
+HEADLESS_DIR = os.path.dirname(os.path.dirname(__file__))
+# Start of the probes. typeguard is reported missing, so its installation is recorded by the stand-in `pipapi`.
+PROBE_SETUP = """
+import importlib.util
+import json
+import sys
+sys.path.insert(0, sys.argv[1])
+from ardagen_standin import RUNTIME, install_standins, load_node_types
+install_standins(run_package_init=True)
+find_spec = importlib.util.find_spec
+importlib.util.find_spec = lambda name, *args: None if name == "typeguard" else find_spec(name, *args)
+
+def loaded():
+    return sorted(name for name in sys.modules if name.startswith("metron.ai.ardagen."))
+"""
+PROBE = (
+    PROBE_SETUP
+    + """
+import metron.ai.ardagen as ardagen
+
+result = {"import": loaded(), "registered": [function.__name__ for function in RUNTIME.registered_distributions]}
+result["pip_on_import"] = list(RUNTIME.pip_installs)
+# Scan of the package classes like the one Kit runs to find the `omni.ext.IExt` classes.
+result["classes"] = [name for name in dir(ardagen) if isinstance(getattr(ardagen, name), type)]
+result["scan_import"] = loaded()
+result["pip_on_scan"] = list(RUNTIME.pip_installs)
+load_node_types()
+shuffle = RUNTIME.registered_distributions[0]
+nodes = [shuffle(["a", "b"], seed=1), shuffle(["c"], seed=2)]
+result["node_types"] = [node.get_type_name() for node in nodes]
+result["pip_installs"] = RUNTIME.pip_installs
+result["extension_listed"] = "ArDaGenExt" in dir(ardagen)
+result["extension"] = ardagen.ArDaGenExt.__name__
+result["all"] = ardagen.distribution.__all__
+print(json.dumps(result))
+"""
+)
+# Direct import of `distribution`, bypassing the package's lazy access.
+DIRECT_IMPORT_PROBE = (
+    PROBE_SETUP
+    + """
+from metron.ai.ardagen.distribution import shuffle
+
+print(json.dumps({"pip_installs": RUNTIME.pip_installs}))
+"""
+)
+
+
+def _run_probe(probe: str) -> dict:
+    """
+    Args:
+        probe (str): Code of the probe, it prints its JSON result as the last line.
+
+    Returns:
+        dict: Result of the probe.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", probe, HEADLESS_DIR], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_package_import_is_lazy() -> None:
+    """
+    The package import registers the distribution stubs only, the submodules are imported on the first use.
+    """
+    result = _run_probe(PROBE)
+
+    assert not any(name.rsplit(".", 1)[-1] in ("distribution", "extension", "ogn") for name in result["import"])
+    assert sorted(result["registered"]) == sorted(result["all"])
+    assert result["pip_on_import"] == []
+    # The class scan imports the extension only.
+    assert result["classes"] == ["ArDaGenExt"]
+    assert "metron.ai.ardagen.distribution" not in result["scan_import"]
+    assert result["pip_on_scan"] == []
+    assert result["node_types"] == ["metron.ai.ardagen.SampleShuffle"] * 2
+    # typeguard is checked once, when the distributions are used.
+    assert result["pip_installs"] == ["typeguard"]
+    assert result["extension_listed"]
+    assert result["extension"] == "ArDaGenExt"
+
+
+def test_direct_distribution_import_checks_typeguard() -> None:
+    """
+    Importing `distribution` directly installs the missing typeguard too.
+    """
+    assert _run_probe(DIRECT_IMPORT_PROBE)["pip_installs"] == ["typeguard"]
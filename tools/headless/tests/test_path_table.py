@@ -0,0 +1,66 @@
+"""
+Tests of the interned prim path table and the path handle shuffling.
+"""
+import numpy as np
+import pytest
+from ardagen_standin import SdfPath, evaluate
+from metron.ai.ardagen import distribution
+from metron.ai.ardagen.path_table import HANDLE_DTYPE, INVALID_HANDLE, PATH_TABLE, PathTable
+
+
+def test_paths_are_interned_once() -> None:
+    """
+    The same path gets the same handle whether it is passed as a string or an `Sdf.Path`.
+    """
+    table = PathTable()
+    first = table.intern([SdfPath("/World/a"), "/World/b"])
+    second = table.intern(["/World/a", SdfPath("/World/b"), "/World/c"])
+
+    assert first.dtype == HANDLE_DTYPE
+    assert list(second[:2]) == list(first)
+    assert INVALID_HANDLE not in second
+    assert len(table) == 3
+
+
+def test_resolve_returns_cached_paths() -> None:
+    """
+    Handles resolve in bulk to the interned `Sdf.Path` objects and their strings.
+    """
+    table = PathTable()
+    path = SdfPath("/World/a")
+    handles = table.intern([path, "/World/b"])
+
+    resolved = table.resolve(handles[::-1])
+    assert resolved[1] is path
+    assert resolved[0].pathString == "/World/b"
+    assert table.resolve(handles)[1] is resolved[0]
+    assert list(table.resolve_strings(np.append(handles, INVALID_HANDLE))) == ["/World/a", "/World/b", ""]
+
+    table.clear()
+    with pytest.raises(IndexError):
+        table.resolve(handles)
+
+
+def test_shuffle_path_handles_matches_paths() -> None:
+    """
+    Shuffled handles resolve to the same samples as the shuffled path strings with the same seed and node id.
+    """
+    paths = [SdfPath(f"/World/asset_{i}") for i in range(30)]
+    handle_node = distribution.shuffle(paths, seed=9, path_handles=True)
+    string_node = distribution.shuffle(paths, seed=9)
+    string_node.get_attribute("inputs:nodeId").set(handle_node.get_attribute("inputs:nodeId").get())
+
+    assert handle_node.get_attribute("inputs:choices").get_resolved_type().base_type == "uint64"
+    assert evaluate(handle_node) and evaluate(string_node)
+    samples = handle_node.get_attribute("outputs:samples").value
+    assert samples.dtype == HANDLE_DTYPE
+    assert list(PATH_TABLE.resolve_strings(samples)) == list(string_node.get_attribute("outputs:samples").value)
+    assert len(PATH_TABLE) == len(paths)
+
+
+def test_shuffle_path_handles_rejects_non_paths() -> None:
+    """
+    Only paths can be shuffled as handles.
+    """
+    with pytest.raises(ValueError):
+        distribution.shuffle([1, 2], path_handles=True)
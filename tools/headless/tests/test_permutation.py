@@ -0,0 +1,222 @@
+"""
+Tests of the permutation kernels.
+"""
+import typing
+import numpy as np
+import pytest
+from metron.ai.ardagen import permutation
+
+
+@pytest.mark.parametrize(
+    "choices",
+    [
+        np.array(["a", "b", "c", "d", "e", "f", "g"], dtype=object),
+        np.arange(300, dtype=np.int32),
+        np.arange(90, dtype=np.float64).reshape(30, 3),
+    ],
+)
+def test_index_permutation_matches_payload_shuffle(choices: np.ndarray) -> None:
+    """
+    Index mode has to produce the same samples as the payload shuffle for the same seed.
+    """
+    generator = np.random.default_rng(7)
+    expected = np.copy(choices)
+    generator.shuffle(expected, axis=0)
+
+    generator = np.random.default_rng(7)
+    indices = permutation.index_permutation(generator, len(choices))
+
+    assert indices.dtype == permutation.INDEX_DTYPE
+    np.testing.assert_array_equal(permutation.gather(choices, indices), expected)
+
+
+@pytest.mark.parametrize("capacity", [2, 3, 8, 64])
+def test_buffered_permutations_do_not_depend_on_capacity(capacity: int) -> None:
+    """
+    The permutation sequence must be the same for every buffer capacity, even when the length changes mid-buffer.
+    """
+    lengths = [10] * 5 + [4] * 7 + [10] * 3
+
+    generator = np.random.default_rng(11)
+    expected = [permutation.index_permutation(generator, length) for length in lengths]
+
+    generator = np.random.default_rng(11)
+    buffer = permutation.PermutationBuffer()
+    actual = [np.copy(buffer.next(generator, length, capacity)) for length in lengths]
+
+    for expected_permutation, actual_permutation in zip(expected, actual):
+        np.testing.assert_array_equal(actual_permutation, expected_permutation)
+
+    # After rewinding, the generator continues as if no permutation was drawn ahead.
+    buffer.rewind(generator)
+    np.testing.assert_array_equal(
+        permutation.index_permutation(generator, 10),
+        permutation.index_permutation(_advanced_generator(11, lengths), 10),
+    )
+
+
+def _advanced_generator(seed: int, lengths: typing.List[int]) -> np.random.Generator:
+    """
+    Creates a generator which has drawn the unbuffered permutations of the given lengths.
+
+    Args:
+        seed (int): Generator seed.
+        lengths (List[int]): Lengths of the drawn permutations.
+
+    Returns:
+        np.random.Generator: Advanced generator.
+    """
+    generator = np.random.default_rng(seed)
+    for length in lengths:
+        permutation.index_permutation(generator, length)
+    return generator
+
+
+@pytest.mark.parametrize("num_samples", [0, 1, 8, 999])
+def test_sample_indices_draws_distinct_indices(num_samples: int) -> None:
+    """
+    Sampled indices have to be distinct and within the range.
+    """
+    indices = permutation.sample_indices(np.random.default_rng(3), 1000, num_samples)
+
+    assert indices.dtype == permutation.INDEX_DTYPE
+    assert len(indices) == num_samples
+    assert len(np.unique(indices)) == num_samples
+    assert np.all((indices >= 0) & (indices < 1000))
+
+
+@pytest.mark.parametrize("num_samples", [-1, 1000, 2000])
+def test_sample_indices_falls_back_to_full_permutation(num_samples: int) -> None:
+    """
+    Samples not smaller than the population are the full permutation.
+    """
+    np.testing.assert_array_equal(
+        permutation.sample_indices(np.random.default_rng(3), 1000, num_samples),
+        permutation.index_permutation(np.random.default_rng(3), 1000),
+    )
+
+
+def test_frame_permutation_is_random_access() -> None:
+    """
+    Frame permutation is a pure function of (seed, node id, frame) and the streams differ across the key parts.
+    """
+    frames = [permutation.frame_permutation(5, 2, frame, 100) for frame in range(4)]
+
+    np.testing.assert_array_equal(permutation.frame_permutation(5, 2, 3, 100), frames[3])
+    assert not np.array_equal(frames[0], frames[1])
+    assert not np.array_equal(permutation.frame_permutation(5, 3, 0, 100), frames[0])
+    assert not np.array_equal(permutation.frame_permutation(6, 2, 0, 100), frames[0])
+    assert len(permutation.frame_permutation(5, 2, 0, 100, num_samples=8)) == 8
+
+
+@pytest.mark.parametrize(
+    "choices",
+    [
+        np.array([f"/World/asset_{i}" for i in range(50)], dtype=object),
+        np.arange(150, dtype=np.float64).reshape(50, 3),
+    ],
+)
+def test_output_buffers_match_payload_shuffle(choices: np.ndarray) -> None:
+    """
+    Reused buffers produce the payload shuffle sequence and are reallocated only when the choices change.
+    """
+    generator = np.random.default_rng(4)
+    expected = [np.copy(choices) for _ in range(3)]
+    for frame in expected:
+        generator.shuffle(frame, axis=0)
+
+    generator = np.random.default_rng(4)
+    buffers = permutation.OutputBuffers()
+    samples = [buffers.gather(choices, buffers.index_permutation(generator, len(choices))) for _ in range(3)]
+
+    assert samples[0] is samples[1] is samples[2]
+    np.testing.assert_array_equal(samples[2], expected[2])
+    assert buffers.gather(choices[:10], np.arange(10, dtype=permutation.INDEX_DTYPE)) is not samples[0]
+
+
+@pytest.mark.parametrize(
+    "group_size, group_keys",
+    [(4, None), (3, None), (0, [7, 1, 7, 2, 1, 1, 9, 2, 7, 7])],
+)
+def test_block_permutation_keeps_groups_adjacent(
+    group_size: int, group_keys: typing.Optional[typing.List[int]]
+) -> None:
+    """
+    Block shuffle permutes all indices and the elements of every group are contiguous in the output.
+    """
+    groups = permutation.group_ids(10, group_size, group_keys)
+    assert groups is not None
+    order = permutation.block_permutation(np.random.default_rng(3), groups)
+
+    assert order.dtype == permutation.INDEX_DTYPE
+    assert sorted(order) == list(range(10))
+    output_groups = groups[order]
+    # Every group appears as one run, i.e. the number of the runs equals the number of the groups.
+    assert np.count_nonzero(output_groups[1:] != output_groups[:-1]) + 1 == len(np.unique(groups))
+
+
+def test_group_ids_disabled_and_invalid() -> None:
+    """
+    Grouping is disabled for sizes less than 2 without keys and the keys have to match the number of elements.
+    """
+    assert permutation.group_ids(10, 1) is None
+    assert permutation.group_ids(10, 0, []) is None
+    with pytest.raises(ValueError):
+        permutation.group_ids(10, 0, [1, 2])
+
+
+def test_lookahead_generator_draws_upcoming_permutations() -> None:
+    """
+    The lookahead copy continues after the popped permutations and leaves the buffer and the generator untouched.
+    """
+    generator = np.random.default_rng(5)
+    buffer = permutation.PermutationBuffer()
+    popped = [np.copy(buffer.next(generator, 20, 4)) for _ in range(2)]
+
+    lookahead = buffer.lookahead_generator(generator)
+    upcoming = [permutation.index_permutation(lookahead, 20) for _ in range(3)]
+    assert all(np.array_equal(buffer.next(generator, 20, 4), expected) for expected in upcoming)
+
+    reference = np.random.default_rng(5)
+    for expected in popped + upcoming:
+        np.testing.assert_array_equal(permutation.index_permutation(reference, 20), expected)
+
+
+def test_random_key_permutations_match_single_draws() -> None:
+    """
+    Rows of the batched permutations are the permutations of every generator drawn one by one.
+    """
+    seeds = [3, 8, 11, 3]
+    batched = permutation.random_key_permutations([np.random.default_rng(seed) for seed in seeds], 50)
+
+    assert batched.shape == (4, 50) and batched.dtype == permutation.INDEX_DTYPE
+    for row, seed in zip(batched, seeds):
+        np.testing.assert_array_equal(row, permutation.random_key_permutation(np.random.default_rng(seed), 50))
+    assert sorted(batched[0]) == list(range(50))
+
+
+def test_weighted_permutation_follows_weights() -> None:
+    """
+    Heavier elements come first more often, zero weights are never sampled and the sample is the prefix of the order.
+    """
+    weights = permutation.check_weights([8, 1, 0, 1], 4)
+    generator = np.random.default_rng(5)
+    first = [permutation.weighted_permutation(generator, weights)[0] for _ in range(2000)]
+
+    # The first element is drawn with the probability proportional to its weight, i.e. 0.8 for the element 0.
+    assert 0.75 < first.count(0) / len(first) < 0.85
+    assert 2 not in first
+    order = permutation.weighted_permutation(np.random.default_rng(9), weights)
+    assert sorted(order) == [0, 1, 2, 3] and order[-1] == 2
+    sample = permutation.weighted_permutation(np.random.default_rng(9), weights, 2)
+    np.testing.assert_array_equal(sample, order[:2])
+    assert len(permutation.weighted_permutation(generator, weights, 0)) == 0
+
+
+@pytest.mark.parametrize("weights", [[1.0, 2.0], [1.0, -1.0, 1.0], [1.0, np.nan, 1.0], [0.0, 0.0, 0.0]])
+def test_check_weights_rejects_invalid_weights(weights: typing.List[float]) -> None:
+    """
+    Weights have to match the elements, be finite, non-negative and not all zero.
+    """
+    with pytest.raises(ValueError):
+        permutation.check_weights(weights, 3)
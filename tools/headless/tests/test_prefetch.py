@@ -0,0 +1,218 @@
+"""
+Tests of the lookahead asset prefetch run on the stand-in runtime against a directory of dummy asset files.
+"""
+import pathlib
+import threading
+import typing
+import numpy as np
+import pytest
+from ardagen_standin import evaluate
+from metron.ai.ardagen.ogn.nodes.OgnSampleShuffle import OgnSampleShuffle
+from metron.ai.ardagen.prefetch import ASSET_PREFETCHER, AssetPrefetcher, read_ahead
+from metron.ai.ardagen.schedule import plan_schedule
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+ASSET_SIZE = 1000
+
+
+@pytest.fixture(autouse=True)
+def _idle_prefetcher() -> typing.Iterator[None]:
+    """
+    Every test starts with an idle prefetcher, its loads are stopped after the test.
+    """
+    ASSET_PREFETCHER.configure()
+    ASSET_PREFETCHER.reset_stats()
+    yield
+    ASSET_PREFETCHER.shutdown()
+
+
+def _assets(directory: pathlib.Path, count: int) -> typing.List[str]:
+    """
+    Args:
+        directory (pathlib.Path): Directory of the assets.
+        count (int): Number of the assets.
+
+    Returns:
+        List[str]: Paths of dummy asset files of `ASSET_SIZE` bytes.
+    """
+    paths = []
+    for i in range(count):
+        path = directory / f"asset_{i}.usd"
+        path.write_bytes(bytes([i % 256]) * ASSET_SIZE)
+        paths.append(str(path))
+    return paths
+
+
+def _run(node: typing.Any, frames: int, output: str = "outputs:samples") -> typing.List[list]:
+    """
+    Evaluates the node and waits for the prefetch after every frame, as if the renderer took longer than the loads.
+
+    Args:
+        node (Any): Evaluated node.
+        frames (int): Number of the evaluations.
+        output (str): Collected output.
+
+    Returns:
+        List[list]: Output value of every evaluation.
+    """
+    outputs = []
+    for _ in range(frames):
+        assert evaluate(node)
+        outputs.append(np.copy(node.get_attribute(output).value).tolist())
+        ASSET_PREFETCHER.wait()
+    return outputs
+
+
+def test_prefetcher_hits_misses_and_release(tmp_path: pathlib.Path) -> None:
+    """
+    Loaded paths are hits, unscheduled ones misses, and released paths return their bytes to the budget.
+    """
+    paths = _assets(tmp_path, 4)
+    prefetcher = AssetPrefetcher(max_workers=2)
+
+    missing = str(tmp_path / "missing.usd")
+    scheduled = prefetcher.prefetch("/node", paths[:2] + [missing, paths[0]])
+    prefetcher.wait()
+    assert scheduled == [paths[0], paths[1], missing, paths[0]]
+    assert prefetcher.pending_bytes == 2 * ASSET_SIZE
+    prefetcher.use("/node", paths[:2] + [missing])
+    prefetcher.use("/other", paths[:1])
+    assert (prefetcher.hits, prefetcher.misses, prefetcher.hit_rate) == (2, 2, 0.5)
+
+    prefetcher.release("/node", scheduled)
+    stats = prefetcher.stats()
+    assert stats["loaded_bytes"] == 2 * ASSET_SIZE
+    assert stats["pending_bytes"] == 0 and len(prefetcher) == 0
+    prefetcher.shutdown()
+
+
+def test_prefetcher_respects_memory_budget(tmp_path: pathlib.Path) -> None:
+    """
+    Paths over the budget are not loaded until the scheduled paths are released.
+    """
+    paths = _assets(tmp_path, 4)
+    prefetcher = AssetPrefetcher(max_workers=1, memory_budget=int(2.5 * ASSET_SIZE))
+
+    scheduled = prefetcher.prefetch("/node", paths)
+    prefetcher.wait()
+    assert (prefetcher.budget_skips, prefetcher.pending_bytes) == (2, 2 * ASSET_SIZE)
+    prefetcher.use("/node", paths)
+    assert (prefetcher.hits, prefetcher.misses) == (2, 2)
+
+    prefetcher.release("/node", scheduled)
+    assert prefetcher.pending_bytes == 0
+    prefetcher.prefetch("/node", paths[2:])
+    prefetcher.wait()
+    assert (prefetcher.budget_skips, prefetcher.pending_bytes) == (2, 2 * ASSET_SIZE)
+    prefetcher.shutdown()
+
+
+def test_prefetcher_cancel_stops_pending_loads(tmp_path: pathlib.Path) -> None:
+    """
+    Cancelled loads stop, queued ones don't start, and the other owners are kept.
+    """
+    paths = _assets(tmp_path, 3)
+    started = threading.Event()
+    unblock = threading.Event()
+    loaded: typing.List[str] = []
+
+    def blocking_loader(path: str, is_cancelled: typing.Callable[[], bool]) -> int:
+        started.set()
+        unblock.wait(5)
+        if is_cancelled():
+            return 0
+        loaded.append(path)
+        return read_ahead(path, is_cancelled)
+
+    prefetcher = AssetPrefetcher(max_workers=1, loader=blocking_loader)
+    prefetcher.prefetch("/node", paths[:2])
+    prefetcher.prefetch("/other", paths[2:])
+    assert started.wait(5)
+
+    assert prefetcher.cancel("/node") == 2
+    assert prefetcher.pending_bytes == 0
+    unblock.set()
+    prefetcher.wait()
+    assert loaded == paths[2:]
+    assert prefetcher.pending_bytes == ASSET_SIZE
+    assert prefetcher.stats()["cancelled"] == 2
+    prefetcher.shutdown()
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        {},
+        {"batchSize": 3},
+        {"numSamples": 3},
+        {"randomAccess": True},
+        {"randomKeys": True, "numSamples": 5},
+        {"groupSize": 2},
+        {"weights": [float(i + 1) for i in range(12)], "numSamples": 4},
+    ],
+)
+def test_node_prefetches_upcoming_samples(
+    tmp_path: pathlib.Path, inputs: typing.Dict[str, typing.Any], shuffle_node: typing.Callable[..., typing.Any]
+) -> None:
+    """
+    Only the samples of the first frame miss, so the lookahead matches the outputs, which don't change. The full
+    permutations prefetch and record the uses of the leading samples of the next frame only.
+    """
+    paths = _assets(tmp_path, 12)
+    expected = _run(shuffle_node(paths, "token", seed=3, **inputs), 6)
+    ASSET_PREFETCHER.reset_stats()
+    node = shuffle_node(paths, "token", seed=3, prefetchFrames=2, **inputs)
+
+    assert _run(node, 6) == expected
+    is_full = len(expected[0]) == len(paths)
+    assert ASSET_PREFETCHER.misses == (2 if is_full else len(expected[0]))
+    assert ASSET_PREFETCHER.hit_rate == pytest.approx(5 / 6)
+    assert len(ASSET_PREFETCHER) <= (2 if is_full else 2 * len(expected[0]))
+    assert ASSET_PREFETCHER.pending_bytes > 0
+    assert ASSET_PREFETCHER.loaded_bytes > 0
+
+
+def test_node_prefetches_epoch_elements(tmp_path: pathlib.Path, shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    The epoch mode prefetches the upcoming elements across the epoch boundaries.
+    """
+    paths = _assets(tmp_path, 5)
+    node = shuffle_node(paths, "token", seed=2, epochMode=True, prefetchFrames=3)
+
+    elements = _run(node, 12, "outputs:element")
+    assert sorted(elements[:5]) == sorted(paths)
+    assert (ASSET_PREFETCHER.hits, ASSET_PREFETCHER.misses) == (11, 1)
+
+
+def test_node_prefetch_stops_at_schedule_end(
+    tmp_path: pathlib.Path, shuffle_node: typing.Callable[..., typing.Any]
+) -> None:
+    """
+    Frames beyond the schedule are not prefetched, the leading 5 samples of the next frame are.
+    """
+    paths = _assets(tmp_path, 6)
+    manifest_path = plan_schedule(str(tmp_path / "schedule"), 6, seed=4, node_id=0, frames=(0, 3))
+    node = shuffle_node(paths, "token", seed=4, scheduleFile=manifest_path, prefetchFrames=5)
+
+    _run(node, 3)
+    assert (ASSET_PREFETCHER.hits, ASSET_PREFETCHER.misses) == (10, 5)
+    assert len(ASSET_PREFETCHER) == 0
+
+
+def test_seed_change_cancels_prefetch(tmp_path: pathlib.Path, shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Pending reads of the old seed are cancelled and the lookahead restarts from the new seed. Releasing the node
+    cancels its reads.
+    """
+    paths = _assets(tmp_path, 8)
+    node = shuffle_node(paths, "token", seed=1, numSamples=3, prefetchFrames=2)
+    _run(node, 2)
+
+    node.get_attribute("inputs:seed").set(5)
+    _run(node, 3)
+    assert ASSET_PREFETCHER.cancelled > 0
+    assert ASSET_PREFETCHER.misses == 2 * 3
+    assert ASSET_PREFETCHER.hits == 3 * 3
+
+    OgnSampleShuffle.release(node)
+    assert len(ASSET_PREFETCHER) == 0
@@ -0,0 +1,75 @@
+"""
+Tests of the per-node compute statistics.
+"""
+import csv
+import json
+import pathlib
+import typing
+import pytest
+from ardagen_standin import create_node, evaluate
+from metron.ai.ardagen import profiling
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+
+
+@pytest.fixture(autouse=True)
+def _reset_profiler() -> typing.Iterator[None]:
+    """
+    Every test starts with an empty profiler, the profiling is disabled after the test.
+    """
+    profiling.PROFILER.reset()
+    yield
+    profiling.set_profiling_enabled(False)
+
+
+def test_disabled_profiling_records_nothing(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Nothing is collected until the profiling is enabled.
+    """
+    assert profiling.get_profiler() is None
+    assert evaluate(shuffle_node(list(range(10)), "int", seed=1))
+    assert len(profiling.PROFILER) == 0
+
+
+def test_node_statistics(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Calls, copied bytes, RNG re-initializations and failures are recorded per node.
+    """
+    profiling.set_profiling_enabled(True)
+    node = shuffle_node(list(range(100)), "int", seed=1)
+    for seed in (1, 1, 2):
+        node.get_attribute("inputs:seed").set(seed)
+        assert evaluate(node)
+    empty_node = shuffle_node([], "int")
+    assert not evaluate(empty_node)
+    unresolved_node = create_node(SHUFFLE_NODE_TYPE)
+    assert not evaluate(unresolved_node)
+
+    snapshot = profiling.PROFILER.snapshot()
+    stats = snapshot[node.get_prim_path()]
+    assert stats["calls"] == 3
+    assert stats["rng_reinits"] == 2
+    assert stats["bytes_copied"] == 3 * 100 * 4
+    assert sum(stats["latency_histogram"].values()) == 3
+    assert snapshot[empty_node.get_prim_path()]["failures"] == {profiling.FAILURE_EMPTY_CHOICES: 1}
+    assert snapshot[unresolved_node.get_prim_path()]["failures"] == {"unresolved:inputs:choices": 1}
+
+
+def test_export(tmp_path: pathlib.Path) -> None:
+    """
+    JSON export holds the snapshot, CSV export a row per node with a column per failure reason.
+    """
+    profiler = profiling.ComputeProfiler()
+    profiler.record_compute("/Graph/a", 2e-3)
+    profiler.record_failure("/Graph/b", profiling.FAILURE_EXCEPTION)
+
+    profiler.export_json(str(tmp_path / "stats.json"))
+    profiler.export_csv(str(tmp_path / "stats.csv"))
+
+    with open(tmp_path / "stats.json", "r", encoding="utf-8") as json_file:
+        assert json.load(json_file) == json.loads(json.dumps(profiler.snapshot()))
+    with open(tmp_path / "stats.csv", "r", encoding="utf-8", newline="") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert [row["node"] for row in rows] == ["/Graph/a", "/Graph/b"]
+    assert rows[0]["latency_le_3000us"] == "1"
+    assert rows[1]["failures_exception"] == "1"
@@ -0,0 +1,90 @@
+"""
+Tests of the extension-level RNG pool.
+"""
+import typing
+import numpy as np
+import pytest
+from ardagen_standin import RUNTIME, evaluate
+from metron.ai.ardagen.rng_pool import RNG_POOL, RNGPool
+
+
+def test_substreams_depend_only_on_seed_and_node_id() -> None:
+    """
+    The draws don't depend on the acquisition order and differ between the node ids.
+    """
+    pool = RNGPool()
+    first = [pool.acquire(f"/node_{node_id}", 5, node_id).generator.random(4) for node_id in range(3)]
+    other_pool = RNGPool()
+    second = [other_pool.acquire(f"/node_{node_id}", 5, node_id).generator.random(4) for node_id in reversed(range(3))]
+
+    np.testing.assert_array_equal(first, second[::-1])
+    assert not np.array_equal(first[0], first[1])
+    spawned = np.random.Generator(np.random.PCG64(np.random.SeedSequence(5).spawn(2)[1]))
+    np.testing.assert_array_equal(spawned.random(4), first[1])
+
+
+def test_generator_is_lazy_and_released() -> None:
+    """
+    The generator is built on the first access and the substream is reclaimed on release.
+    """
+    pool = RNGPool()
+    stream = pool.acquire("/node", 1, 0)
+    assert stream._generator is None  # pylint: disable=protected-access
+    generator = stream.generator
+    assert stream.generator is generator
+    assert len(pool) == 1
+
+    pool.release("/node")
+    assert len(pool) == 0
+
+
+def test_negative_seed_uses_global_seed() -> None:
+    """
+    Nodes with a negative seed draw from the global seed substreams.
+    """
+    pool = RNGPool()
+    pool.set_global_seed(9)
+    np.testing.assert_array_equal(
+        pool.acquire("/a", -1, 2).generator.random(3), pool.acquire("/b", 9, 2).generator.random(3)
+    )
+
+
+def test_node_substream_is_released_with_node(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    The shuffle node acquires its substream on the first compute and releases it on release.
+    """
+    node = shuffle_node([1, 2, 3], "int", seed=3)
+
+    assert len(RNG_POOL) == 0
+    assert evaluate(node)
+    assert len(RNG_POOL) == 1
+    RUNTIME.node_classes[node.type_name].release(node)
+    assert len(RNG_POOL) == 0
+
+
+@pytest.mark.parametrize("inputs", [{}, {"randomAccess": True}])
+def test_negative_seed_nodes_follow_global_seed(
+    shuffle_node: typing.Callable[..., typing.Any], inputs: typing.Dict[str, typing.Any]
+) -> None:
+    """
+    Nodes with a negative seed draw like the nodes seeded with the global seed, also after the global seed changes.
+    """
+    global_node = shuffle_node(list(range(20)), "int", seed=-1, **inputs)
+    RNG_POOL.set_global_seed(7)
+    outputs = []
+    for _ in range(2):
+        assert evaluate(global_node)
+        outputs.append(np.copy(global_node.get_attribute("outputs:samples").value))
+    RNG_POOL.set_global_seed(8)
+    assert evaluate(global_node)
+    outputs.append(np.copy(global_node.get_attribute("outputs:samples").value))
+
+    expected = []
+    for seed, frames in [(7, 2), (8, 1)]:
+        seeded_node = shuffle_node(list(range(20)), "int", seed=seed, **inputs)
+        for _ in range(frames):
+            assert evaluate(seeded_node)
+            expected.append(np.copy(seeded_node.get_attribute("outputs:samples").value))
+    # The new global seed restarts the node like a change of its seed.
+    for samples, expected_samples in zip(outputs, expected):
+        np.testing.assert_array_equal(samples, expected_samples)
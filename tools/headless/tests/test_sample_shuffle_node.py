@@ -0,0 +1,410 @@
+"""
+Tests of the SampleShuffle node compute run on the stand-in runtime.
+"""
+import pathlib
+import tracemalloc
+import typing
+import numpy as np
+import pytest
+from ardagen_standin import RUNTIME, Controller, create_node, evaluate
+from metron.ai.ardagen.batch_evaluator import BATCH_EVALUATOR
+from metron.ai.ardagen.path_table import PATH_TABLE
+from metron.ai.ardagen.schedule import plan_schedule
+
+SHUFFLE_NODE_TYPE = "metron.ai.ardagen.SampleShuffle"
+
+
+def _frames(node: typing.Any, count: int, output: str = "outputs:samples") -> typing.List[np.ndarray]:
+    """
+    Evaluates the node and collects its output.
+
+    Args:
+        node (Any): Evaluated node.
+        count (int): Number of the evaluations.
+        output (str): Collected output.
+
+    Returns:
+        List[np.ndarray]: Output value of every evaluation.
+    """
+    frames = []
+    for _ in range(count):
+        assert evaluate(node)
+        frames.append(np.copy(node.get_attribute(output).value))
+    return frames
+
+
+def test_samples_are_permutations_of_choices(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Every frame outputs all the choices and the type of the samples is resolved from the choices.
+    """
+    choices = [f"/World/asset_{i}" for i in range(20)]
+    node = shuffle_node(choices, "token", seed=5)
+
+    for samples in _frames(node, 3):
+        assert sorted(samples) == sorted(choices)
+    assert node.get_attribute("outputs:samples").get_resolved_type().base_type == "token"
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [{"indexMode": True}, {"batchSize": 4}, {"indexMode": True, "batchSize": 3}],
+)
+def test_buffered_modes_match_payload_shuffle(
+    inputs: typing.Dict[str, typing.Any], shuffle_node: typing.Callable[..., typing.Any]
+) -> None:
+    """
+    Index mode and batched permutations output the same sequence as the payload shuffle.
+    """
+    choices = [(float(i), 0.0, 1.0) for i in range(30)]
+    expected = _frames(shuffle_node(choices, "double3", seed=11), 6)
+    node = shuffle_node(choices, "double3", seed=11, **inputs)
+    node.get_attribute("outputs:samples").connect(create_node(SHUFFLE_NODE_TYPE).get_attribute("inputs:choices"), True)
+
+    for samples, expected_samples in zip(_frames(node, 6), expected):
+        np.testing.assert_array_equal(samples, expected_samples)
+
+
+def test_index_mode_skips_gather_without_consumer(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Without a samples consumer only the permutation is output.
+    """
+    node = shuffle_node(list(range(10)), "int", seed=2, indexMode=True)
+
+    permutation = _frames(node, 1, "outputs:permutation")[0]
+
+    assert sorted(permutation) == list(range(10))
+    assert node.get_attribute("outputs:samples").value is None
+
+
+def test_seed_change_restarts_sequence(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Setting the seed back reproduces the sequence of the seed from its start.
+    """
+    node = shuffle_node(list(range(50)), "int", seed=1)
+    first = _frames(node, 2)
+
+    node.get_attribute("inputs:seed").set(2)
+    assert not np.array_equal(_frames(node, 1)[0], first[0])
+    node.get_attribute("inputs:seed").set(1)
+    for samples, expected_samples in zip(_frames(node, 2), first):
+        np.testing.assert_array_equal(samples, expected_samples)
+
+
+def test_num_samples_draws_without_replacement(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Only the requested number of the choices is output, each of them at most once.
+    """
+    node = shuffle_node(list(range(20)), "int", seed=3, numSamples=4)
+
+    samples = _frames(node, 1)[0]
+
+    assert len(samples) == 4
+    assert len(set(samples)) == 4
+
+
+def test_random_access_frames_are_reproducible(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Frame permutation depends only on the seed and the frame index.
+    """
+    node = shuffle_node(list(range(40)), "int", seed=9, randomAccess=True)
+    sequential = _frames(node, 4)
+
+    node.get_attribute("inputs:frame").set(2)
+    np.testing.assert_array_equal(_frames(node, 1)[0], sequential[2])
+
+
+def test_schedule_file_mode(tmp_path: pathlib.Path, shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Planned rows are output and a schedule planned for a different length or seed fails the compute.
+    """
+    manifest_path = plan_schedule(str(tmp_path), 12, seed=4, node_id=0, frames=(0, 3))
+    node = shuffle_node(list(range(12)), "int", seed=4, scheduleFile=manifest_path)
+
+    assert all(sorted(samples) == list(range(12)) for samples in _frames(node, 3))
+
+    short_node = shuffle_node(list(range(5)), "int", seed=4, scheduleFile=manifest_path)
+    assert not evaluate(short_node)
+    assert "planned for 12 choices" in short_node.errors[-1]
+
+    stale_node = shuffle_node(list(range(12)), "int", seed=5, scheduleFile=manifest_path)
+    assert not evaluate(stale_node)
+    assert "planned for seed 4" in stale_node.errors[-1]
+
+
+def test_mode_precedence(tmp_path: pathlib.Path, shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    The schedule takes precedence over the random access, the weights, the groups, the random keys, the number of the
+    samples and the batch size in this order. The random access draws the weighted and block permutations too.
+    """
+    manifest_path = plan_schedule(str(tmp_path), 12, seed=4, node_id=0, frames=(0, 3), num_samples=4)
+    modes: typing.List[typing.Dict[str, typing.Any]] = [
+        {"scheduleFile": manifest_path},
+        {"randomAccess": True},
+        {"weights": [float(i + 1) for i in range(12)]},
+        {"groupSize": 3},
+        {"randomKeys": True},
+        {"numSamples": 4},
+        {"batchSize": 3},
+    ]
+    previous = None
+    for level, mode in enumerate(modes):
+        combined: typing.Dict[str, typing.Any] = {}
+        for lower_mode in modes[level:]:
+            combined.update(lower_mode)
+        # The number of the samples truncates the outputs of the modes taking precedence over it and the random access
+        # draws the weighted permutations from the frame generators.
+        alone = dict(mode, numSamples=4) if "batchSize" not in mode else mode
+        if "randomAccess" in mode:
+            alone["weights"] = modes[2]["weights"]
+        outputs = _frames(shuffle_node(list(range(12)), "int", seed=4, **combined), 3)
+
+        for samples, expected in zip(outputs, _frames(shuffle_node(list(range(12)), "int", seed=4, **alone), 3)):
+            np.testing.assert_array_equal(samples, expected)
+        if previous is not None:
+            assert any(not np.array_equal(lhs, rhs) for lhs, rhs in zip(previous, outputs))
+        previous = outputs
+
+
+def test_empty_and_unresolved_choices_fail(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    The compute is skipped for unconnected choices and fails for empty ones.
+    """
+    assert not evaluate(create_node(SHUFFLE_NODE_TYPE))
+    assert not evaluate(shuffle_node([], "int"))
+
+
+def test_resolved_types_are_checked_after_connection_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    The node checks the resolved types of its extended attributes only when a connection changed since the last check.
+    """
+    node_class = RUNTIME.node_classes[SHUFFLE_NODE_TYPE]
+    unresolved_attribute = node_class._unresolved_attribute  # pylint: disable=protected-access
+    checked = []
+
+    def counted_unresolved_attribute(node_db: typing.Any) -> typing.Optional[str]:
+        checked.append(node_db.node)
+        return unresolved_attribute(node_db)
+
+    monkeypatch.setattr(node_class, "_unresolved_attribute", staticmethod(counted_unresolved_attribute))
+    node = create_node(SHUFFLE_NODE_TYPE, seed=1)
+    assert not evaluate(node) and not evaluate(node)
+    assert len(checked) == 1 and node.errors[-1].startswith("Required extended attribute inputs:choices")
+
+    array_node = create_node("omni.replicator.core.OgnArray", arrayType="int")
+    array_node.get_attribute("inputs:array").set(list(range(5)))
+    array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+    assert evaluate(node) and evaluate(node) and evaluate(node)
+    assert len(checked) == 2
+
+    array_node.get_attribute("inputs:array").disconnect(node.get_attribute("inputs:choices"), True)
+    evaluate(node)
+    assert len(checked) == 3
+
+
+@pytest.mark.parametrize(
+    "element_type, choices",
+    [
+        ("token", [f"/World/asset_{i}" for i in range(100_000)]),
+        ("double3", [(float(i), 0.0, 1.0) for i in range(100_000)]),
+    ],
+)
+@pytest.mark.parametrize("inputs", [{}, {"indexMode": True, "batchSize": 4}])
+def test_steady_state_frames_do_not_allocate(
+    element_type: str,
+    choices: typing.List[typing.Any],
+    inputs: typing.Dict[str, typing.Any],
+    shuffle_node: typing.Callable[..., typing.Any],
+) -> None:
+    """
+    Once the output buffers are allocated, frames allocate only a constant amount of memory.
+    """
+    node = shuffle_node(choices, element_type, seed=1, **inputs)
+    node.get_attribute("outputs:samples").connect(create_node(SHUFFLE_NODE_TYPE).get_attribute("inputs:choices"), True)
+    _frames(node, 4)
+
+    tracemalloc.start()
+    try:
+        for _ in range(4):
+            assert evaluate(node), node.errors
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # A single index array of the choices would be 800 kB.
+    assert peak < 64 * 1024
+
+
+def test_epoch_mode_visits_every_choice_once_per_epoch(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Every epoch is a permutation of the choices, equal to the frame permutation of the default mode.
+    """
+    choices = [(float(i), 0.0, 1.0) for i in range(7)]
+    expected = _frames(shuffle_node(choices, "double3", seed=3), 3)
+    node = shuffle_node(choices, "double3", seed=3, epochMode=True)
+
+    for epoch, expected_samples in enumerate(expected):
+        elements = []
+        for _ in range(len(choices)):
+            assert evaluate(node), node.errors
+            assert node.get_attribute("outputs:epoch").value == epoch
+            index = node.get_attribute("outputs:elementIndex").value
+            np.testing.assert_array_equal(node.get_attribute("outputs:element").value, choices[index])
+            elements.append(choices[index])
+        np.testing.assert_array_equal(elements, expected_samples)
+    assert node.get_attribute("outputs:element").get_resolved_type().array_depth == 0
+
+
+def test_epoch_mode_restarts_on_seed_change(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Seed change starts the first epoch of the new seed.
+    """
+    node = shuffle_node(list(range(5)), "int", seed=1, epochMode=True)
+    indices = _frames(node, 7, "outputs:elementIndex")
+
+    node.get_attribute("inputs:seed").set(2)
+    _frames(node, 1, "outputs:elementIndex")
+    node.get_attribute("inputs:seed").set(1)
+
+    assert _frames(node, 7, "outputs:elementIndex") == indices
+    assert node.get_attribute("outputs:epoch").value == 1
+
+
+@pytest.mark.parametrize(
+    "inputs, output",
+    [
+        ({}, "outputs:samples"),
+        ({"epochMode": True}, "outputs:element"),
+        ({"randomKeys": True}, "outputs:samples"),
+    ],
+)
+def test_token_ids_follow_the_choices(
+    inputs: typing.Dict[str, typing.Any], output: str, shuffle_node: typing.Callable[..., typing.Any]
+) -> None:
+    """
+    Token ids are shuffled as integers and the samples are the tokens of the current ids, whether the choices are set
+    to a new array or changed in place.
+    """
+
+    def tokens(count: int) -> typing.List[str]:
+        values: typing.List[str] = []
+        for _ in range(count):
+            BATCH_EVALUATOR.evaluate()
+            assert evaluate(node), node.errors
+            values.extend(np.atleast_1d(node.get_attribute(output).value).tolist())
+        return values
+
+    node = shuffle_node(
+        list(PATH_TABLE.intern(["/World/a", "/World/b", "/World/c"])), "uint64", seed=2, tokenIds=True, **inputs
+    )
+    assert node.get_attribute(output).get_resolved_type().base_type == "token"
+    assert set(tokens(3)) == {"/World/a", "/World/b", "/World/c"}
+
+    array = node.get_attribute("inputs:choices").upstream[0].get_node().get_attribute("inputs:array")
+    array.set(PATH_TABLE.intern(["/World/d", "/World/e", "/World/f"]))
+    assert set(tokens(3)) == {"/World/d", "/World/e", "/World/f"}
+
+    array.value[:] = PATH_TABLE.intern(["/World/g", "/World/h", "/World/i"])
+    assert set(tokens(3)) == {"/World/g", "/World/h", "/World/i"}
+
+
+@pytest.mark.parametrize(
+    "inputs",
+    [
+        {},
+        {"numSamples": 6},
+        {"randomAccess": True},
+        {"epochMode": True},
+    ],
+)
+def test_block_shuffle_keeps_groups_adjacent(
+    inputs: typing.Dict[str, typing.Any], shuffle_node: typing.Callable[..., typing.Any]
+) -> None:
+    """
+    Block shuffle outputs the choices of a group consecutively in every sampling mode.
+    """
+    choices = list(range(12))
+    node = shuffle_node(choices, "int", seed=4, groupSize=3, **inputs)
+
+    if inputs.get("epochMode"):
+        frames = [np.array(_frames(node, len(choices), "outputs:elementIndex"))]
+    else:
+        frames = _frames(node, 2)
+    for samples in frames:
+        groups = np.asarray(samples) // 3
+        assert np.count_nonzero(groups[1:] != groups[:-1]) + 1 == len(np.unique(groups))
+        assert len(samples) == inputs.get("numSamples", len(choices))
+    assert node.internal_state.groups is not None
+
+
+def test_block_shuffle_group_keys(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Group keys take precedence over the group size and the groups are recomputed when the keys change.
+    """
+    keys = [0, 1, 0, 1, 2, 2]
+    node = shuffle_node(list(range(6)), "int", seed=9, groupSize=6, groupKeys=keys)
+
+    samples = _frames(node, 1)[0]
+    groups = np.asarray(keys)[samples]
+    assert np.count_nonzero(groups[1:] != groups[:-1]) == 2
+
+    node.get_attribute("inputs:groupKeys").set([0, 1, 2, 3, 4, 5])
+    _frames(node, 1)
+    np.testing.assert_array_equal(node.internal_state.groups, np.arange(6))
+
+
+def test_node_id_is_kept_in_state(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    The node id is read on the first draw and kept in the internal state, the random access frames use it.
+    """
+    node = shuffle_node(list(range(20)), "int", seed=4, randomAccess=True)
+    Controller.create_attribute(node, "inputs:nodeId", "int", "input").set(7)
+    _frames(node, 2)
+    assert node.internal_state.node_id == 7
+
+
+@pytest.mark.parametrize("inputs", [{}, {"randomAccess": True}, {"randomKeys": True}])
+def test_weighted_shuffle_samples_by_weights(
+    inputs: typing.Dict[str, typing.Any], shuffle_node: typing.Callable[..., typing.Any]
+) -> None:
+    """
+    Weighted node draws distinct samples, never the zero weight choices, and the heavy choice leads most frames.
+    """
+    choices = [f"/World/asset_{i}" for i in range(5)]
+    node = shuffle_node(choices, "token", seed=2, numSamples=2, weights=[20.0, 1.0, 1.0, 0.0, 1.0], **inputs)
+    frames = _frames(node, 200)
+
+    assert all(len(set(samples)) == 2 and choices[3] not in samples for samples in frames)
+    assert sum(samples[0] == choices[0] for samples in frames) > 150
+
+
+def test_weighted_epoch_and_invalid_weights(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    Weighted epochs visit every choice once, weights not matching the choices fail the compute.
+    """
+    node = shuffle_node(list(range(4)), "int", seed=3, epochMode=True, weights=[1.0, 1.0, 5.0, 1.0])
+    indices = [int(index) for index in _frames(node, 8, "outputs:elementIndex")]
+    assert sorted(indices[:4]) == sorted(indices[4:]) == [0, 1, 2, 3]
+
+    invalid_node = shuffle_node(list(range(4)), "int", seed=3, weights=[1.0, 1.0])
+    assert not evaluate(invalid_node)
+    assert invalid_node.errors
+
+
+def test_aligned_node_draws_with_node_id(shuffle_node: typing.Callable[..., typing.Any]) -> None:
+    """
+    The aligned node draws the permutation of the SampleShuffle node with the same seed and node id.
+    """
+    permutations = []
+    for node_id in (0, 3):
+        node = create_node("metron.ai.ardagen.SampleShuffleAligned", seed=6)
+        Controller.create_attribute(node, "inputs:nodeId", "int", "input").set(node_id)
+        array_node = create_node("omni.replicator.core.OgnArray", arrayType="int")
+        array_node.get_attribute("inputs:array").set(list(range(20)))
+        array_node.get_attribute("inputs:array").connect(node.get_attribute("inputs:choices"), True)
+        reference_node = shuffle_node(list(range(20)), "int", seed=6, indexMode=True)
+        Controller.create_attribute(reference_node, "inputs:nodeId", "int", "input").set(node_id)
+
+        permutations.append(_frames(node, 2, "outputs:permutation"))
+        for permutation, expected in zip(permutations[-1], _frames(reference_node, 2, "outputs:permutation")):
+            np.testing.assert_array_equal(permutation, expected)
+    assert not np.array_equal(permutations[0][0], permutations[1][0])
@@ -0,0 +1,49 @@
+"""
+Tests of the offline permutation schedule planner.
+"""
+import pathlib
+import numpy as np
+import pytest
+from metron.ai.ardagen import schedule
+from metron.ai.ardagen.permutation import frame_permutation
+
+
+@pytest.mark.parametrize("num_samples", [-1, 3])
+def test_schedule_rows_match_random_access_permutations(tmp_path: pathlib.Path, num_samples: int) -> None:
+    """
+    Schedule rows have to be bit-exact with the random access mode of the node.
+    """
+    manifest_path = schedule.plan_schedule(
+        str(tmp_path), 20, seed=9, node_id=4, frames=(10, 47), num_shards=4, num_samples=num_samples
+    )
+    planned = schedule.Schedule(manifest_path)
+
+    for frame in range(10, 47):
+        np.testing.assert_array_equal(planned.row(frame), frame_permutation(9, 4, frame, 20, num_samples))
+    with pytest.raises(IndexError):
+        planned.row(47)
+    with pytest.raises(IndexError):
+        planned.row(9)
+
+
+def test_shard_frame_ranges_cover_the_range() -> None:
+    """
+    Shards have to be contiguous and cover the whole frame range.
+    """
+    ranges = schedule.shard_frame_ranges(0, 10, 3)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == 10
+    assert all(prev[1] == curr[0] for prev, curr in zip(ranges, ranges[1:]))
+
+
+def test_schedule_check_rejects_other_nodes(tmp_path: pathlib.Path) -> None:
+    """
+    A schedule planned for other choices, seed, node id or number of samples is rejected.
+    """
+    planned = schedule.Schedule(schedule.plan_schedule(str(tmp_path), 20, seed=9, node_id=4, frames=(0, 2)))
+
+    planned.check(20, 9, 4)
+    planned.check(20, 9, 4, num_samples=20)
+    for args in [(21, 9, 4, -1), (20, 8, 4, -1), (20, 9, 5, -1), (20, 9, 4, 3)]:
+        with pytest.raises(ValueError):
+            planned.check(*args)
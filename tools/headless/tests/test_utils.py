@@ -0,0 +1,71 @@
+"""
+Tests of the extension utilities.
+"""
+import typing
+import numpy as np
+import pytest
+from metron.ai.ardagen import utils
+
+LISTS = [
+    [1, 2, 3],
+    [1, 2.0, 3],
+    [1.0, 2.0],
+    [True, False],
+    ["a", "b"],
+    [(1, 2, 3), (4, 5, 6)],
+    [(1.0, 2, 3), (4, 5.0, 6)],
+    [[1.0, 2.0, 3.0], (4.0, 5.0, 6.0)],
+    [(True, False), (False, False)],
+    [("a", "b"), ("c", "d")],
+    [(1, 2), 3],
+    [1, "a"],
+    [True, 1],
+    [1.0, True],
+    [(1, 2), ("a", "b")],
+    [None, None],
+    [np.float64(1.0), 2.0],
+]
+
+
+def _data_type_or_error(func: typing.Callable[[typing.Any], typing.Any], data_list: typing.Any) -> typing.Any:
+    """
+    Returns the data type or the type of the raised error.
+
+    Args:
+        func (Callable[[Any], Any]): Data type inference function.
+        data_list (Any): Inferred data.
+
+    Returns:
+        Any: Data type name or error type.
+    """
+    try:
+        return func(data_list)
+    except ValueError as error:
+        return type(error)
+
+
+@pytest.mark.parametrize("data_list", LISTS)
+def test_get_data_type_matches_per_element_check(data_list: typing.List[typing.Any]) -> None:
+    """
+    The fast inference must keep the results and the error semantics of the per-element check.
+    """
+    assert _data_type_or_error(utils.get_data_type, data_list) == _data_type_or_error(
+        utils._get_data_type_by_element, data_list  # pylint: disable=protected-access
+    )
+
+
+@pytest.mark.parametrize(
+    "data_array, expected",
+    [
+        (np.arange(3), "int"),
+        (np.ones((4, 3)), "double3"),
+        (np.array([True, False]), "bool"),
+        (np.array(["a", "b"]), "token"),
+        (np.array(["a", "b"], dtype=object), "token"),
+    ],
+)
+def test_get_data_type_of_numpy_arrays(data_array: np.ndarray, expected: str) -> None:
+    """
+    NumPy arrays are resolved from dtype and shape.
+    """
+    assert utils.get_data_type(data_array) == expected
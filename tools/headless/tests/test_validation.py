@@ -0,0 +1,38 @@
+"""
+Tests of the distribution validation levels.
+"""
+import typing
+import pytest
+from metron.ai.ardagen import validation
+
+
+def test_validation_levels_check_expected_elements() -> None:
+    """
+    Each level checks only its share of the elements.
+    """
+    choices: typing.List[typing.Any] = ["a"] * 5000
+    choices[1] = 1
+
+    with pytest.raises(ValueError):
+        validation.infer_choices_data_type(choices, "full")
+    assert validation.infer_choices_data_type(choices, "sampled") == "token"
+    assert validation.infer_choices_data_type(choices, "first_element") == "token"
+    assert validation.infer_choices_data_type(choices, "off") == "token"
+
+    choices[-1] = 1
+    with pytest.raises(ValueError):
+        validation.infer_choices_data_type(choices, "sampled")
+
+
+def test_validation_level_resolution() -> None:
+    """
+    Call level overrides the extension-wide level and unknown levels are rejected.
+    """
+    validation.set_validation_level("sampled")
+    try:
+        assert validation.resolve_validation_level(None) == "sampled"
+        assert validation.resolve_validation_level("off") == "off"
+        with pytest.raises(ValueError):
+            validation.resolve_validation_level("partial")
+    finally:
+        validation.set_validation_level("full")
@@ -0,0 +1,19 @@
+"""
+Plans a SampleShuffle permutation schedule without a Kit application.
+
+Run: `python tools/scripts/plan_shuffle_schedule.py --help`
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "headless"))
+
+from ardagen_headless import load_ardagen  # noqa: E402 pylint: disable=wrong-import-position
+
+if __name__ == "__main__":
+    load_ardagen()
+
+    from metron.ai.ardagen.schedule import main  # pylint: disable=import-outside-toplevel
+
+    main()
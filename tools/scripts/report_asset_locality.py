@@ -0,0 +1,19 @@
+"""
+Reports the asset working set per window of the SampleShuffle modes without a Kit application.
+
+Run: `python tools/scripts/report_asset_locality.py --help`
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "headless"))
+
+from ardagen_headless import load_ardagen  # noqa: E402 pylint: disable=wrong-import-position
+
+if __name__ == "__main__":
+    load_ardagen()
+
+    from metron.ai.ardagen.locality import main  # pylint: disable=import-outside-toplevel
+
+    main()